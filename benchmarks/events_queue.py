@@ -0,0 +1,68 @@
+"""
+Compares ordering of initial sweep events by heap and by presorting.
+
+Usage:
+    python -m benchmarks.events_queue [edges_count ...]
+"""
+import sys
+from functools import partial
+from random import Random
+from timeit import repeat
+from typing import (Any,
+                    Callable,
+                    List,
+                    Sequence)
+
+from ground.base import get_context
+from prioq.base import PriorityQueue
+
+from clipping.core.event import LeftHoleyEvent
+from clipping.core.events_queue import BinaryEventsQueueKey
+from clipping.core.presorting import PresortedQueue
+
+context = get_context()
+Point = context.point_cls
+
+
+def to_events(count: int, seed: int = 0) -> List[LeftHoleyEvent]:
+    random = Random(seed)
+    result = []
+    for index in range(count):
+        start = Point(random.uniform(0., 1000.), random.uniform(0., 1000.))
+        end = Point(start.x + random.uniform(0., 10.),
+                    start.y + random.uniform(-10., 10.))
+        event = LeftHoleyEvent.from_endpoints((start, end), bool(index % 2))
+        result.append(event)
+        result.append(event.opposite)
+    return result
+
+
+def drain(queue_factory: Callable[..., Any],
+          events: Sequence[LeftHoleyEvent]) -> None:
+    queue = queue_factory(key=partial(BinaryEventsQueueKey,
+                                      context.angle_orientation))
+    for event in events:
+        queue.push(event)
+    while queue:
+        queue.pop()
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>12} {:>12} {:>8}'.format('count', 'heap, s',
+                                             'presorted, s', 'speedup'))
+    for count in counts:
+        events = to_events(count)
+        heap_time = min(repeat(lambda: drain(PriorityQueue, events),
+                               number=1,
+                               repeat=3))
+        presorted_time = min(repeat(lambda: drain(PresortedQueue, events),
+                                    number=1,
+                                    repeat=3))
+        print('{:>8} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, heap_time, presorted_time,
+                      heap_time / presorted_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]]
+         or [1000, 10000, 100000])
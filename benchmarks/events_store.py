@@ -0,0 +1,105 @@
+"""
+Compares peak memory & time of area measures
+computed with events objects and with compact events store.
+
+Operations which build results keep events as objects,
+so for seeded overlay workloads peak memory & time of intersection
+are reported as well to show which share of them the store can save.
+
+Usage:
+    python -m benchmarks.events_store [vertices_count ...]
+"""
+import sys
+import tracemalloc
+from math import (cos,
+                  pi,
+                  sin)
+from timeit import repeat
+from typing import (Callable,
+                    Sequence,
+                    Tuple)
+
+from ground.base import get_context
+
+from benchmarks.workloads import WORKLOADS
+from clipping.measures import (difference_area,
+                               intersection_area,
+                               symmetric_difference_area,
+                               union_area)
+from clipping.planar import intersect_multipolygons
+
+context = get_context()
+Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                         context.multipolygon_cls,
+                                         context.point_cls,
+                                         context.polygon_cls)
+
+
+def to_regular_polygon(vertices_count: int,
+                       center_x: float,
+                       center_y: float,
+                       radius: float) -> Polygon:
+    return Polygon(Contour([Point(center_x
+                                  + radius * cos(2 * pi * index
+                                                 / vertices_count),
+                                  center_y
+                                  + radius * sin(2 * pi * index
+                                                 / vertices_count))
+                            for index in range(vertices_count)]),
+                   [])
+
+
+def measure(function: Callable[[], object]) -> Tuple[float, int]:
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(repeat(function,
+                      number=1,
+                      repeat=3)), peak
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>26} {:>10} {:>10} {:>12} {:>12}'
+          .format('count', 'measure', 'objects, s', 'compact, s',
+                  'objects, KiB', 'compact, KiB'))
+    for count in counts:
+        first = Multipolygon([to_regular_polygon(count, 0., 0., 100.)])
+        second = Multipolygon([to_regular_polygon(count, 50., 0., 100.)])
+        for function in (intersection_area, difference_area,
+                         symmetric_difference_area, union_area):
+            objects_time, objects_peak = measure(
+                    lambda: function(first, second))
+            compact_time, compact_peak = measure(
+                    lambda: function(first, second,
+                                     compact=True))
+            print('{:>8} {:>26} {:>10.4f} {:>10.4f} {:>12} {:>12}'
+                  .format(count, function.__name__, objects_time,
+                          compact_time, objects_peak // 1024,
+                          compact_peak // 1024))
+    print()
+    print('{:>8} {:>16} {:>10} {:>10} {:>12} {:>12} {:>12} {:>12}'
+          .format('count', 'workload', 'objects, s', 'compact, s',
+                  'result, s', 'objects, KiB', 'compact, KiB',
+                  'result, KiB'))
+    for count in counts:
+        for name in ('holes', 'squares', 'stars'):
+            first, second = WORKLOADS[name](count, 0).multipolygons
+            objects_time, objects_peak = measure(
+                    lambda: intersection_area(first, second))
+            compact_time, compact_peak = measure(
+                    lambda: intersection_area(first, second,
+                                              compact=True))
+            result_time, result_peak = measure(
+                    lambda: intersect_multipolygons(first, second))
+            print('{:>8} {:>16} {:>10.4f} {:>10.4f} {:>10.4f} '
+                  '{:>12} {:>12} {:>12}'
+                  .format(count, name, objects_time, compact_time,
+                          result_time, objects_peak // 1024,
+                          compact_peak // 1024, result_peak // 1024))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [100, 1000])
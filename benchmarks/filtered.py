@@ -0,0 +1,62 @@
+"""
+Compares exact & filtered orientations on operands with rational coordinates.
+
+Usage:
+    python -m benchmarks.filtered [edges_count ...]
+"""
+import sys
+from fractions import Fraction
+from timeit import repeat
+from typing import (Callable,
+                    Sequence)
+from unittest import mock
+
+from ground.base import (Context,
+                         get_context)
+
+from benchmarks.integer import to_star
+from clipping.planar import intersect_multipolygons
+
+context = get_context()
+Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                         context.multipolygon_cls,
+                                         context.point_cls,
+                                         context.polygon_cls)
+
+
+def to_rational_star(count: int, seed: int) -> Polygon:
+    star = to_star(count, seed)
+    return Polygon(Contour([Point(Fraction(vertex.x, 3), Fraction(vertex.y, 7))
+                            for vertex in star.border.vertices]),
+                   [])
+
+
+def to_exact_context(context: Context) -> Context:
+    return context
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(repeat(function,
+                      number=1,
+                      repeat=3))
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>10} {:>12} {:>8}'.format('count', 'exact, s',
+                                             'filtered, s', 'speedup'))
+    for count in counts:
+        first = Multipolygon([to_rational_star(count, 0)])
+        second = Multipolygon([to_rational_star(count, 1)])
+        filtered_time = measure(lambda: intersect_multipolygons(first,
+                                                                second))
+        with mock.patch('clipping.core.holey.to_filtered_context',
+                        to_exact_context):
+            exact_time = measure(lambda: intersect_multipolygons(first,
+                                                                 second))
+        print('{:>8} {:>10.4f} {:>12.4f} {:>8.2f}'
+              .format(count, exact_time, filtered_time,
+                      exact_time / filtered_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [300, 1000])
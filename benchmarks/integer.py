@@ -0,0 +1,66 @@
+"""
+Compares generic & integer contexts on operands with integer coordinates.
+
+Usage:
+    python -m benchmarks.integer [edges_count ...]
+"""
+import sys
+from math import (cos,
+                  sin,
+                  tau)
+from random import Random
+from timeit import repeat
+from typing import (Callable,
+                    Sequence)
+from unittest import mock
+
+from ground.base import get_context
+
+from clipping.planar import intersect_multipolygons
+
+context = get_context()
+Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                         context.multipolygon_cls,
+                                         context.point_cls,
+                                         context.polygon_cls)
+
+
+def to_star(count: int, seed: int) -> Polygon:
+    # star-shaped polygon with micro-degrees-like coordinates
+    random = Random(seed)
+    center_x, center_y = (random.randint(0, 10 ** 6),
+                          random.randint(0, 10 ** 6))
+    angles = sorted(tau * random.random() for _ in range(count))
+    vertices = []
+    for angle in angles:
+        radius = random.randint(10 ** 7, 10 ** 8)
+        vertices.append(Point(center_x + int(radius * cos(angle)),
+                              center_y + int(radius * sin(angle))))
+    return Polygon(Contour(vertices), [])
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(repeat(function,
+                      number=1,
+                      repeat=3))
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>12} {:>12} {:>8}'.format('count', 'generic, s',
+                                             'integer, s', 'speedup'))
+    for count in counts:
+        first = Multipolygon([to_star(count, 0)])
+        second = Multipolygon([to_star(count, 1)])
+        integer_time = measure(lambda: intersect_multipolygons(first,
+                                                               second))
+        with mock.patch('clipping.core.operands.are_polygons_integral',
+                        return_value=False):
+            generic_time = measure(lambda: intersect_multipolygons(first,
+                                                                   second))
+        print('{:>8} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, generic_time, integer_time,
+                      generic_time / integer_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [300, 1000])
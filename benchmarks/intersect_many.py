@@ -0,0 +1,105 @@
+"""
+Compares single sweep intersection of many multipolygons
+with pairwise folding
+on overlapping coverage layers & on fragmented layers.
+
+Usage:
+    python -m benchmarks.intersect_many [layers_count ...]
+"""
+import sys
+from functools import reduce
+from math import (cos,
+                  sin,
+                  tau)
+from random import Random
+from timeit import repeat
+from typing import (List,
+                    Sequence,
+                    Union)
+
+from ground.hints import Empty
+
+from benchmarks.unite_many import (Contour,
+                                   Multipolygon,
+                                   Point,
+                                   Polygon,
+                                   context)
+from clipping.planar import (intersect_many_multipolygons,
+                             intersect_multipolygons)
+
+
+def to_fragmented_layers(count: int,
+                         side: int = 10) -> List[Multipolygon]:
+    result = []
+    for seed in range(count):
+        random = Random(seed)
+        polygons = []
+        for row in range(side):
+            for column in range(side):
+                # squares of a layer stay within their cells
+                # to keep the layer a valid multipolygon
+                x, y = (column * 8 + random.randint(0, 2),
+                        row * 8 + random.randint(0, 2))
+                polygons.append(Polygon(Contour([Point(x, y),
+                                                 Point(x + 5, y),
+                                                 Point(x + 5, y + 5),
+                                                 Point(x, y + 5)]),
+                                        []))
+        result.append(Multipolygon(polygons))
+    return result
+
+
+def to_coverage_layers(count: int,
+                       vertices_count: int = 512) -> List[Multipolygon]:
+    random = Random(0)
+    result = []
+    for _ in range(count):
+        center_x, center_y = random.randint(0, 50), random.randint(0, 50)
+        result.append(Multipolygon([Polygon(Contour([
+            Point(center_x + round(1000 * cos(tau * index / vertices_count)),
+                  center_y + round(1000 * sin(tau * index / vertices_count)))
+            for index in range(vertices_count)
+        ]), [])]))
+    return result
+
+
+def intersect_pairwise(multipolygons: Sequence[Multipolygon]
+                       ) -> Union[Empty, Multipolygon, Polygon]:
+    return reduce(_intersect_with_shaped, multipolygons[1:],
+                  multipolygons[0])
+
+
+def _intersect_with_shaped(shaped: Union[Empty, Multipolygon, Polygon],
+                           multipolygon: Multipolygon
+                           ) -> Union[Empty, Multipolygon, Polygon]:
+    return (shaped
+            if shaped is context.empty
+            else intersect_multipolygons(Multipolygon([shaped])
+                                         if isinstance(shaped, Polygon)
+                                         else shaped,
+                                         multipolygon))
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>12} {:>8} {:>12} {:>12} {:>8}'.format(
+            'layers', 'count', 'pairwise, s', 'single, s', 'speedup'
+    ))
+    for name, to_layers in [('coverage', to_coverage_layers),
+                            ('fragmented', to_fragmented_layers)]:
+        for count in counts:
+            layers = to_layers(count)
+            pairwise_time = min(repeat(lambda: intersect_pairwise(layers),
+                                       number=1,
+                                       repeat=3))
+            single_time = min(repeat(
+                    lambda: intersect_many_multipolygons(layers),
+                    number=1,
+                    repeat=3
+            ))
+            print('{:>12} {:>8} {:>12.4f} {:>12.4f} {:>8.2f}'
+                  .format(name, count, pairwise_time, single_time,
+                          pairwise_time / single_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [2, 5, 10, 20])
@@ -0,0 +1,64 @@
+"""
+Compares throughput of clipping many polygons by one window
+in a loop and in a batch.
+
+Usage:
+    python -m benchmarks.intersect_with_window [polygons_count ...]
+"""
+import sys
+from random import Random
+from timeit import repeat
+from typing import (List,
+                    Sequence)
+
+from ground.base import get_context
+
+from clipping.batch import intersect_with_window
+from clipping.planar import intersect_polygons
+
+context = get_context()
+Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+                           context.polygon_cls)
+WINDOW = Polygon(Contour([Point(0., 0.), Point(256., 0.),
+                          Point(256., 256.), Point(0., 256.)]),
+                 [])
+
+
+def to_features(count: int, seed: int = 0) -> List[Polygon]:
+    random = Random(seed)
+    result = []
+    for _ in range(count):
+        x, y = random.uniform(-32., 256.), random.uniform(-32., 256.)
+        size = random.uniform(4., 32.)
+        result.append(Polygon(Contour([Point(x, y), Point(x + size, y),
+                                       Point(x + size / 2., y + size)]),
+                              []))
+    return result
+
+
+def clip_in_loop(features: Sequence[Polygon]) -> None:
+    for feature in features:
+        intersect_polygons(WINDOW, feature)
+
+
+def clip_in_batch(features: Sequence[Polygon]) -> None:
+    for _ in intersect_with_window(WINDOW, features):
+        pass
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>14} {:>14}'.format('count', 'loop, 1/s', 'batch, 1/s'))
+    for count in counts:
+        features = to_features(count)
+        loop_time = min(repeat(lambda: clip_in_loop(features),
+                               number=1,
+                               repeat=3))
+        batch_time = min(repeat(lambda: clip_in_batch(features),
+                                number=1,
+                                repeat=3))
+        print('{:>8} {:>14.0f} {:>14.0f}'
+              .format(count, count / loop_time, count / batch_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [1000, 10000])
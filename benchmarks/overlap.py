@@ -0,0 +1,82 @@
+"""
+Compares overlap predicates with checking emptiness
+of the corresponding intersections.
+
+Usage:
+    python -m benchmarks.overlap [vertices_count ...]
+"""
+import sys
+from math import (cos,
+                  pi,
+                  sin)
+from timeit import repeat
+from typing import (Callable,
+                    Sequence)
+
+from ground.base import get_context
+
+from clipping.planar import (intersect_multipolygons,
+                             intersect_polygons,
+                             multipolygons_overlap,
+                             polygons_overlap)
+
+context = get_context()
+EMPTY = context.empty
+Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                         context.multipolygon_cls,
+                                         context.point_cls,
+                                         context.polygon_cls)
+
+
+def to_regular_polygon(vertices_count: int,
+                       center_x: float,
+                       center_y: float,
+                       radius: float) -> Polygon:
+    return Polygon(Contour([Point(center_x
+                                  + radius * cos(2 * pi * index
+                                                 / vertices_count),
+                                  center_y
+                                  + radius * sin(2 * pi * index
+                                                 / vertices_count))
+                            for index in range(vertices_count)]),
+                   [])
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(repeat(function,
+                      number=1,
+                      repeat=3))
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>14} {:>12} {:>12} {:>8}'
+          .format('count', 'operands', 'full, s', 'predicate, s',
+                  'speedup'))
+    for count in counts:
+        first = to_regular_polygon(count, 0., 0., 100.)
+        second = to_regular_polygon(count, 150., 0., 100.)
+        full_time = measure(lambda: intersect_polygons(first, second)
+                            is not EMPTY)
+        predicate_time = measure(lambda: polygons_overlap(first, second))
+        print('{:>8} {:>14} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, 'polygons', full_time, predicate_time,
+                      full_time / predicate_time))
+        first_layer = Multipolygon([to_regular_polygon(count, 250. * index,
+                                                       0., 100.)
+                                    for index in range(8)])
+        second_layer = Multipolygon([to_regular_polygon(count,
+                                                        250. * index + 150.,
+                                                        0., 100.)
+                                     for index in range(8)])
+        full_time = measure(lambda: intersect_multipolygons(first_layer,
+                                                            second_layer)
+                            is not EMPTY)
+        predicate_time = measure(lambda: multipolygons_overlap(first_layer,
+                                                               second_layer))
+        print('{:>8} {:>14} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, 'multipolygons', full_time, predicate_time,
+                      full_time / predicate_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [100, 1000])
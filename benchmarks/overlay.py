@@ -0,0 +1,55 @@
+"""
+Compares separate boolean operations & overlay of the same operands.
+
+Usage:
+    python -m benchmarks.overlay [edges_count ...]
+"""
+import sys
+from timeit import repeat
+from typing import (Callable,
+                    Sequence)
+
+from benchmarks.integer import (Multipolygon,
+                                to_star)
+from clipping.overlay import MultipolygonsOverlay
+from clipping.planar import (intersect_multipolygons,
+                             subtract_multipolygons,
+                             unite_multipolygons)
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(repeat(function,
+                      number=1,
+                      repeat=3))
+
+
+def compute_separately(first: Multipolygon, second: Multipolygon) -> None:
+    intersect_multipolygons(first, second)
+    subtract_multipolygons(first, second)
+    subtract_multipolygons(second, first)
+    unite_multipolygons(first, second)
+
+
+def compute_with_overlay(first: Multipolygon, second: Multipolygon) -> None:
+    overlay = MultipolygonsOverlay(first, second)
+    overlay.intersection()
+    overlay.difference()
+    overlay.reversed_difference()
+    overlay.union()
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>13} {:>12} {:>8}'.format('count', 'separate, s',
+                                             'overlay, s', 'speedup'))
+    for count in counts:
+        first = Multipolygon([to_star(count, 0)])
+        second = Multipolygon([to_star(count, 1)])
+        separate_time = measure(lambda: compute_separately(first, second))
+        overlay_time = measure(lambda: compute_with_overlay(first, second))
+        print('{:>8} {:>13.4f} {:>12.4f} {:>8.2f}'
+              .format(count, separate_time, overlay_time,
+                      separate_time / overlay_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [300, 1000])
@@ -0,0 +1,79 @@
+"""
+Compares single sweep overlay of two layers of polygons
+with intersecting pairs of polygons which boxes overlap
+on shifted grids of squares sharing edges.
+
+Usage:
+    python -m benchmarks.overlay_layers [side ...]
+"""
+import sys
+from timeit import repeat
+from typing import (List,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from ground.hints import Empty
+
+from benchmarks.unite_many import (Contour,
+                                   Multipolygon,
+                                   Point,
+                                   Polygon,
+                                   context)
+from clipping.overlay import overlay_layers
+from clipping.planar import intersect_polygons
+
+
+def to_grid(side: int, size: int, offset: int) -> List[Polygon]:
+    return [Polygon(Contour([Point(offset + column * size,
+                                   offset + row * size),
+                             Point(offset + (column + 1) * size,
+                                   offset + row * size),
+                             Point(offset + (column + 1) * size,
+                                   offset + (row + 1) * size),
+                             Point(offset + column * size,
+                                   offset + (row + 1) * size)]),
+                    [])
+            for row in range(side)
+            for column in range(side)]
+
+
+def overlay_pairwise(first: Sequence[Polygon],
+                     second: Sequence[Polygon]
+                     ) -> List[Tuple[int, int,
+                                     Union[Empty, Multipolygon, Polygon]]]:
+    first_boxes = [context.contour_box(polygon.border) for polygon in first]
+    second_boxes = [context.contour_box(polygon.border) for polygon in second]
+    result = []
+    for first_id, first_box in enumerate(first_boxes):
+        for second_id, second_box in enumerate(second_boxes):
+            if (first_box.max_x <= second_box.min_x
+                    or second_box.max_x <= first_box.min_x
+                    or first_box.max_y <= second_box.min_y
+                    or second_box.max_y <= first_box.min_y):
+                continue
+            intersection = intersect_polygons(first[first_id],
+                                              second[second_id])
+            if intersection is not context.empty:
+                result.append((first_id, second_id, intersection))
+    return result
+
+
+def main(sides: Sequence[int]) -> None:
+    print('{:>8} {:>12} {:>12} {:>8}'.format('side', 'pairwise, s',
+                                             'single, s', 'speedup'))
+    for side in sides:
+        first, second = to_grid(side, 10, 0), to_grid(side, 7, 3)
+        pairwise_time = min(repeat(lambda: overlay_pairwise(first, second),
+                                   number=1,
+                                   repeat=3))
+        single_time = min(repeat(lambda: list(overlay_layers(first, second)),
+                                 number=1,
+                                 repeat=3))
+        print('{:>8} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(side, pairwise_time, single_time,
+                      pairwise_time / single_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [5, 10, 20, 40])
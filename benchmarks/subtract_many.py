@@ -0,0 +1,86 @@
+"""
+Compares single sweep subtraction of many multipolygons
+with pairwise folding & with uniting subtrahends first.
+
+Usage:
+    python -m benchmarks.subtract_many [subtrahends_count ...]
+"""
+import sys
+from functools import reduce
+from timeit import repeat
+from typing import (Sequence,
+                    Union)
+
+from ground.hints import Empty
+
+from benchmarks.unite_many import (Contour,
+                                   Multipolygon,
+                                   Point,
+                                   Polygon,
+                                   context,
+                                   to_squares)
+from clipping.planar import (subtract_many_multipolygons,
+                             subtract_multipolygons,
+                             unite_many_polygons)
+
+
+def to_minuend(subtrahends_count: int) -> Multipolygon:
+    side = max(int(subtrahends_count ** 0.5), 1) * 8 + 8
+    return Multipolygon([Polygon(Contour([Point(2, 2), Point(side, 1),
+                                          Point(side + 1, side),
+                                          Point(1, side + 1)]),
+                                 [])])
+
+
+def subtract_pairwise(minuend: Multipolygon,
+                      subtrahends: Sequence[Multipolygon]
+                      ) -> Union[Empty, Multipolygon, Polygon]:
+    return reduce(_subtract_from_shaped, subtrahends, minuend)
+
+
+def subtract_united(minuend: Multipolygon,
+                    subtrahends: Sequence[Multipolygon]
+                    ) -> Union[Empty, Multipolygon, Polygon]:
+    union = unite_many_polygons([polygon
+                                 for subtrahend in subtrahends
+                                 for polygon in subtrahend.polygons])
+    return subtract_multipolygons(minuend, _to_multipolygon(union))
+
+
+def _subtract_from_shaped(minuend: Union[Empty, Multipolygon, Polygon],
+                          subtrahend: Multipolygon
+                          ) -> Union[Empty, Multipolygon, Polygon]:
+    return (minuend
+            if minuend is context.empty
+            else subtract_multipolygons(_to_multipolygon(minuend),
+                                        subtrahend))
+
+
+def _to_multipolygon(shaped: Union[Multipolygon, Polygon]) -> Multipolygon:
+    return (Multipolygon([shaped])
+            if isinstance(shaped, Polygon)
+            else shaped)
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>12} {:>12} {:>12} {:>8}'.format(
+            'count', 'pairwise, s', 'united, s', 'single, s', 'speedup'
+    ))
+    for count in counts:
+        minuend = to_minuend(count)
+        subtrahends = [Multipolygon([polygon])
+                       for polygon in to_squares(count)]
+        pairwise_time, united_time, single_time = [
+            min(repeat(lambda: function(minuend, subtrahends),
+                       number=1,
+                       repeat=3))
+            for function in (subtract_pairwise, subtract_united,
+                             subtract_many_multipolygons)
+        ]
+        print('{:>8} {:>12.4f} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, pairwise_time, united_time, single_time,
+                      min(pairwise_time, united_time) / single_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [10, 50, 200])
@@ -0,0 +1,161 @@
+"""
+Runs every ``clipping.planar`` function on seeded workloads
+recording time, events processed, segments divisions & peak memory.
+
+Usage:
+    python -m benchmarks.suite [--scales small medium large]
+                               [--workloads holes stars ...]
+                               [--functions 'unite_*' ...]
+                               [--repeat 3] [--seed 0] [--json results.json]
+"""
+import argparse
+import inspect
+import json
+import tracemalloc
+from fnmatch import fnmatch
+from timeit import repeat
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterator,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.hints import (Contour,
+                          Multipolygon,
+                          Multisegment,
+                          Polygon,
+                          Segment)
+
+from clipping import planar
+from clipping.tracing import (Trace,
+                              tracing)
+from .workloads import (SCALES,
+                        WORKLOADS,
+                        Workload)
+
+Measurement = Dict[str, Any]
+ARGUMENTS_FACTORIES = {
+    Contour: Workload.to_region,
+    Multipolygon: Workload.to_multipolygon,
+    Multisegment: Workload.to_multisegment,
+    Polygon: Workload.to_polygon,
+    Segment: Workload.to_segment,
+    Sequence[Contour]: Workload.to_multiregion,
+    Sequence[Multipolygon]: Workload.to_multipolygons,
+    Sequence[Polygon]: Workload.to_polygons,
+    Sequence[Segment]: Workload.to_segments,
+}  # type: Dict[Any, Callable[[Workload, int], Any]]
+
+
+def to_functions() -> List[Tuple[str, Callable[..., Any]]]:
+    return [(name, function)
+            for name, function in inspect.getmembers(planar,
+                                                     inspect.isfunction)
+            if not name.startswith('_')
+            and function.__module__ == planar.__name__]
+
+
+def to_arguments(function: Callable[..., Any],
+                 workload: Workload) -> List[Any]:
+    parameters = [
+        parameter
+        for parameter in inspect.signature(function).parameters.values()
+        if parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+    ]
+    return [ARGUMENTS_FACTORIES[parameter.annotation](workload, index)
+            for index, parameter in enumerate(parameters)]
+
+
+def trace(function: Callable[[], Any]) -> Trace:
+    with tracing() as result:
+        function()
+    return result
+
+
+def measure_peak_memory(function: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        _, result = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def run(functions_patterns: Sequence[str],
+        workloads_names: Sequence[str],
+        scales_names: Sequence[str],
+        repeats_count: int,
+        seed: int) -> Iterator[Measurement]:
+    functions = [(name, function)
+                 for name, function in to_functions()
+                 if any(fnmatch(name, pattern)
+                        for pattern in functions_patterns)]
+    for workload_name in workloads_names:
+        for scale_name in scales_names:
+            workload = WORKLOADS[workload_name](SCALES[scale_name], seed)
+            for function_name, function in functions:
+                arguments = to_arguments(function, workload)
+
+                def call() -> Any:
+                    return function(*arguments)
+
+                call_trace = trace(call)
+                yield {'function': function_name,
+                       'workload': workload_name,
+                       'scale': scale_name,
+                       'time': min(repeat(call,
+                                          number=1,
+                                          repeat=repeats_count)),
+                       'events': call_trace.events_popped,
+                       'divisions': call_trace.divisions,
+                       'peak_memory': measure_peak_memory(call)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--functions',
+                        nargs='+',
+                        default=['*'],
+                        help='shell-style patterns of functions names')
+    parser.add_argument('--workloads',
+                        nargs='+',
+                        choices=sorted(WORKLOADS),
+                        default=sorted(WORKLOADS))
+    parser.add_argument('--scales',
+                        nargs='+',
+                        choices=list(SCALES),
+                        default=['small', 'medium'])
+    parser.add_argument('--repeat',
+                        type=int,
+                        default=3)
+    parser.add_argument('--seed',
+                        type=int,
+                        default=0)
+    parser.add_argument('--json',
+                        help='path to save measurements to')
+    arguments = parser.parse_args()
+    template = '{:<50} {:>14} {:>6} {:>10} {:>8} {:>9} {:>10}'
+    print(template.format('function', 'workload', 'scale', 'time, ms',
+                          'events', 'divisions', 'peak, KiB'))
+    measurements = []
+    for measurement in run(arguments.functions, arguments.workloads,
+                           arguments.scales, arguments.repeat,
+                           arguments.seed):
+        print(template.format(measurement['function'],
+                              measurement['workload'], measurement['scale'],
+                              '{:.3f}'.format(1000 * measurement['time']),
+                              measurement['events'],
+                              measurement['divisions'],
+                              measurement['peak_memory'] // 1024))
+        measurements.append(measurement)
+    if arguments.json is not None:
+        with open(arguments.json, 'w') as file:
+            json.dump(measurements, file,
+                      indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Compares sweep line backends of n-ary union
+on dense & sparse sweep lines.
+
+Usage:
+    python -m benchmarks.sweep_line [polygons_count ...]
+"""
+import sys
+from timeit import repeat
+from typing import (Callable,
+                    List,
+                    Sequence)
+
+from ground.base import get_context
+
+from clipping.planar import unite_many_polygons
+
+context = get_context()
+Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+                           context.polygon_cls)
+
+
+def to_rectangle(min_x: int, min_y: int, max_x: int, max_y: int) -> Polygon:
+    return Polygon(Contour([Point(min_x, min_y), Point(max_x, min_y),
+                            Point(max_x, max_y), Point(min_x, max_y)]),
+                   [])
+
+
+def to_dense_polygons(count: int) -> List[Polygon]:
+    # stacked overlapping strips keep all edges in the sweep line at once
+    return [to_rectangle(index, 2 * index, count + index, 2 * index + 3)
+            for index in range(count)]
+
+
+def to_sparse_polygons(count: int) -> List[Polygon]:
+    # chained overlapping squares keep only a few edges in the sweep line
+    return [to_rectangle(2 * index, 0, 2 * index + 3, 3)
+            for index in range(count)]
+
+
+def measure(function: Callable[[], object]) -> float:
+    return min(repeat(function,
+                      number=1,
+                      repeat=3))
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>8} {:>10} {:>14} {:>8}'
+          .format('count', 'kind', 'tree, s', 'skip list, s', 'speedup'))
+    for count in counts:
+        for kind, polygons in [('dense', to_dense_polygons(count)),
+                               ('sparse', to_sparse_polygons(count))]:
+            tree_time = measure(lambda: unite_many_polygons(polygons))
+            skip_list_time = measure(
+                    lambda: unite_many_polygons(polygons,
+                                                sweep_line='skip_list'))
+            print('{:>8} {:>8} {:>10.4f} {:>14.4f} {:>8.2f}'
+                  .format(count, kind, tree_time, skip_list_time,
+                          tree_time / skip_list_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [100, 1000])
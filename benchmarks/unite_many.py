@@ -0,0 +1,71 @@
+"""
+Compares single sweep union of many polygons with pairwise folding.
+
+Usage:
+    python -m benchmarks.unite_many [polygons_count ...]
+"""
+import sys
+from functools import reduce
+from random import Random
+from timeit import repeat
+from typing import (List,
+                    Sequence)
+
+from ground.base import get_context
+
+from clipping.planar import (unite_many_polygons,
+                             unite_multipolygons)
+
+context = get_context()
+Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                         context.multipolygon_cls,
+                                         context.point_cls,
+                                         context.polygon_cls)
+
+
+def to_squares(count: int, seed: int = 0) -> List[Polygon]:
+    random = Random(seed)
+    side = max(int(count ** 0.5), 1)
+    result = []
+    for index in range(count):
+        x = (index % side) * 8 + random.randint(0, 4)
+        y = (index // side) * 8 + random.randint(0, 4)
+        size = random.randint(6, 12)
+        result.append(Polygon(Contour([Point(x, y), Point(x + size, y),
+                                       Point(x + size, y + size),
+                                       Point(x, y + size)]),
+                              []))
+    return result
+
+
+def unite_pairwise(polygons: Sequence[Polygon]) -> Multipolygon:
+    return reduce(_unite_with_multipolygon, polygons[1:],
+                  Multipolygon(polygons[:1]))
+
+
+def _unite_with_multipolygon(multipolygon: Multipolygon,
+                             polygon: Polygon) -> Multipolygon:
+    result = unite_multipolygons(multipolygon, Multipolygon([polygon]))
+    return (Multipolygon([result])
+            if isinstance(result, Polygon)
+            else result)
+
+
+def main(counts: Sequence[int]) -> None:
+    print('{:>8} {:>12} {:>12} {:>8}'.format('count', 'pairwise, s',
+                                             'single, s', 'speedup'))
+    for count in counts:
+        polygons = to_squares(count)
+        pairwise_time = min(repeat(lambda: unite_pairwise(polygons),
+                                   number=1,
+                                   repeat=3))
+        single_time = min(repeat(lambda: unite_many_polygons(polygons),
+                                 number=1,
+                                 repeat=3))
+        print('{:>8} {:>12.4f} {:>12.4f} {:>8.2f}'
+              .format(count, pairwise_time, single_time,
+                      pairwise_time / single_time))
+
+
+if __name__ == '__main__':
+    main([int(argument) for argument in sys.argv[1:]] or [10, 50, 200])
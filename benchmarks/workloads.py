@@ -0,0 +1,242 @@
+"""
+Seeded workloads for benchmarks.
+
+Each workload is a pair of multipolygons & a pair of multisegments
+with ``size`` edges in each operand approximately,
+all the other geometries are derived from them.
+"""
+from math import (cos,
+                  sin,
+                  tau)
+from random import Random
+from typing import (Callable,
+                    Dict,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.base import get_context
+from reprit.base import generate_repr
+
+context = get_context()
+Contour, Multipolygon, Multisegment, Point, Polygon, Segment = (
+    context.contour_cls, context.multipolygon_cls, context.multisegment_cls,
+    context.point_cls, context.polygon_cls, context.segment_cls
+)
+SCALES = {'small': 16, 'medium': 128, 'large': 1024}
+
+
+class Workload:
+    __slots__ = 'multipolygons', 'multisegments'
+
+    def __init__(self,
+                 multipolygons: Tuple[Multipolygon, Multipolygon],
+                 multisegments: Tuple[Multisegment, Multisegment]) -> None:
+        self.multipolygons, self.multisegments = multipolygons, multisegments
+
+    __repr__ = generate_repr(__init__)
+
+    def to_multiregion(self, index: int) -> Sequence[Contour]:
+        return [polygon.border
+                for polygon in self.multipolygons[index].polygons]
+
+    def to_multipolygon(self, index: int) -> Multipolygon:
+        return self.multipolygons[index]
+
+    def to_multipolygons(self, _index: int) -> Sequence[Multipolygon]:
+        return list(self.multipolygons)
+
+    def to_multisegment(self, index: int) -> Multisegment:
+        return self.multisegments[index]
+
+    def to_polygon(self, index: int) -> Polygon:
+        return self.multipolygons[index].polygons[0]
+
+    def to_polygons(self, _index: int) -> Sequence[Polygon]:
+        return [polygon
+                for multipolygon in self.multipolygons
+                for polygon in multipolygon.polygons]
+
+    def to_region(self, index: int) -> Contour:
+        return self.to_polygon(index).border
+
+    def to_segment(self, index: int) -> Segment:
+        return max(self.multisegments[index].segments,
+                   key=_to_segment_squared_length)
+
+    def to_segments(self, _index: int) -> Sequence[Segment]:
+        return [segment
+                for multisegment in self.multisegments
+                for segment in multisegment.segments]
+
+
+def to_stars(size: int, seed: int) -> Workload:
+    """
+    Returns workload of star-shaped polygons with integer coordinates
+    and multisegments of their edges.
+    """
+    random = Random(seed)
+    first, second = (_to_star(size, 0, 0, random),
+                     _to_star(size, 10 ** 5, 10 ** 5, random))
+    return Workload((Multipolygon([first]), Multipolygon([second])),
+                    (_polygon_to_multisegment(first),
+                     _polygon_to_multisegment(second)))
+
+
+def to_squares(size: int, seed: int) -> Workload:
+    """
+    Returns workload of grids of squares shifted by half of the side.
+    """
+    random = Random(seed)
+    side = max(int((size / 4) ** 0.5), 1)
+    step = 10 + random.randint(0, 2)
+    first = [_to_rectangle(column * 2 * step, row * 2 * step,
+                           column * 2 * step + step, row * 2 * step + step)
+             for row in range(side)
+             for column in range(side)]
+    second = [_translate_polygon(polygon, step // 2, step // 2)
+              for polygon in first]
+    return Workload((Multipolygon(first), Multipolygon(second)),
+                    (_polygons_to_multisegment(first),
+                     _polygons_to_multisegment(second)))
+
+
+def to_holes(size: int, seed: int) -> Workload:
+    """
+    Returns workload of squares with grids of square holes.
+    """
+    random = Random(seed)
+    side = max(int((size / 4) ** 0.5), 1)
+    step = 10 + random.randint(0, 2)
+    first, second = (_to_holey_square(side, step, 0),
+                     _to_holey_square(side, step, step // 2))
+    return Workload((Multipolygon([first]), Multipolygon([second])),
+                    (_polygons_to_multisegment([first]),
+                     _polygons_to_multisegment([second])))
+
+
+def to_near_collinear(size: int, seed: int) -> Workload:
+    """
+    Returns workload of floating point slivers & segments
+    which are nearly collinear with the same line.
+    """
+    random = Random(seed)
+    slope = random.uniform(0.1, 0.9)
+    first_polygons, second_polygons = [], []
+    for index in range(max(size // 4, 1)):
+        for polygons, start_x in [(first_polygons, float(index)),
+                                  (second_polygons, index + 0.5)]:
+            end_x = start_x + 0.75
+            height = random.uniform(1e-9, 1e-6)
+            polygons.append(Polygon(Contour([
+                Point(start_x, slope * start_x - height),
+                Point(end_x, slope * end_x - height),
+                Point(end_x, slope * end_x + height),
+                Point(start_x, slope * start_x + height)
+            ]), []))
+    first_segments, second_segments = [], []
+    for index in range(size):
+        for segments, start_x in [(first_segments, float(index)),
+                                  (second_segments, index + 0.5)]:
+            end_x = start_x + 0.75
+            segments.append(Segment(
+                    Point(start_x,
+                          slope * start_x + random.uniform(-1e-9, 1e-9)),
+                    Point(end_x, slope * end_x + random.uniform(-1e-9, 1e-9))
+            ))
+    return Workload((Multipolygon(first_polygons),
+                     Multipolygon(second_polygons)),
+                    (Multisegment(first_segments),
+                     Multisegment(second_segments)))
+
+
+def to_thin(size: int, seed: int) -> Workload:
+    """
+    Returns workload of long thin rectangles & segments
+    crossing each other at small angles.
+    """
+    random = Random(seed)
+    length = 1000 * size
+    first_polygons, second_polygons = [], []
+    for index in range(max(size // 4, 1)):
+        min_y = index * 10
+        first_polygons.append(_to_rectangle(0, min_y, length, min_y + 1))
+        # consecutive bands of the same operand should not overlap
+        shift = random.randint(1, 7)
+        second_polygons.append(Polygon(Contour([
+            Point(0, min_y + shift), Point(length, min_y + shift - 10),
+            Point(length, min_y + shift - 9), Point(0, min_y + shift + 1)
+        ]), []))
+    first_segments = [Segment(Point(0, index * 3), Point(length, index * 3))
+                      for index in range(size)]
+    second_segments = [Segment(Point(0, index * 3 + 1),
+                               Point(length, index * 3 - 7))
+                       for index in range(size)]
+    return Workload((Multipolygon(first_polygons),
+                     Multipolygon(second_polygons)),
+                    (Multisegment(first_segments),
+                     Multisegment(second_segments)))
+
+
+WORKLOADS = {
+    'holes': to_holes,
+    'near_collinear': to_near_collinear,
+    'squares': to_squares,
+    'stars': to_stars,
+    'thin': to_thin,
+}  # type: Dict[str, Callable[[int, int], Workload]]
+
+
+def _polygon_to_multisegment(polygon: Polygon) -> Multisegment:
+    return _polygons_to_multisegment([polygon])
+
+
+def _polygons_to_multisegment(polygons: Sequence[Polygon]) -> Multisegment:
+    return Multisegment([segment
+                         for polygon in polygons
+                         for contour in [polygon.border, *polygon.holes]
+                         for segment in context.contour_segments(contour)])
+
+
+def _to_holey_square(side: int, step: int, offset: int) -> Polygon:
+    holes = [_to_rectangle(min_x, min_y, min_x + step, min_y + step).border
+             for min_x in range(offset + step, offset + 2 * step * side,
+                                2 * step)
+             for min_y in range(offset + step, offset + 2 * step * side,
+                                2 * step)]
+    max_coordinate = offset + 2 * step * side + step
+    return Polygon(_to_rectangle(offset, offset, max_coordinate,
+                                 max_coordinate).border,
+                   holes)
+
+
+def _to_rectangle(min_x: int, min_y: int, max_x: int, max_y: int) -> Polygon:
+    return Polygon(Contour([Point(min_x, min_y), Point(max_x, min_y),
+                            Point(max_x, max_y), Point(min_x, max_y)]),
+                   [])
+
+
+def _translate_polygon(polygon: Polygon, step_x: int, step_y: int
+                       ) -> Polygon:
+    return Polygon(Contour([Point(vertex.x + step_x, vertex.y + step_y)
+                            for vertex in polygon.border.vertices]),
+                   [])
+
+
+def _to_segment_squared_length(segment: Segment) -> float:
+    return context.points_squared_distance(segment.start, segment.end)
+
+
+def _to_star(size: int,
+             center_x: int,
+             center_y: int,
+             random: Random) -> Polygon:
+    angles = sorted({random.uniform(0., tau) for _ in range(max(size, 3))})
+    vertices = []  # type: List[Point]
+    for angle in angles:
+        radius = random.randint(10 ** 5, 2 * 10 ** 5)
+        vertex = Point(center_x + int(radius * cos(angle)),
+                       center_y + int(radius * sin(angle)))
+        if not vertices or vertex != vertices[-1]:
+            vertices.append(vertex)
+    return Polygon(Contour(vertices), [])
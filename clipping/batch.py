@@ -0,0 +1,91 @@
+"""Boolean operations of one geometry with many others."""
+from typing import (Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    Optional as _Optional,
+                    Union as _Union)
+
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+from ground.hints import (Empty as _Empty,
+                          Multipolygon as _Multipolygon,
+                          Polygon as _Polygon)
+
+from .core import (holey as _holey,
+                   operands as _operands)
+
+
+def intersect_with_window(window: _Union[_Multipolygon, _Polygon],
+                          geometries: _Iterable[_Union[_Multipolygon,
+                                                       _Polygon]],
+                          *,
+                          context: _Optional[_Context] = None
+                          ) -> _Iterator[_Union[_Empty, _Multipolygon,
+                                                _Polygon]]:
+    """
+    Returns intersections of the window with each of geometries
+    lazily & in the same order.
+
+    Window's box & oriented edges are computed once for all of geometries,
+    geometries which lie within a rectangular window
+    are returned without sweeping.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)`` for each geometry
+    Memory complexity:
+        ``O(segments_count)`` for each geometry
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = window_edges_count + geometry_edges_count``,
+    ``window_edges_count`` & ``geometry_edges_count``
+    --- number of edges of the window & the geometry respectively,
+    ``intersections_count`` --- number of intersections between window's
+    and geometry's edges.
+
+    :param window: shaped geometry to intersect with.
+    :param geometries: shaped geometries to intersect.
+    :param context: geometric context.
+    :returns: iterator over intersections of the window with geometries.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> window = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> first_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                 Point(6, 6), Point(2, 6)]), [])
+    >>> second_square = Polygon(Contour([Point(6, 6), Point(8, 6),
+    ...                                  Point(8, 8), Point(6, 8)]), [])
+    >>> inner_square = Polygon(Contour([Point(1, 1), Point(3, 1),
+    ...                                 Point(3, 3), Point(1, 3)]), [])
+    >>> results = intersect_with_window(
+    ...     window, [first_square, second_square,
+    ...              Multipolygon([inner_square, second_square])])
+    >>> next(results) == Polygon(Contour([Point(2, 2), Point(4, 2),
+    ...                                   Point(4, 4), Point(2, 4)]), [])
+    True
+    >>> next(results) is EMPTY
+    True
+    >>> next(results) == inner_square
+    True
+    >>> next(results, None) is None
+    True
+    """
+    if context is None:
+        context = _get_context()
+    prepared_window = _holey.Window(
+            window.polygons
+            if isinstance(window, context.multipolygon_cls)
+            else [window],
+            context
+    )
+    multipolygon_cls = context.multipolygon_cls
+    for geometry in geometries:
+        yield prepared_window.intersect(
+                _operands.MultipolygonOperand(geometry)
+                if isinstance(geometry, multipolygon_cls)
+                else _operands.PolygonOperand(geometry)
+        )
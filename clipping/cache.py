@@ -0,0 +1,28 @@
+"""
+Memoization of boolean operations' results.
+
+>>> from ground.base import get_context
+>>> context = get_context()
+>>> Contour = context.contour_cls
+>>> Multipolygon = context.multipolygon_cls
+>>> Point = context.point_cls
+>>> Polygon = context.polygon_cls
+>>> from clipping.planar import intersect_multipolygons
+>>> cache = Cache(max_size=2)
+>>> intersect = cache.wrap(intersect_multipolygons)
+>>> first = Multipolygon([Polygon(Contour([Point(0, 0), Point(4, 0),
+...                                        Point(4, 4), Point(0, 4)]), [])])
+>>> second = Multipolygon([Polygon(Contour([Point(2, 2), Point(6, 2),
+...                                         Point(6, 6), Point(2, 6)]), [])])
+>>> intersect(first, second) == Polygon(Contour([Point(2, 2), Point(4, 2),
+...                                              Point(4, 4), Point(2, 4)]),
+...                                     [])
+True
+>>> intersect(second, first) is intersect(first, second)
+True
+>>> cache.hits, cache.misses, len(cache)
+(2, 1, 1)
+"""
+from .core import cache as _cache
+
+Cache = _cache.Cache
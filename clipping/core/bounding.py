@@ -1,4 +1,8 @@
-from typing import (Sequence,
+from functools import partial
+from typing import (Any,
+                    Callable,
+                    List,
+                    Sequence,
                     Tuple)
 
 from ground.base import (Context,
@@ -15,6 +19,13 @@ from orient.planar import (point_in_region,
 
 from .hints import (Multiregion,
                     Region)
+from .rtree import (Predicate,
+                    RTree)
+from .tracing import current_trace
+
+# when there are no more query or indexed boxes than this,
+# scanning boxes is cheaper than building the tree
+MAX_SCANNED_BOXES_COUNT = 16
 
 
 def disjoint_with(left: Box, right: Box) -> bool:
@@ -361,6 +372,7 @@ def split_intersecting_segments(box: Box,
     result = [], []
     for segment in segments:
         result[intersects_with_segment(box, segment, context)].append(segment)
+    _record_bounding(segments, result[True])
     return result
 
 
@@ -387,46 +399,189 @@ def to_edges(box: Box,
 def to_intersecting_segments(box: Box,
                              segments: Sequence[Segment],
                              context: Context) -> Sequence[Segment]:
-    return [segment
-            for segment in segments
-            if intersects_with_segment(box, segment, context)]
+    result = [segment
+              for segment in segments
+              if intersects_with_segment(box, segment, context)]
+    _record_bounding(segments, result)
+    return result
 
 
 def to_coupled_segments(box: Box,
                         segments: Sequence[Segment],
                         context: Context) -> Sequence[Segment]:
-    return [segment
-            for segment in segments
-            if coupled_with_segment(box, segment, context)]
+    result = [segment
+              for segment in segments
+              if coupled_with_segment(box, segment, context)]
+    _record_bounding(segments, result)
+    return result
 
 
 def to_intersecting_polygons(box: Box,
                              polygons: Sequence[Polygon],
                              context: Context) -> Sequence[Polygon]:
-    return [polygon
-            for polygon in polygons
-            if intersects_with_polygon(box, polygon, context)]
+    result = [polygon
+              for polygon in polygons
+              if intersects_with_polygon(box, polygon, context)]
+    _record_bounding(polygons, result)
+    return result
 
 
 def to_intersecting_regions(box: Box,
                             multiregion: Multiregion,
                             context: Context) -> Multiregion:
-    return [region
-            for region in multiregion
-            if intersects_with_region(box, region, context)]
+    result = [region
+              for region in multiregion
+              if intersects_with_region(box, region, context)]
+    _record_bounding(multiregion, result)
+    return result
 
 
 def to_coupled_polygons(box: Box,
                         polygons: Sequence[Polygon],
                         context: Context) -> Sequence[Polygon]:
-    return [polygon
-            for polygon in polygons
-            if coupled_with_polygon(box, polygon, context)]
+    result = [polygon
+              for polygon in polygons
+              if coupled_with_polygon(box, polygon, context)]
+    _record_bounding(polygons, result)
+    return result
 
 
 def to_coupled_regions(box: Box,
                        multiregion: Multiregion,
                        context: Context) -> Multiregion:
-    return [region
-            for region in multiregion
-            if coupled_with_region(box, region, context)]
+    result = [region
+              for region in multiregion
+              if coupled_with_region(box, region, context)]
+    _record_bounding(multiregion, result)
+    return result
+
+
+def to_polygons_coupled_with_polygons(polygons: Sequence[Polygon],
+                                      others: Sequence[Polygon],
+                                      context: Context) -> Sequence[Polygon]:
+    """
+    Selects polygons which boxes are coupled with a box of any other polygon.
+    """
+    has_box = to_boxes_checker(to_polygons_boxes(others, context),
+                               len(polygons), context)
+    result = [polygon
+              for polygon in polygons
+              if has_box(context.contour_box(polygon.border),
+                         coupled_with)]
+    _record_bounding(polygons, result)
+    return result
+
+
+def to_polygons_ids_coupled_with_polygons(polygons: Sequence[Polygon],
+                                          others: Sequence[Polygon],
+                                          context: Context) -> List[int]:
+    """
+    Selects indices of polygons
+    which boxes are coupled with a box of any other polygon.
+    """
+    has_box = to_boxes_checker(to_polygons_boxes(others, context),
+                               len(polygons), context)
+    result = [polygon_id
+              for polygon_id, polygon in enumerate(polygons)
+              if has_box(context.contour_box(polygon.border),
+                         coupled_with)]
+    _record_bounding(polygons, result)
+    return result
+
+
+def to_polygons_intersecting_polygons(polygons: Sequence[Polygon],
+                                      others: Sequence[Polygon],
+                                      context: Context) -> Sequence[Polygon]:
+    """
+    Selects polygons which boxes intersect a box of any other polygon.
+    """
+    has_box = to_boxes_checker(to_polygons_boxes(others, context),
+                               len(polygons), context)
+    result = [polygon
+              for polygon in polygons
+              if has_box(context.contour_box(polygon.border),
+                         intersects_with)]
+    _record_bounding(polygons, result)
+    return result
+
+
+def to_regions_coupled_with_regions(multiregion: Multiregion,
+                                    others: Multiregion,
+                                    context: Context) -> Multiregion:
+    """
+    Selects regions which boxes are coupled with a box of any other region.
+    """
+    has_box = to_boxes_checker(to_regions_boxes(others, context),
+                               len(multiregion), context)
+    result = [region
+              for region in multiregion
+              if has_box(context.contour_box(region), coupled_with)]
+    _record_bounding(multiregion, result)
+    return result
+
+
+def to_regions_intersecting_regions(multiregion: Multiregion,
+                                    others: Multiregion,
+                                    context: Context) -> Multiregion:
+    """
+    Selects regions which boxes intersect a box of any other region.
+    """
+    has_box = to_boxes_checker(to_regions_boxes(others, context),
+                               len(multiregion), context)
+    result = [region
+              for region in multiregion
+              if has_box(context.contour_box(region), intersects_with)]
+    _record_bounding(multiregion, result)
+    return result
+
+
+def split_polygons_coupled_with_polygons(polygons: Sequence[Polygon],
+                                         others: Sequence[Polygon],
+                                         context: Context
+                                         ) -> Tuple[List[Polygon],
+                                                    List[Polygon]]:
+    """
+    Splits polygons into ones which boxes are not coupled
+    with a box of any other polygon and the rest of them.
+    """
+    has_box = to_boxes_checker(to_polygons_boxes(others, context),
+                               len(polygons), context)
+    result = [], []
+    for polygon in polygons:
+        result[has_box(context.contour_box(polygon.border),
+                       coupled_with)].append(polygon)
+    _record_bounding(polygons, result[True])
+    return result
+
+
+def to_boxes_checker(boxes: Sequence[Box],
+                     queries_count: int,
+                     context: Context) -> Callable[[Box, Predicate], bool]:
+    """
+    Returns function which checks if any of boxes satisfies predicate
+    with the box, queried given number of times.
+    """
+    return (partial(_has_box, boxes)
+            if min(len(boxes), queries_count) <= MAX_SCANNED_BOXES_COUNT
+            else RTree(boxes, context).has_box)
+
+
+def to_polygons_boxes(polygons: Sequence[Polygon],
+                      context: Context) -> List[Box]:
+    return [context.contour_box(polygon.border) for polygon in polygons]
+
+
+def to_regions_boxes(multiregion: Multiregion,
+                     context: Context) -> List[Box]:
+    return [context.contour_box(region) for region in multiregion]
+
+
+def _has_box(boxes: Sequence[Box], box: Box, predicate: Predicate) -> bool:
+    return any(predicate(candidate, box) for candidate in boxes)
+
+
+def _record_bounding(candidates: Sequence[Any], survivors: Sequence[Any]
+                     ) -> None:
+    trace = current_trace()
+    if trace is not None:
+        trace.record_bounding(len(candidates), len(survivors))
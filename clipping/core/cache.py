@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from functools import wraps
+from inspect import (Parameter,
+                     signature)
+from threading import Lock
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Hashable,
+                    Sequence,
+                    TypeVar)
+
+from ground.base import get_context
+from reprit.base import generate_repr
+
+Function = TypeVar('Function',
+                   bound=Callable[..., Any])
+# operations which results do not depend on operands' order
+# if both operands are of the same kind
+COMMUTATIVE_OPERATIONS_PREFIXES = ('complete_intersect_', 'intersect_',
+                                   'symmetric_subtract_', 'unite_')
+COMMUTATIVE_OPERATIONS_SUFFIXES = ('_overlap',)
+
+
+class Cache:
+    """
+    Bounded cache of operations' results
+    with least recently used entries evicted first.
+
+    Entries are keyed by operation, geometric context, other options
+    & fingerprints of operands built from their vertices' coordinates
+    along with their types, since equal coordinates of different types
+    give results of different types,
+    operands of commutative operations are keyed regardless of their order.
+
+    Cache can be shared between threads,
+    its entries & statistics are updated under lock,
+    while results are computed outside of it.
+    """
+    __slots__ = 'max_size', 'hits', 'misses', '_entries', '_lock'
+
+    def __init__(self, max_size: int = 128) -> None:
+        """
+        Initializes cache.
+
+        :param max_size: maximum number of results to keep.
+        """
+        if max_size < 1:
+            raise ValueError('Maximum size should be positive, '
+                             'but found: {size}.'.format(size=max_size))
+        self.max_size = max_size
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()  # type: Dict[Hashable, Any]
+        self._lock = Lock()
+
+    __repr__ = generate_repr(__init__)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Removes all results & resets statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def wrap(self, function: Function) -> Function:
+        """
+        Returns function which results are looked up in the cache first.
+
+        :param function: operation from ``clipping.planar``.
+        :returns: function with the same signature.
+        """
+        function_signature = signature(function)
+        operands_names = [
+            parameter.name
+            for parameter in function_signature.parameters.values()
+            if parameter.kind is Parameter.POSITIONAL_OR_KEYWORD
+        ]
+        is_commutative = is_commutative_operation(function)
+        entries, lock = self._entries, self._lock
+
+        @wraps(function)
+        def cached(*args: Any, **kwargs: Any) -> Any:
+            arguments = function_signature.bind(*args, **kwargs).arguments
+            key = to_key(function, arguments, operands_names, is_commutative)
+            with lock:
+                try:
+                    result = entries[key]
+                except KeyError:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+                    entries.move_to_end(key)
+                    return result
+            result = function(*args, **kwargs)
+            with lock:
+                entries[key] = result
+                entries.move_to_end(key)
+                if len(entries) > self.max_size:
+                    entries.popitem(last=False)
+            return result
+
+        return cached
+
+
+def is_commutative_operation(function: Callable[..., Any]) -> bool:
+    name = function.__name__
+    parameters = [parameter
+                  for parameter in signature(function).parameters.values()
+                  if parameter.kind is Parameter.POSITIONAL_OR_KEYWORD]
+    return (len(parameters) == 2
+            and parameters[0].annotation == parameters[1].annotation
+            and (name.startswith(COMMUTATIVE_OPERATIONS_PREFIXES)
+                 or name.endswith(COMMUTATIVE_OPERATIONS_SUFFIXES)))
+
+
+def to_fingerprint(value: Any) -> Hashable:
+    """
+    Returns hashable structure of coordinates of given geometry
+    or of sequence of geometries along with coordinates' types.
+    """
+    if hasattr(value, 'x'):
+        return type(value.x), value.x, type(value.y), value.y
+    elif hasattr(value, 'vertices'):
+        return tuple(to_fingerprint(vertex) for vertex in value.vertices)
+    elif hasattr(value, 'border'):
+        return (to_fingerprint(value.border),
+                tuple(to_fingerprint(hole) for hole in value.holes))
+    elif hasattr(value, 'polygons'):
+        return tuple(to_fingerprint(polygon) for polygon in value.polygons)
+    elif hasattr(value, 'segments'):
+        return tuple(to_fingerprint(segment) for segment in value.segments)
+    elif hasattr(value, 'start'):
+        return to_fingerprint(value.start), to_fingerprint(value.end)
+    else:
+        return tuple(to_fingerprint(element) for element in value)
+
+
+def to_key(function: Callable[..., Any],
+           arguments: Dict[str, Any],
+           operands_names: Sequence[str],
+           is_commutative: bool) -> Hashable:
+    operands = tuple(to_fingerprint(arguments[name])
+                     for name in operands_names)
+    options = {name: value
+               for name, value in arguments.items()
+               if name not in operands_names}
+    if options.get('context') is None:
+        options['context'] = get_context()
+    return (function,
+            frozenset(operands) if is_commutative else operands,
+            frozenset((name, type(value), value)
+                      for name, value in options.items()))
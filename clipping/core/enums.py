@@ -7,3 +7,16 @@ class OverlapKind(IntEnum):
     NONE = 0
     SAME_ORIENTATION = 1
     DIFFERENT_ORIENTATION = 2
+
+
+@unique
+class GeometryKind(IntEnum):
+    EMPTY = 0
+    MULTIPOINT = 1
+    SEGMENT = 2
+    MULTISEGMENT = 3
+    CONTOUR = 4
+    MULTIREGION = 5
+    POLYGON = 6
+    MULTIPOLYGON = 7
+    MIX = 8
@@ -4,6 +4,7 @@ from abc import (ABC,
 from reprlib import recursive_repr
 from typing import (Optional,
                     Sequence,
+                    Tuple,
                     TypeVar)
 
 from ground.hints import Point
@@ -13,6 +14,7 @@ from reprit.base import generate_repr
 from .enums import OverlapKind
 from .hints import SegmentEndpoints
 
+MINUEND_OPERAND_ID = 0
 UNDEFINED_INDEX = sys.maxsize
 
 
@@ -430,7 +432,246 @@ class LeftHoleyEvent(LeftEvent):
         return tail
 
 
-LeftShapedEvent = TypeVar('LeftShapedEvent', LeftHolelessEvent, LeftHoleyEvent)
+class LeftNaryHoleyEvent(LeftEvent):
+    @classmethod
+    def from_endpoints(cls,
+                       segment_endpoints: SegmentEndpoints,
+                       operand_id: int) -> 'LeftNaryHoleyEvent':
+        start, end = segment_endpoints
+        interior_to_left = True
+        if start > end:
+            start, end = end, start
+            interior_to_left = False
+        event = cls(start, None, operand_id, interior_to_left)
+        event.right = RightShapedEvent(end, event)
+        return event
+
+    __slots__ = ('below_coverage', 'below_event_from_shaped_result',
+                 'contour_id', 'from_in_to_out', 'from_shaped_result', 'id',
+                 'interior_to_left', 'operand_id', 'overlap_below_coverage',
+                 'start', 'start_id')
+
+    def __init__(
+            self,
+            start: Point,
+            right: Optional['RightShapedEvent'],
+            operand_id: int,
+            interior_to_left: bool,
+            *,
+            below_coverage: int = 0,
+            below_event_from_shaped_result: Optional[
+                'LeftNaryHoleyEvent'
+            ] = None,
+            contour_id: Optional[int] = None,
+            from_in_to_out: bool = False,
+            from_shaped_result: bool = False,
+            id_: int = UNDEFINED_INDEX,
+            overlap_below_coverage: int = 0,
+            start_id: int = UNDEFINED_INDEX
+    ) -> None:
+        (
+            self.below_coverage, self.below_event_from_shaped_result,
+            self.contour_id, self.from_in_to_out, self.from_shaped_result,
+            self.id, self.interior_to_left, self.operand_id,
+            self.overlap_below_coverage, self.right, self.start,
+            self.start_id
+        ) = (
+            below_coverage, below_event_from_shaped_result, contour_id,
+            from_in_to_out, from_shaped_result, id_, interior_to_left,
+            operand_id, overlap_below_coverage, right, start, start_id
+        )
+
+    __repr__ = recursive_repr()(generate_repr(__init__,
+                                              field_seeker=seekers.complex_))
+
+    @property
+    def above_coverage(self) -> int:
+        """
+        Returns number of operands which interiors
+        cover the region right above the segment.
+        """
+        return self.below_coverage + (1 if self.interior_to_left else -1)
+
+    @property
+    def end_id(self) -> int:
+        return self.opposite.start_id
+
+    @property
+    def is_vertical(self) -> bool:
+        return self.start.x == self.end.x
+
+    @property
+    def primary(self) -> 'LeftNaryHoleyEvent':
+        return self
+
+    def divide(self, point: Point) -> 'LeftNaryHoleyEvent':
+        tail = self.right.left = LeftNaryHoleyEvent(
+                point, self.right, self.operand_id, self.interior_to_left
+        )
+        self.right = RightShapedEvent(point, self)
+        return tail
+
+
+class LeftExpressionEvent(LeftNaryHoleyEvent):
+    __slots__ = 'below_operands', 'overlap_below_operands'
+
+    def __init__(
+            self,
+            start: Point,
+            right: Optional['RightShapedEvent'],
+            operand_id: int,
+            interior_to_left: bool,
+            *,
+            below_event_from_shaped_result: Optional[
+                'LeftExpressionEvent'
+            ] = None,
+            below_operands: int = 0,
+            contour_id: Optional[int] = None,
+            from_in_to_out: bool = False,
+            from_shaped_result: bool = False,
+            id_: int = UNDEFINED_INDEX,
+            overlap_below_operands: int = 0,
+            start_id: int = UNDEFINED_INDEX
+    ) -> None:
+        super().__init__(
+                start, right, operand_id, interior_to_left,
+                below_event_from_shaped_result=below_event_from_shaped_result,
+                contour_id=contour_id, from_in_to_out=from_in_to_out,
+                from_shaped_result=from_shaped_result, id_=id_,
+                start_id=start_id
+        )
+        self.below_operands, self.overlap_below_operands = (
+            below_operands, overlap_below_operands
+        )
+
+    __repr__ = recursive_repr()(generate_repr(__init__,
+                                              field_seeker=seekers.complex_))
+
+    @property
+    def above_operands(self) -> int:
+        """
+        Returns bitmask of operands which interiors
+        cover the region right above the segment.
+        """
+        return self.below_operands ^ (1 << self.operand_id)
+
+    def divide(self, point: Point) -> 'LeftExpressionEvent':
+        tail = self.right.left = LeftExpressionEvent(
+                point, self.right, self.operand_id, self.interior_to_left
+        )
+        self.right = RightShapedEvent(point, self)
+        return tail
+
+
+class LeftLayerEvent(LeftNaryHoleyEvent):
+    __slots__ = 'above_polygons_ids', 'overlap_below_polygons_ids'
+
+    def __init__(
+            self,
+            start: Point,
+            right: Optional['RightShapedEvent'],
+            operand_id: int,
+            interior_to_left: bool,
+            *,
+            above_polygons_ids: Tuple[int, int] = (UNDEFINED_INDEX,
+                                                   UNDEFINED_INDEX),
+            below_coverage: int = 0,
+            below_event_from_shaped_result: Optional[
+                'LeftLayerEvent'
+            ] = None,
+            contour_id: Optional[int] = None,
+            from_in_to_out: bool = False,
+            from_shaped_result: bool = False,
+            id_: int = UNDEFINED_INDEX,
+            overlap_below_coverage: int = 0,
+            overlap_below_polygons_ids: Tuple[int, int] = (UNDEFINED_INDEX,
+                                                           UNDEFINED_INDEX),
+            start_id: int = UNDEFINED_INDEX
+    ) -> None:
+        super().__init__(
+                start, right, operand_id, interior_to_left,
+                below_coverage=below_coverage,
+                below_event_from_shaped_result=below_event_from_shaped_result,
+                contour_id=contour_id, from_in_to_out=from_in_to_out,
+                from_shaped_result=from_shaped_result, id_=id_,
+                overlap_below_coverage=overlap_below_coverage,
+                start_id=start_id
+        )
+        self.above_polygons_ids, self.overlap_below_polygons_ids = (
+            above_polygons_ids, overlap_below_polygons_ids
+        )
+
+    __repr__ = recursive_repr()(generate_repr(__init__,
+                                              field_seeker=seekers.complex_))
+
+    def divide(self, point: Point) -> 'LeftLayerEvent':
+        tail = self.right.left = LeftLayerEvent(
+                point, self.right, self.operand_id, self.interior_to_left
+        )
+        self.right = RightShapedEvent(point, self)
+        return tail
+
+
+class LeftNaryDifferenceEvent(LeftNaryHoleyEvent):
+    __slots__ = 'below_minuend_coverage', 'overlap_below_minuend_coverage'
+
+    def __init__(
+            self,
+            start: Point,
+            right: Optional['RightShapedEvent'],
+            operand_id: int,
+            interior_to_left: bool,
+            *,
+            below_coverage: int = 0,
+            below_event_from_shaped_result: Optional[
+                'LeftNaryDifferenceEvent'
+            ] = None,
+            below_minuend_coverage: int = 0,
+            contour_id: Optional[int] = None,
+            from_in_to_out: bool = False,
+            from_shaped_result: bool = False,
+            id_: int = UNDEFINED_INDEX,
+            overlap_below_coverage: int = 0,
+            overlap_below_minuend_coverage: int = 0,
+            start_id: int = UNDEFINED_INDEX
+    ) -> None:
+        super().__init__(
+                start, right, operand_id, interior_to_left,
+                below_coverage=below_coverage,
+                below_event_from_shaped_result=below_event_from_shaped_result,
+                contour_id=contour_id, from_in_to_out=from_in_to_out,
+                from_shaped_result=from_shaped_result, id_=id_,
+                overlap_below_coverage=overlap_below_coverage,
+                start_id=start_id
+        )
+        self.below_minuend_coverage, self.overlap_below_minuend_coverage = (
+            below_minuend_coverage, overlap_below_minuend_coverage
+        )
+
+    __repr__ = recursive_repr()(generate_repr(__init__,
+                                              field_seeker=seekers.complex_))
+
+    @property
+    def above_minuend_coverage(self) -> int:
+        """
+        Returns number of minuend's polygons
+        which interiors cover the region right above the segment.
+        """
+        return (self.below_minuend_coverage
+                + (1 if self.interior_to_left else -1)
+                if self.operand_id == MINUEND_OPERAND_ID
+                else self.below_minuend_coverage)
+
+    def divide(self, point: Point) -> 'LeftNaryDifferenceEvent':
+        tail = self.right.left = LeftNaryDifferenceEvent(
+                point, self.right, self.operand_id, self.interior_to_left
+        )
+        self.right = RightShapedEvent(point, self)
+        return tail
+
+
+LeftShapedEvent = TypeVar('LeftShapedEvent', LeftHolelessEvent, LeftHoleyEvent,
+                          LeftNaryHoleyEvent)
 
 
 class RightShapedEvent(RightEvent):
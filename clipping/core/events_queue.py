@@ -2,6 +2,7 @@ from functools import partial
 from typing import (Callable,
                     Generic,
                     Iterable,
+                    Optional,
                     Type,
                     Union,
                     cast)
@@ -9,8 +10,9 @@ from typing import (Callable,
 from ground.base import (Context,
                          Orientation,
                          Relation)
-from ground.hints import Point
-from prioq.base import PriorityQueue
+from ground.hints import (Point,
+                          Scalar,
+                          Segment)
 from reprit.base import generate_repr
 
 from .enums import OverlapKind
@@ -19,6 +21,7 @@ from .event import (LeftBinaryEvent,
                     LeftHoleyEvent,
                     LeftMixedEvent,
                     LeftNaryEvent,
+                    LeftNaryHoleyEvent,
                     LeftShapedEvent,
                     RightBinaryEvent,
                     RightMixedEvent,
@@ -26,9 +29,12 @@ from .event import (LeftBinaryEvent,
                     RightShapedEvent)
 from .hints import (Orienteer,
                     SegmentEndpoints)
+from .tracing import (current_trace,
+                      to_presorted_queue)
 
 BinaryEvent = Union[LeftBinaryEvent, RightBinaryEvent]
 NaryEvent = Union[LeftNaryEvent, RightNaryEvent]
+NaryHoleyEvent = Union[LeftNaryHoleyEvent, RightShapedEvent]
 MixedEvent = Union[LeftMixedEvent, RightMixedEvent]
 ShapedEvent = Union[LeftShapedEvent, RightShapedEvent]
 
@@ -72,6 +78,45 @@ class BinaryEventsQueueKey:
                               else Orientation.CLOCKWISE)))
 
 
+class NaryHoleyEventsQueueKey:
+    __slots__ = 'event', 'orienteer'
+
+    def __init__(self, orienteer: Orienteer, event: NaryHoleyEvent) -> None:
+        self.orienteer, self.event = orienteer, event
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'NaryHoleyEventsQueueKey') -> bool:
+        event, other_event = self.event, other.event
+        start, other_start = event.start, other_event.start
+        if start.x != other_start.x:
+            # different x-coordinate,
+            # the event with lower x-coordinate is processed first
+            return start.x < other_start.x
+        elif start.y != other_start.y:
+            # different points, but same x-coordinate,
+            # the event with lower y-coordinate is processed first
+            return start.y < other_start.y
+        elif event.is_left is not other_event.is_left:
+            # same start, but one is a left endpoint
+            # and the other a right endpoint,
+            # the right endpoint is processed first
+            return not event.is_left
+        # same start, both events are left endpoints
+        # or both are right endpoints
+        else:
+            other_end_orientation = self.orienteer(event.start, event.end,
+                                                   other_event.end)
+            # the lowest segment is processed first
+            return (event.primary.operand_id < other_event.primary.operand_id
+                    if other_end_orientation is Orientation.COLLINEAR
+                    else (other_end_orientation
+                          # the lowest segment is processed first
+                          is (Orientation.COUNTERCLOCKWISE
+                              if event.is_left
+                              else Orientation.CLOCKWISE)))
+
+
 class NaryEventsQueueKey:
     __slots__ = 'event', 'orienteer'
 
@@ -107,12 +152,19 @@ class NaryEventsQueueKey:
 
 
 class LinearEventsQueue:
-    __slots__ = 'context', '_queue'
+    __slots__ = ('context', 'snap_tolerance', '_division_points',
+                 '_previous_left_event', '_queue', '_sweep_event', '_trace')
 
-    def __init__(self, context: Context) -> None:
-        self.context = context
-        self._queue = PriorityQueue(key=partial(BinaryEventsQueueKey,
-                                                context.angle_orientation))
+    def __init__(self,
+                 context: Context,
+                 snap_tolerance: Optional[Scalar] = None) -> None:
+        self.context, self.snap_tolerance = context, snap_tolerance
+        self._queue = to_presorted_queue(partial(BinaryEventsQueueKey,
+                                                 context.angle_orientation))
+        self._division_points = set()  # type: Set[Point]
+        self._previous_left_event = None  # type: Optional[LeftBinaryEvent]
+        self._sweep_event = None  # type: Optional[BinaryEvent]
+        self._trace = current_trace()
 
     __repr__ = generate_repr(__init__)
 
@@ -127,11 +179,13 @@ class LinearEventsQueue:
                             below_event: LeftBinaryEvent,
                             event: LeftBinaryEvent) -> None:
         relation = self.context.segments_relation(below_event, event)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
         if relation is Relation.CROSS or relation is Relation.TOUCH:
             if (event.start != below_event.start
                     and event.end != below_event.end):
                 # segments do not intersect at endpoints
-                point = self.context.segments_intersection(below_event, event)
+                point = self._to_intersection(below_event, event)
                 if point != below_event.start and point != below_event.end:
                     self._divide_segment(below_event, point)
                 if point != event.start and point != event.end:
@@ -172,7 +226,14 @@ class LinearEventsQueue:
                 self._divide_segment(start_min, start_max.start)
 
     def pop(self) -> BinaryEvent:
-        return self._queue.pop()
+        event, previous_event = self._queue.pop(), self._sweep_event
+        if (previous_event is None
+                or previous_event.start != event.start):
+            self._previous_left_event = None
+        elif previous_event.is_left:
+            self._previous_left_event = previous_event
+        self._sweep_event = event
+        return event
 
     def register(self,
                  segments_endpoints: Iterable[SegmentEndpoints],
@@ -185,18 +246,48 @@ class LinearEventsQueue:
             events_queue.push(event.opposite)
 
     def _divide_segment(self, event: LeftBinaryEvent, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
+        if self.snap_tolerance is not None:
+            self._division_points.add(point)
         tail = event.divide(point)
         self._queue.push(tail)
         self._queue.push(event.opposite)
 
+    def _to_intersection(self,
+                         below_event: LeftBinaryEvent,
+                         event: LeftBinaryEvent) -> Point:
+        point = self.context.segments_intersection(below_event, event)
+        if (self.snap_tolerance is None
+                or below_event is not self._sweep_event):
+            # only the segment starting at the current sweep point
+            # is divided at snapped point,
+            # so already swept parts of segments stay intact
+            return point
+        result = snap_intersection(point, below_event, event,
+                                   self.snap_tolerance, self.context)
+        previous_left_event = self._previous_left_event
+        # divided segment should stay above the segments
+        # which have the same start & are processed before it
+        # and should not pass through points of other segments' divisions
+        return (result
+                if (result not in self._division_points
+                    and (previous_left_event is None
+                         or (self.context.angle_orientation(
+                                 previous_left_event.start,
+                                 previous_left_event.end, result)
+                             is Orientation.COUNTERCLOCKWISE)))
+                else point)
+
 
 class MixedEventsQueue:
-    __slots__ = 'context', '_queue'
+    __slots__ = 'context', '_queue', '_trace'
 
     def __init__(self, context: Context) -> None:
         self.context = context
-        self._queue = PriorityQueue(key=partial(BinaryEventsQueueKey,
-                                                context.angle_orientation))
+        self._queue = to_presorted_queue(partial(BinaryEventsQueueKey,
+                                                 context.angle_orientation))
+        self._trace = current_trace()
 
     @property
     def key(self) -> Callable[[MixedEvent], BinaryEventsQueueKey]:
@@ -211,6 +302,8 @@ class MixedEventsQueue:
                             below_event: LeftMixedEvent,
                             event: LeftMixedEvent) -> bool:
         relation = self.context.segments_relation(below_event, event)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
         if relation is Relation.CROSS or relation is Relation.TOUCH:
             if (event.start != below_event.start
                     and event.end != below_event.end):
@@ -275,18 +368,21 @@ class MixedEventsQueue:
             push(event.opposite)
 
     def _divide_segment(self, event: LeftMixedEvent, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
         tail = event.divide(point)
         self._queue.push(tail)
         self._queue.push(event.opposite)
 
 
 class NaryEventsQueue:
-    __slots__ = 'context', '_queue'
+    __slots__ = 'context', '_queue', '_trace'
 
     def __init__(self, context: Context) -> None:
         self.context = context
-        self._queue = PriorityQueue(key=partial(NaryEventsQueueKey,
-                                                context.angle_orientation))
+        self._queue = to_presorted_queue(partial(NaryEventsQueueKey,
+                                                 context.angle_orientation))
+        self._trace = current_trace()
 
     __repr__ = generate_repr(__init__)
 
@@ -301,6 +397,8 @@ class NaryEventsQueue:
                             below_event: LeftNaryEvent,
                             event: LeftNaryEvent) -> None:
         relation = self.context.segments_relation(below_event, event)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
         if relation is Relation.CROSS or relation is Relation.TOUCH:
             if (event.start != below_event.start
                     and event.end != below_event.end):
@@ -353,20 +451,123 @@ class NaryEventsQueue:
             push(event.opposite)
 
     def _divide_segment(self, event: LeftNaryEvent, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
         tail = LeftNaryEvent.divide(event, point)
         self._queue.push(tail)
         self._queue.push(event.opposite)
 
 
+class NaryHoleyEventsQueue:
+    __slots__ = 'context', 'event_cls', '_queue', '_trace'
+
+    def __init__(self,
+                 context: Context,
+                 event_cls: Type[LeftNaryHoleyEvent] = LeftNaryHoleyEvent
+                 ) -> None:
+        self.context, self.event_cls = context, event_cls
+        self._queue = to_presorted_queue(partial(NaryHoleyEventsQueueKey,
+                                                 context.angle_orientation))
+        self._trace = current_trace()
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    @property
+    def key(self) -> Callable[[NaryHoleyEvent], NaryHoleyEventsQueueKey]:
+        return self._queue.key
+
+    def detect_intersection(self,
+                            below_event: LeftNaryHoleyEvent,
+                            event: LeftNaryHoleyEvent) -> bool:
+        relation = self.context.segments_relation(below_event, event)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
+        if relation is Relation.CROSS or relation is Relation.TOUCH:
+            if (event.start != below_event.start
+                    and event.end != below_event.end):
+                # segments do not intersect at endpoints
+                point = self.context.segments_intersection(below_event, event)
+                if point != below_event.start and point != below_event.end:
+                    self._divide_segment(below_event, point)
+                if point != event.start and point != event.end:
+                    self._divide_segment(event, point)
+        elif relation is not Relation.DISJOINT:
+            # segments overlap
+            if below_event.operand_id == event.operand_id:
+                raise ValueError('Edges of the same geometry '
+                                 'should not overlap.')
+            starts_equal = below_event.start == event.start
+            if starts_equal:
+                start_min = start_max = None
+            elif self.key(event) < self.key(below_event):
+                start_min, start_max = event, below_event
+            else:
+                start_min, start_max = below_event, event
+            ends_equal = event.end == below_event.end
+            if ends_equal:
+                end_min = end_max = None
+            elif self.key(event.opposite) < self.key(below_event.opposite):
+                end_min, end_max = event.opposite, below_event.opposite
+            else:
+                end_min, end_max = below_event.opposite, event.opposite
+            if starts_equal:
+                # both line segments are equal or share the left endpoint
+                if not ends_equal:
+                    self._divide_segment(end_max.opposite, end_min.start)
+                return True
+            elif ends_equal:
+                # the line segments share the right endpoint
+                self._divide_segment(start_min, start_max.start)
+            elif start_min is end_max.opposite:
+                # one line segment includes the other one
+                self._divide_segment(start_min, end_min.start)
+                self._divide_segment(start_min, start_max.start)
+            else:
+                # no line segment includes the other one
+                self._divide_segment(start_max, end_min.start)
+                self._divide_segment(start_min, start_max.start)
+        return False
+
+    def pop(self) -> NaryHoleyEvent:
+        return self._queue.pop()
+
+    def register(self,
+                 segments_endpoints: Iterable[SegmentEndpoints],
+                 operand_id: int) -> None:
+        event_cls, push = self.event_cls, self._queue.push
+        for segment_endpoints in segments_endpoints:
+            event = event_cls.from_endpoints(segment_endpoints, operand_id)
+            push(event)
+            push(event.opposite)
+
+    def _divide_segment(self, event: LeftNaryHoleyEvent, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
+        tail = event.divide(point)
+        self._queue.push(tail)
+        self._queue.push(event.opposite)
+
+
 class ShapedEventsQueue(Generic[LeftShapedEvent]):
-    __slots__ = 'context', 'event_cls', '_queue'
+    __slots__ = ('context', 'event_cls', 'snap_tolerance',
+                 '_division_points', '_previous_left_event', '_queue',
+                 '_sweep_event', '_trace')
 
     def __init__(self,
                  event_cls: Type[LeftShapedEvent],
-                 context: Context) -> None:
-        self.event_cls, self.context = event_cls, context
-        self._queue = PriorityQueue(key=partial(BinaryEventsQueueKey,
-                                                context.angle_orientation))
+                 context: Context,
+                 snap_tolerance: Optional[Scalar] = None) -> None:
+        self.context, self.event_cls = context, event_cls
+        self.snap_tolerance = snap_tolerance
+        self._queue = to_presorted_queue(partial(BinaryEventsQueueKey,
+                                                 context.angle_orientation))
+        self._division_points = set()  # type: Set[Point]
+        self._previous_left_event = None  # type: Optional[LeftShapedEvent]
+        self._sweep_event = None  # type: Optional[ShapedEvent]
+        self._trace = current_trace()
 
     __repr__ = generate_repr(__init__)
 
@@ -381,11 +582,13 @@ class ShapedEventsQueue(Generic[LeftShapedEvent]):
                             below_event: LeftShapedEvent,
                             event: LeftShapedEvent) -> bool:
         relation = self.context.segments_relation(below_event, event)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
         if relation is Relation.CROSS or relation is Relation.TOUCH:
             if (event.start != below_event.start
                     and event.end != below_event.end):
                 # segments do not intersect at endpoints
-                point = self.context.segments_intersection(below_event, event)
+                point = self._to_intersection(below_event, event)
                 if point != below_event.start and point != below_event.end:
                     self._divide_segment(below_event, point)
                 if point != event.start and point != event.end:
@@ -433,7 +636,14 @@ class ShapedEventsQueue(Generic[LeftShapedEvent]):
         return False
 
     def pop(self) -> ShapedEvent:
-        return self._queue.pop()
+        event, previous_event = self._queue.pop(), self._sweep_event
+        if (previous_event is None
+                or previous_event.start != event.start):
+            self._previous_left_event = None
+        elif previous_event.is_left:
+            self._previous_left_event = previous_event
+        self._sweep_event = event
+        return event
 
     def register(self,
                  segments_endpoints: Iterable[SegmentEndpoints],
@@ -446,14 +656,79 @@ class ShapedEventsQueue(Generic[LeftShapedEvent]):
             push(event.opposite)
 
     def _divide_segment(self, event: LeftShapedEvent, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
+        if self.snap_tolerance is not None:
+            self._division_points.add(point)
         tail = event.divide(point)
         self._queue.push(tail)
         self._queue.push(event.opposite)
 
-
-HolelessEventsQueue = cast(Callable[[Context],
-                                    ShapedEventsQueue[LeftHolelessEvent]],
+    def _to_intersection(self,
+                         below_event: LeftShapedEvent,
+                         event: LeftShapedEvent) -> Point:
+        point = self.context.segments_intersection(below_event, event)
+        if (self.snap_tolerance is None
+                or below_event is not self._sweep_event):
+            # only the segment starting at the current sweep point
+            # is divided at snapped point,
+            # so already swept parts of segments stay intact
+            return point
+        result = snap_intersection(point, below_event, event,
+                                   self.snap_tolerance, self.context)
+        previous_left_event = self._previous_left_event
+        # divided segment should stay above the segments
+        # which have the same start & are processed before it
+        # and should not pass through points of other segments' divisions
+        return (result
+                if (result not in self._division_points
+                    and (previous_left_event is None
+                         or (self.context.angle_orientation(
+                                 previous_left_event.start,
+                                 previous_left_event.end, result)
+                             is Orientation.COUNTERCLOCKWISE)))
+                else point)
+
+
+HolelessEventsQueue = cast(Callable[..., ShapedEventsQueue[LeftHolelessEvent]],
                            partial(ShapedEventsQueue, LeftHolelessEvent))
-HoleyEventsQueue = cast(Callable[[Context],
-                                 ShapedEventsQueue[LeftHoleyEvent]],
+HoleyEventsQueue = cast(Callable[..., ShapedEventsQueue[LeftHoleyEvent]],
                         partial(ShapedEventsQueue, LeftHoleyEvent))
+
+
+def snap_intersection(point: Point,
+                      below: Segment,
+                      above: Segment,
+                      snap_tolerance: Scalar,
+                      context: Context) -> Point:
+    """
+    Snaps intersection point of segments to the right endpoint
+    of the segment which lies above the other one before the intersection
+    if they differ by no more than given tolerance along each axis,
+    so no near-degenerate subsegments are produced.
+
+    The endpoint is used only if the segment lying below
+    divided at it keeps its direction & its order
+    relative to the segment above,
+    so the subsegments neither go backwards nor cross the segment above
+    and bend towards the segments lying below which are checked next,
+    and if it is not close to the end of the segment lying below,
+    so the segments which share that end are not crossed.
+    """
+    endpoint = above.end
+    return (endpoint
+            if (point < endpoint < below.end
+                and _are_points_close(endpoint, point, snap_tolerance)
+                and not _are_points_close(endpoint, below.end,
+                                          snap_tolerance)
+                and (context.angle_orientation(above.start, above.end,
+                                               below.start)
+                     is not Orientation.COLLINEAR))
+            else point)
+
+
+def _are_points_close(first: Point,
+                      second: Point,
+                      tolerance: Scalar) -> bool:
+    return (abs(first.x - second.x) <= tolerance
+            and abs(first.y - second.y) <= tolerance)
@@ -0,0 +1,397 @@
+from array import array
+from functools import partial
+from typing import (Callable,
+                    Iterable,
+                    List,
+                    Sequence)
+
+from ground.base import (Context,
+                         Orientation,
+                         Relation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+from .enums import OverlapKind
+from .hints import (Orienteer,
+                    SegmentEndpoints)
+from .tracing import (current_trace,
+                      to_presorted_queue)
+
+
+class EventsStore:
+    """
+    Events of shaped operands' edges kept in parallel columns
+    instead of separate objects for sweeps of area measures.
+
+    Events are referred by integer ids:
+    left events have even ids, right events have odd ones,
+    flags of segment are shared by its events
+    and stored at index of its left event's id halved.
+    """
+    __slots__ = ('context', 'from_first_operand', 'from_shaped_result',
+                 'interior_to_left', 'opposites', 'other_interior_to_left',
+                 'overlap_kinds', 'starts')
+
+    def __init__(self, context: Context) -> None:
+        """
+        Initializes empty store.
+
+        :param context: geometric context.
+        """
+        self.context = context
+        self.starts = []  # type: List[Point]
+        self.opposites = array('Q')
+        self.from_first_operand, self.from_shaped_result = (array('B'),
+                                                            array('B'))
+        self.interior_to_left, self.other_interior_to_left = (array('B'),
+                                                              array('B'))
+        self.overlap_kinds = array('B')
+
+    __repr__ = generate_repr(__init__)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def divide(self, event_id: int, point: Point) -> int:
+        """
+        Divides the segment of left event at given break point
+        and returns id of the tail's left event.
+        """
+        opposites, segment_id = self.opposites, event_id >> 1
+        right_id = opposites[event_id]
+        tail_id = self._push(point, right_id, point, event_id,
+                             self.from_first_operand[segment_id],
+                             self.interior_to_left[segment_id])
+        opposites[right_id], opposites[event_id] = tail_id, tail_id + 1
+        return tail_id
+
+    def end(self, event_id: int) -> Point:
+        return self.starts[self.opposites[event_id]]
+
+    def register(self,
+                 segment_endpoints: SegmentEndpoints,
+                 from_first_operand: bool) -> int:
+        """
+        Registers segment with endpoints and returns id of its left event.
+        """
+        start, end = segment_endpoints
+        interior_to_left = True
+        if start > end:
+            start, end = end, start
+            interior_to_left = False
+        left_id = len(self.starts)
+        return self._push(start, left_id + 1, end, left_id,
+                          from_first_operand, interior_to_left)
+
+    def to_left(self, event_id: int) -> int:
+        return (event_id
+                if is_left_event(event_id)
+                else self.opposites[event_id])
+
+    def _push(self,
+              left_start: Point,
+              left_opposite: int,
+              right_start: Point,
+              right_opposite: int,
+              from_first_operand: bool,
+              interior_to_left: bool) -> int:
+        result = len(self.starts)
+        self.starts += (left_start, right_start)
+        self.opposites.extend((left_opposite, right_opposite))
+        self.from_first_operand.append(from_first_operand)
+        self.from_shaped_result.append(False)
+        self.interior_to_left.append(interior_to_left)
+        self.other_interior_to_left.append(False)
+        self.overlap_kinds.append(OverlapKind.NONE)
+        return result
+
+
+def is_left_event(event_id: int) -> bool:
+    return not event_id & 1
+
+
+class EventView:
+    """
+    View of the event from store
+    with the same flags' interface as ``LeftHoleyEvent`` has.
+    """
+    __slots__ = 'id', 'store'
+
+    def __init__(self, store: EventsStore, id_: int) -> None:
+        self.id, self.store = id_, store
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def end(self) -> Point:
+        return self.store.end(self.id)
+
+    @property
+    def from_first_operand(self) -> bool:
+        return bool(self.store.from_first_operand[self._segment_id])
+
+    @property
+    def from_shaped_result(self) -> bool:
+        return bool(self.store.from_shaped_result[self._segment_id])
+
+    @property
+    def inside(self) -> bool:
+        return self.other_interior_to_left and not self.is_overlap
+
+    @property
+    def interior_to_left(self) -> bool:
+        return bool(self.store.interior_to_left[self._segment_id])
+
+    @property
+    def is_common_polyline_component(self) -> bool:
+        return self.overlap_kind is OverlapKind.DIFFERENT_ORIENTATION
+
+    @property
+    def is_common_region_boundary(self) -> bool:
+        return self.overlap_kind is OverlapKind.SAME_ORIENTATION
+
+    @property
+    def is_left(self) -> bool:
+        return is_left_event(self.id)
+
+    @property
+    def is_overlap(self) -> bool:
+        return self.overlap_kind is not OverlapKind.NONE
+
+    @property
+    def other_interior_to_left(self) -> bool:
+        return bool(self.store.other_interior_to_left[self._segment_id])
+
+    @property
+    def outside(self) -> bool:
+        return not self.other_interior_to_left and not self.is_overlap
+
+    @property
+    def overlap_kind(self) -> OverlapKind:
+        return OverlapKind(self.store.overlap_kinds[self._segment_id])
+
+    @property
+    def start(self) -> Point:
+        return self.store.starts[self.id]
+
+    @property
+    def _segment_id(self) -> int:
+        return self.store.to_left(self.id) >> 1
+
+
+class EventsStoreQueueKey:
+    __slots__ = 'event', 'orienteer', 'store'
+
+    def __init__(self,
+                 store: EventsStore,
+                 orienteer: Orienteer,
+                 event: int) -> None:
+        self.event, self.orienteer, self.store = event, orienteer, store
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'EventsStoreQueueKey') -> bool:
+        store = self.store
+        event, other_event = self.event, other.event
+        start, other_start = store.starts[event], store.starts[other_event]
+        if start.x != other_start.x:
+            # different x-coordinate,
+            # the event with lower x-coordinate is processed first
+            return start.x < other_start.x
+        elif start.y != other_start.y:
+            # different points, but same x-coordinate,
+            # the event with lower y-coordinate is processed first
+            return start.y < other_start.y
+        is_left = is_left_event(event)
+        if is_left is not is_left_event(other_event):
+            # same start, but one is a left endpoint
+            # and the other a right endpoint,
+            # the right endpoint is processed first
+            return not is_left
+        # same start, both events are left endpoints
+        # or both are right endpoints
+        else:
+            other_end_orientation = self.orienteer(start, store.end(event),
+                                                   store.end(other_event))
+            # the lowest segment is processed first
+            return (bool(store.from_first_operand[store.to_left(other_event)
+                                                  >> 1])
+                    if other_end_orientation is Orientation.COLLINEAR
+                    else (other_end_orientation
+                          # the lowest segment is processed first
+                          is (Orientation.COUNTERCLOCKWISE
+                              if is_left
+                              else Orientation.CLOCKWISE)))
+
+
+class EventsStoreQueue:
+    __slots__ = 'store', '_queue', '_trace'
+
+    def __init__(self, store: EventsStore) -> None:
+        self.store = store
+        self._queue = to_presorted_queue(
+                partial(EventsStoreQueueKey, store,
+                        store.context.angle_orientation),
+                presort=_sort_events
+        )
+        self._trace = current_trace()
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._queue)
+
+    @property
+    def key(self) -> Callable[[int], EventsStoreQueueKey]:
+        return self._queue.key
+
+    def detect_intersection(self, below_event: int, event: int) -> bool:
+        store = self.store
+        context, opposites, starts = (store.context, store.opposites,
+                                      store.starts)
+        below_segment, segment = (EventView(store, below_event),
+                                  EventView(store, event))
+        relation = context.segments_relation(below_segment, segment)
+        if self._trace is not None:
+            self._trace.relations[relation] += 1
+        start, end = starts[event], store.end(event)
+        below_start, below_end = starts[below_event], store.end(below_event)
+        if relation is Relation.CROSS or relation is Relation.TOUCH:
+            if start != below_start and end != below_end:
+                # segments do not intersect at endpoints
+                point = context.segments_intersection(below_segment, segment)
+                if point != below_start and point != below_end:
+                    self._divide_segment(below_event, point)
+                if point != start and point != end:
+                    self._divide_segment(event, point)
+        elif relation is not Relation.DISJOINT:
+            # segments overlap
+            segment_id, below_segment_id = event >> 1, below_event >> 1
+            if (store.from_first_operand[below_segment_id]
+                    == store.from_first_operand[segment_id]):
+                raise ValueError('Edges of the same geometry '
+                                 'should not overlap.')
+            starts_equal = below_start == start
+            if starts_equal:
+                start_min = start_max = None
+            elif self.key(event) < self.key(below_event):
+                start_min, start_max = event, below_event
+            else:
+                start_min, start_max = below_event, event
+            ends_equal = end == below_end
+            if ends_equal:
+                end_min = end_max = None
+            elif self.key(opposites[event]) < self.key(opposites[below_event]):
+                end_min, end_max = opposites[event], opposites[below_event]
+            else:
+                end_min, end_max = opposites[below_event], opposites[event]
+            if starts_equal:
+                # both line segments are equal or share the left endpoint
+                store.overlap_kinds[below_segment_id] = (
+                    store.overlap_kinds[segment_id]
+                ) = (OverlapKind.SAME_ORIENTATION
+                     if (store.interior_to_left[segment_id]
+                         == store.interior_to_left[below_segment_id])
+                     else OverlapKind.DIFFERENT_ORIENTATION)
+                if not ends_equal:
+                    self._divide_segment(opposites[end_max], starts[end_min])
+                return True
+            elif ends_equal:
+                # the line segments share the right endpoint
+                self._divide_segment(start_min, starts[start_max])
+            elif start_min == opposites[end_max]:
+                # one line segment includes the other one
+                self._divide_segment(start_min, starts[end_min])
+                self._divide_segment(start_min, starts[start_max])
+            else:
+                # no line segment includes the other one
+                self._divide_segment(start_max, starts[end_min])
+                self._divide_segment(start_min, starts[start_max])
+        return False
+
+    def pop(self) -> int:
+        return self._queue.pop()
+
+    def register(self,
+                 segments_endpoints: Iterable[SegmentEndpoints],
+                 from_first_operand: bool) -> None:
+        push, store = self._queue.push, self.store
+        for segment_endpoints in segments_endpoints:
+            event = store.register(segment_endpoints, from_first_operand)
+            push(event)
+            push(event + 1)
+
+    def _divide_segment(self, event: int, point: Point) -> None:
+        if self._trace is not None:
+            self._trace.divisions += 1
+        tail = self.store.divide(event, point)
+        self._queue.push(tail)
+        self._queue.push(self.store.opposites[event])
+
+
+class EventsStoreSweepLineKey:
+    __slots__ = 'event', 'orienteer', 'store'
+
+    def __init__(self,
+                 store: EventsStore,
+                 orienteer: Orienteer,
+                 event: int) -> None:
+        self.event, self.orienteer, self.store = event, orienteer, store
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'EventsStoreSweepLineKey') -> bool:
+        """
+        Checks if the segment (or at least the point) associated with event
+        is lower than other's.
+        """
+        event, other_event = self.event, other.event
+        if event == other_event:
+            return False
+        store = self.store
+        start, other_start = store.starts[event], store.starts[other_event]
+        end, other_end = store.end(event), store.end(other_event)
+        other_start_orientation = self.orienteer(start, end, other_start)
+        other_end_orientation = self.orienteer(start, end, other_end)
+        if other_start_orientation is other_end_orientation:
+            if other_start_orientation is not Orientation.COLLINEAR:
+                # other segment fully lies on one side
+                return other_start_orientation is Orientation.COUNTERCLOCKWISE
+            # segments are collinear
+            from_first_operand = store.from_first_operand[event >> 1]
+            if (from_first_operand
+                    != store.from_first_operand[other_event >> 1]):
+                return bool(from_first_operand)
+            elif start.x == other_start.x:
+                if start.y != other_start.y:
+                    # segments are vertical
+                    return start.y < other_start.y
+                # segments have same start
+                elif end.y != other_end.y:
+                    return end.y < other_end.y
+                else:
+                    # segments are horizontal
+                    return end.x < other_end.x
+            elif start.y != other_start.y:
+                return start.y < other_start.y
+            else:
+                # segments are horizontal
+                return start.x < other_start.x
+        start_orientation = self.orienteer(other_start, other_end, start)
+        end_orientation = self.orienteer(other_start, other_end, end)
+        if start_orientation is end_orientation:
+            return start_orientation is Orientation.CLOCKWISE
+        elif other_start_orientation is Orientation.COLLINEAR:
+            return other_end_orientation is Orientation.COUNTERCLOCKWISE
+        elif start_orientation is Orientation.COLLINEAR:
+            return end_orientation is Orientation.CLOCKWISE
+        elif end_orientation is Orientation.COLLINEAR:
+            return start_orientation is Orientation.CLOCKWISE
+        else:
+            return other_start_orientation is Orientation.COUNTERCLOCKWISE
+
+
+def _sort_events(events: Sequence[int],
+                 key: Callable[[int], EventsStoreQueueKey]) -> List[int]:
+    return sorted(events,
+                  key=key)
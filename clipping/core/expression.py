@@ -0,0 +1,242 @@
+from abc import (ABC,
+                 abstractmethod)
+from typing import (Callable,
+                    Dict,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union as Union_)
+
+from ground.base import (Context,
+                         get_context)
+from ground.hints import (Empty,
+                          Multipolygon,
+                          Polygon)
+from reprit.base import generate_repr
+
+from .holey import NaryExpression
+from .operands import MultipolygonOperand
+
+Shaped = Union_[Empty, Multipolygon, Polygon]
+
+
+class Expression(ABC):
+    """
+    Lazy boolean expression over multipolygons.
+
+    Expressions are combined with ``&`` (intersection), ``|`` (union),
+    ``-`` (difference) & ``^`` (symmetric difference)
+    and evaluated by a single sweep over edges of all distinct operands.
+    """
+    __slots__ = ()
+
+    def __and__(self, other: 'Expression') -> 'Expression':
+        return Intersection(self, other)
+
+    def __or__(self, other: 'Expression') -> 'Expression':
+        return Union(self, other)
+
+    def __sub__(self, other: 'Expression') -> 'Expression':
+        return Difference(self, other)
+
+    def __xor__(self, other: 'Expression') -> 'Expression':
+        return SymmetricDifference(self, other)
+
+    def evaluate(self, *, context: Optional[Context] = None) -> Shaped:
+        """
+        Returns result of the expression.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)``
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = edges_count + intersections_count``,
+        ``edges_count`` --- number of edges of distinct operands,
+        ``intersections_count`` --- number of intersections between
+        operands edges.
+
+        :param context: geometric context.
+        :returns: result of the expression.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour = context.contour_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> def to_square(min_x, min_y, size):
+        ...     return Multipolygon([Polygon(
+        ...         Contour([Point(min_x, min_y), Point(min_x + size, min_y),
+        ...                  Point(min_x + size, min_y + size),
+        ...                  Point(min_x, min_y + size)]), [])])
+        >>> first, second = Operand(to_square(0, 0, 4)), Operand(
+        ...     to_square(4, 0, 4))
+        >>> third, fourth = Operand(to_square(2, 0, 4)), Operand(
+        ...     to_square(2, 2, 4))
+        >>> ((first | second) - (third & fourth)).evaluate() == Polygon(
+        ...     Contour([Point(0, 0), Point(8, 0), Point(8, 4), Point(6, 4),
+        ...              Point(6, 2), Point(2, 2), Point(2, 4),
+        ...              Point(0, 4)]), [])
+        True
+        >>> (first ^ first).evaluate() is context.empty
+        True
+        """
+        if context is None:
+            context = get_context()
+        operands, predicate = compile_expression(self)
+        return NaryExpression([MultipolygonOperand(operand.value)
+                               for operand in operands],
+                              predicate, context).compute()
+
+    @abstractmethod
+    def __eq__(self, other: 'Expression') -> bool:
+        """Checks if expressions are structurally equal."""
+
+    @abstractmethod
+    def __hash__(self) -> int:
+        """Returns hash value of the expression."""
+
+
+class Operand(Expression):
+    """
+    Leaf of expressions.
+
+    Operands are identified by their values,
+    so the same multipolygon is swept once
+    regardless of number of its occurrences.
+    """
+    __slots__ = 'value',
+
+    def __init__(self, value: Multipolygon) -> None:
+        self.value = value
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: Expression) -> bool:
+        return (self.value is other.value
+                if isinstance(other, Operand)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+
+class BinaryExpression(Expression):
+    __slots__ = 'left', 'right'
+
+    def __init__(self, left: Expression, right: Expression) -> None:
+        self.left, self.right = left, right
+
+    __repr__ = generate_repr(__init__)
+
+    def __eq__(self, other: Expression) -> bool:
+        return (type(self) is type(other)
+                and self.left == other.left
+                and self.right == other.right
+                if isinstance(other, Expression)
+                else NotImplemented)
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.left, self.right))
+
+    @staticmethod
+    @abstractmethod
+    def combine(left: bool, right: bool) -> bool:
+        """Combines values of subexpressions."""
+
+
+class Difference(BinaryExpression):
+    __slots__ = ()
+
+    @staticmethod
+    def combine(left: bool, right: bool) -> bool:
+        return left and not right
+
+
+class Intersection(BinaryExpression):
+    __slots__ = ()
+
+    @staticmethod
+    def combine(left: bool, right: bool) -> bool:
+        return left and right
+
+
+class SymmetricDifference(BinaryExpression):
+    __slots__ = ()
+
+    @staticmethod
+    def combine(left: bool, right: bool) -> bool:
+        return left is not right
+
+
+class Union(BinaryExpression):
+    __slots__ = ()
+
+    @staticmethod
+    def combine(left: bool, right: bool) -> bool:
+        return left or right
+
+
+Instruction = Tuple[Callable[[bool, bool], bool], int, int]
+
+
+def compile_expression(expression: Expression
+                       ) -> Tuple[List[Operand], Callable[[int], bool]]:
+    """
+    Returns distinct operands of the expression
+    and predicate which evaluates the expression
+    on bitmask of operands by their indices.
+
+    Equal subexpressions are evaluated once per bitmask
+    and results are cached by bitmasks.
+    """
+    operands = []  # type: List[Operand]
+    instructions = []  # type: List[Union_[int, Instruction]]
+    indices = {}  # type: Dict[Expression, int]
+    _compile(expression, operands, instructions, indices)
+    cache = {}  # type: Dict[int, bool]
+
+    def predicate(bitmask: int) -> bool:
+        try:
+            return cache[bitmask]
+        except KeyError:
+            result = cache[bitmask] = _execute(instructions, bitmask)
+            return result
+
+    return operands, predicate
+
+
+def _compile(expression: Expression,
+             operands: List[Operand],
+             instructions: List[Union_[int, Instruction]],
+             indices: Dict[Expression, int]) -> int:
+    try:
+        return indices[expression]
+    except KeyError:
+        pass
+    if isinstance(expression, Operand):
+        instruction = len(operands)
+        operands.append(expression)
+    else:
+        instruction = (expression.combine,
+                       _compile(expression.left, operands, instructions,
+                                indices),
+                       _compile(expression.right, operands, instructions,
+                                indices))
+    result = indices[expression] = len(instructions)
+    instructions.append(instruction)
+    return result
+
+
+def _execute(instructions: Sequence[Union_[int, Instruction]],
+             bitmask: int) -> bool:
+    values = []  # type: List[bool]
+    for instruction in instructions:
+        if isinstance(instruction, int):
+            values.append(bool(bitmask >> instruction & 1))
+        else:
+            combine, left_index, right_index = instruction
+            values.append(combine(values[left_index], values[right_index]))
+    return values[-1]
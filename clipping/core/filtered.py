@@ -0,0 +1,114 @@
+from functools import lru_cache
+
+from ground.base import (Context,
+                         Mode,
+                         Orientation,
+                         get_context)
+from ground.hints import (Empty,
+                          Point)
+from reprit.base import generate_repr
+
+from .hints import Orienteer
+
+# unit roundoff of double precision floats
+EPSILON = 2. ** -53
+# upper bound of the relative error of the orientation determinant
+# computed from coordinates rounded to double precision floats
+ORIENTATION_ERROR_FACTOR = 16. * EPSILON
+# upper bound of the absolute error introduced by gradual underflow
+# per unit of coordinates' magnitude
+UNDERFLOW_ERROR = 2. ** -1070
+
+
+class FilteredContext(Context):
+    """
+    Context which evaluates orientations in floating point
+    falling back to exact arithmetic of the base context
+    only when the sign can not be certified by the error bound.
+    """
+    __slots__ = 'base', '_orienteer'
+
+    def __init__(self, base: Context) -> None:
+        super().__init__(box_cls=base.box_cls,
+                         contour_cls=base.contour_cls,
+                         empty_cls=base.empty_cls,
+                         mix_cls=base.mix_cls,
+                         multipoint_cls=base.multipoint_cls,
+                         multipolygon_cls=base.multipolygon_cls,
+                         multisegment_cls=base.multisegment_cls,
+                         point_cls=base.point_cls,
+                         polygon_cls=base.polygon_cls,
+                         segment_cls=base.segment_cls,
+                         mode=base.mode,
+                         sqrt=base.sqrt)
+        self.base = base
+        self._orienteer = to_filtered_orienteer(base.angle_orientation)
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def angle_orientation(self) -> Orienteer:
+        return self._orienteer
+
+    @property
+    def empty(self) -> Empty:
+        # results are checked against the empty geometry by identity
+        return self.base.empty
+
+
+def to_filtered_context(context: Context) -> Context:
+    """
+    Returns filtered context with the same geometries' types
+    if given context is the default exact one,
+    given context itself otherwise, so contexts chosen by users are kept.
+    """
+    return (_to_filtered_context(context)
+            if context is get_context()
+            else context)
+
+
+def to_filtered_orienteer(orienteer: Orienteer) -> Orienteer:
+    """
+    Returns orienteer which falls back to the given exact one
+    only for nearly collinear points.
+    """
+
+    def filtered_orienteer(vertex: Point,
+                           first_ray_point: Point,
+                           second_ray_point: Point) -> Orientation:
+        try:
+            vertex_x, vertex_y = float(vertex.x), float(vertex.y)
+            first_x, first_y = (float(first_ray_point.x),
+                                float(first_ray_point.y))
+            second_x, second_y = (float(second_ray_point.x),
+                                  float(second_ray_point.y))
+        except OverflowError:
+            return orienteer(vertex, first_ray_point, second_ray_point)
+        determinant = ((first_x - vertex_x) * (second_y - vertex_y)
+                       - (first_y - vertex_y) * (second_x - vertex_x))
+        first_dx_bound, first_dy_bound = (abs(first_x) + abs(vertex_x),
+                                          abs(first_y) + abs(vertex_y))
+        second_dx_bound, second_dy_bound = (abs(second_x) + abs(vertex_x),
+                                            abs(second_y) + abs(vertex_y))
+        error_bound = (ORIENTATION_ERROR_FACTOR
+                       * (first_dx_bound * second_dy_bound
+                          + first_dy_bound * second_dx_bound)
+                       + UNDERFLOW_ERROR
+                       * (first_dx_bound + first_dy_bound + second_dx_bound
+                          + second_dy_bound + 1.))
+        return (Orientation.COUNTERCLOCKWISE
+                if determinant > error_bound
+                else (Orientation.CLOCKWISE
+                      if determinant < -error_bound
+                      else orienteer(vertex, first_ray_point,
+                                     second_ray_point)))
+
+    return filtered_orienteer
+
+
+@lru_cache(maxsize=None)
+def _to_filtered_context(context: Context) -> Context:
+    return (FilteredContext(context)
+            if context.mode is Mode.EXACT
+            and not isinstance(context, FilteredContext)
+            else context)
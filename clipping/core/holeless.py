@@ -24,6 +24,7 @@ from .event import (UNDEFINED_INDEX,
                     RightShapedEvent as RightEvent,
                     events_to_connectivity)
 from .events_queue import HolelessEventsQueue as EventsQueue
+from .filtered import to_filtered_context
 from .hints import Region
 from .operands import HolelessOperand
 from .sweep_line import BinarySweepLine as SweepLine
@@ -55,6 +56,7 @@ class Operation(ABC):
         :param second: second operand.
         :param context: operation context.
         """
+        context = to_filtered_context(context)
         self.context, self.first, self.second = context, first, second
         self._events_queue = EventsQueue(context)
 
@@ -170,11 +172,19 @@ class CompleteIntersection(Operation):
         if bounding.disjoint_with(first_box, second_box):
             return context.empty
         self.first.regions = bounding.to_intersecting_regions(
-                second_box, self.first.regions, context)
+                second_box,
+                bounding.to_regions_intersecting_regions(
+                        self.first.regions, self.second.regions, context
+                ),
+                context)
         if not self.first.regions:
             return context.empty
         self.second.regions = bounding.to_intersecting_regions(
-                first_box, self.second.regions, context)
+                first_box,
+                bounding.to_regions_intersecting_regions(
+                        self.second.regions, self.first.regions, context
+                ),
+                context)
         if not self.second.regions:
             return context.empty
         events = sorted(self.sweep(),
@@ -229,11 +239,19 @@ class Intersection(Operation):
         if bounding.disjoint_with(first_box, second_box):
             return context.empty
         self.first.regions = bounding.to_coupled_regions(
-                second_box, self.first.regions, context)
+                second_box,
+                bounding.to_regions_coupled_with_regions(
+                        self.first.regions, self.second.regions, context
+                ),
+                context)
         if not self.first.regions:
             return context.empty
         self.second.regions = bounding.to_coupled_regions(
-                first_box, self.second.regions, context)
+                first_box,
+                bounding.to_regions_coupled_with_regions(
+                        self.second.regions, self.first.regions, context
+                ),
+                context)
         return (unpack_regions(self.events_to_regions(self.sweep()), context)
                 if self.second.regions
                 else context.empty)
@@ -1,14 +1,23 @@
 from abc import (ABC,
                  abstractmethod)
+from heapq import merge
+from functools import partial
 from itertools import groupby
 from operator import attrgetter
-from typing import (Iterable,
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    Iterator,
                     List,
                     Optional,
                     Sequence,
+                    Tuple,
                     Union as Union_)
 
-from ground.base import Context
+from ground.base import (Context,
+                         Orientation,
+                         get_context)
 from ground.hints import (Contour,
                           Empty,
                           Mix,
@@ -17,49 +26,91 @@ from ground.hints import (Contour,
                           Multisegment,
                           Point,
                           Polygon,
+                          Scalar,
                           Segment)
 from reprit.base import generate_repr
 
 from . import bounding
-from .event import (UNDEFINED_INDEX,
+from .event import (MINUEND_OPERAND_ID,
+                    UNDEFINED_INDEX,
+                    LeftExpressionEvent,
                     LeftHoleyEvent as LeftEvent,
+                    LeftLayerEvent,
+                    LeftNaryDifferenceEvent,
+                    LeftNaryHoleyEvent as LeftNaryEvent,
                     RightShapedEvent as RightEvent,
                     events_to_connectivity)
-from .events_queue import HoleyEventsQueue as EventsQueue
+from .events_queue import (HoleyEventsQueue as EventsQueue,
+                           NaryHoleyEventsQueue as NaryEventsQueue)
+from .events_store import (EventView,
+                           EventsStore,
+                           EventsStoreQueue,
+                           EventsStoreSweepLineKey,
+                           is_left_event)
+from .enums import OverlapKind
+from .filtered import to_filtered_context
 from .hints import Orienteer
-from .operands import HoleyOperand
-from .sweep_line import BinarySweepLine as SweepLine
+from .integer import (are_polygons_integral,
+                      to_integer_context)
+from .operands import (HoleyOperand,
+                       PolygonOperand)
+from .sweep_line import (BinarySweepLineKey,
+                         NaryHoleySweepLineKey,
+                         SweepLine,
+                         SweepLineBackend,
+                         TreeSweepLine)
 from .unpacking import (unpack_mix,
                         unpack_points,
                         unpack_polygons,
                         unpack_segments)
-from .utils import (all_equal,
+from .utils import (HALF,
+                    all_equal,
                     endpoints_to_segments,
                     polygon_to_oriented_edges_endpoints,
                     shrink_collinear_vertices,
                     to_endpoints,
                     to_first_border_vertex,
+                    to_min_border_vertex,
+                    to_polygons_doubled_area,
                     to_polygons_x_max)
 
 Event = Union_[LeftEvent, RightEvent]
+NaryEvent = Union_[LeftNaryEvent, RightEvent]
+# event with its fields computed during the sweep & the same of event below it
+FieldsSnapshot = Tuple[LeftEvent, bool, OverlapKind, Optional[LeftEvent], bool,
+                       OverlapKind]
 
 
 class Operation(ABC):
-    __slots__ = 'context', 'first', 'second', '_events_queue'
+    __slots__ = ('context', 'first', 'snap_tolerance', 'second',
+                 'sweep_line_backend', '_events_queue')
 
     def __init__(self,
                  first: HoleyOperand,
                  second: HoleyOperand,
-                 context: Context) -> None:
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine,
+                 snap_tolerance: Optional[Scalar] = None) -> None:
         """
         Initializes operation.
 
         :param first: first operand.
         :param second: second operand.
         :param context: operation context.
+        :param sweep_line_backend: factory of sweep line by events' key.
+        :param snap_tolerance:
+            distance to snap intersection points to segments' endpoints
+            within, if any.
         """
+        context = (to_integer_context(context)
+                   if (context is get_context()
+                       and first.is_integral()
+                       and second.is_integral())
+                   else to_filtered_context(context))
         self.context, self.first, self.second = context, first, second
-        self._events_queue = EventsQueue(context)
+        self.snap_tolerance, self.sweep_line_backend = (snap_tolerance,
+                                                        sweep_line_backend)
+        self._events_queue = EventsQueue(context, snap_tolerance)
 
     __repr__ = generate_repr(__init__)
 
@@ -86,65 +137,24 @@ class Operation(ABC):
         event.from_shaped_result = self.from_shaped_result(event)
 
     def events_to_polygons(self, events: Sequence[Event]) -> Sequence[Polygon]:
-        events = [event
-                  for event in events
-                  if event.primary.from_shaped_result]
-        if not events:
-            return []
-        max_endpoint_id = events[-1].start_id
-        assert max_endpoint_id != UNDEFINED_INDEX
-        assert all(event.start_id <= max_endpoint_id for event in events)
-        events.sort(key=self._events_queue.key)
-        for event_id, event in enumerate(events):
-            event.id = event_id
-        are_internal, depths, holes, parents = [], [], [], []
-        are_events_processed = [False] * len(events)
-        context = self.context
-        contour_cls, orienteer = context.contour_cls, context.angle_orientation
-        contours = []  # type: List[Contour]
-        connectivity = events_to_connectivity(events)
-        visited_endpoints_positions = [UNDEFINED_INDEX] * (max_endpoint_id + 1)
-        for event_id, event in enumerate(events):
-            if are_events_processed[event_id]:
-                continue
-            contour_id = len(contours)
-            _compute_relations(event, contour_id, are_internal, depths, holes,
-                               parents)
-            contour_events = _to_contour_events(event, events, connectivity,
-                                                are_events_processed,
-                                                visited_endpoints_positions)
-            _process_contour_events(contour_events, contour_id,
-                                    are_events_processed)
-            vertices = _contour_events_to_vertices(contour_events, orienteer)
-            if depths[contour_id] % 2:
-                # holes will be in clockwise order
-                vertices[:] = vertices[:1] + vertices[:0:-1]
-            contours.append(contour_cls(vertices))
-        result = []
-        polygon_cls = context.polygon_cls
-        for contour_id, contour in enumerate(contours):
-            if are_internal[contour_id]:
-                # hole of a hole is an external polygon
-                result.extend(polygon_cls(contours[hole_id],
-                                          [contours[hole_hole_id]
-                                           for hole_hole_id in holes[hole_id]])
-                              for hole_id in holes[contour_id])
-            else:
-                result.append(polygon_cls(contour,
-                                          [contours[hole_id]
-                                           for hole_id in holes[contour_id]]))
-        return result
+        return events_to_polygons(events, self._events_queue.key,
+                                  self.context)
+
+    def iter_events_to_polygons(self, events: Sequence[Event]
+                                ) -> Iterator[Polygon]:
+        return iter_events_to_polygons(events, self._events_queue.key,
+                                       self.context)
 
     def fill_queue(self) -> None:
-        events_queue = self._events_queue
+        context, events_queue = self.context, self._events_queue
         for polygon in self.first.polygons:
             events_queue.register(
-                    polygon_to_oriented_edges_endpoints(polygon, self.context),
+                    self.first.to_oriented_edges_endpoints(polygon, context),
                     True
             )
         for polygon in self.second.polygons:
             events_queue.register(
-                    polygon_to_oriented_edges_endpoints(polygon, self.context),
+                    self.second.to_oriented_edges_endpoints(polygon, context),
                     False
             )
 
@@ -152,6 +162,38 @@ class Operation(ABC):
     def from_shaped_result(self, event: LeftEvent) -> bool:
         """Detects if event is a part of resulting shaped geometry."""
 
+    def compute_area(self, compact: bool = False) -> Scalar:
+        """
+        Computes area of the result of the operation without building it.
+
+        :param compact:
+            flag which determines whether events of the area sweep
+            are kept in arrays of events store instead of separate objects.
+        """
+        doubled_area = to_polygons_doubled_area(self.isolate_polygons(),
+                                                self.context)
+        if self.first.polygons:
+            doubled_area += self.sweep_doubled_area(compact)
+        return HALF * doubled_area
+
+    def isolate_polygons(self) -> List[Polygon]:
+        """
+        Removes polygons of operands which boxes are not coupled
+        with boxes of the other operand's polygons and returns them.
+        """
+        context = self.context
+        first_isolated_polygons, self.first.polygons = (
+            bounding.split_polygons_coupled_with_polygons(
+                    self.first.polygons, self.second.polygons, context
+            )
+        )
+        second_isolated_polygons, self.second.polygons = (
+            bounding.split_polygons_coupled_with_polygons(
+                    self.second.polygons, self.first.polygons, context
+            )
+        )
+        return first_isolated_polygons + second_isolated_polygons
+
     def process_event(self,
                       event: Event,
                       processed_events: List[Event],
@@ -187,14 +229,549 @@ class Operation(ABC):
     def sweep(self) -> List[Event]:
         self.fill_queue()
         result = []
-        sweep_line = SweepLine(self.context)
+        sweep_line = self.to_sweep_line()
+        events_queue = self._events_queue
+        event = events_queue.pop()
+        current_endpoint = event.start
+        current_endpoint_id = event.start_id = 0
+        self.process_event(event, result, sweep_line)
+        while events_queue:
+            event = events_queue.pop()
+            if event.start != current_endpoint:
+                current_endpoint = event.start
+                current_endpoint_id += 1
+            event.start_id = current_endpoint_id
+            self.process_event(event, result, sweep_line)
+        return result
+
+    def result_interior_to_left(self, event: LeftEvent) -> bool:
+        """
+        Detects if interior of resulting shaped geometry
+        lies to the left of the event which is a part of it.
+        """
+        return event.interior_to_left
+
+    def to_sweep_line(self) -> SweepLine:
+        return self.sweep_line_backend(
+                partial(BinarySweepLineKey, self.context.angle_orientation)
+        )
+
+    def to_sweep_x_max(self) -> Optional[Scalar]:
+        """
+        Returns abscissa after which events cannot affect the result (if any).
+        """
+        return None
+
+    def sweep_compact_doubled_area_until(self, x_max: Optional[Scalar]
+                                         ) -> Scalar:
+        """
+        Same as ``sweep_doubled_area_until``,
+        but keeps events in events store & refers them by ids.
+
+        Only area sweeps use events store,
+        sweeps which build results work on events objects.
+        """
+        context = self.context
+        store = EventsStore(context)
+        events_queue = EventsStoreQueue(store)
+        for polygon in self.first.polygons:
+            events_queue.register(
+                    self.first.to_oriented_edges_endpoints(polygon, context),
+                    True
+            )
+        for polygon in self.second.polygons:
+            events_queue.register(
+                    self.second.to_oriented_edges_endpoints(polygon, context),
+                    False
+            )
+        result = 0
+        cross_product, origin = context.cross_product, context.origin
+        starts, opposites = store.starts, store.opposites
+        sweep_line = self.sweep_line_backend(
+                partial(EventsStoreSweepLineKey, store,
+                        context.angle_orientation)
+        )
+        while events_queue:
+            event = events_queue.pop()
+            start = starts[event]
+            if x_max is not None and x_max < start.x:
+                break
+            if is_left_event(event):
+                if event in sweep_line:
+                    continue
+                sweep_line.add(event)
+                above_event, below_event = (sweep_line.above(event),
+                                            sweep_line.below(event))
+                self.compute_store_fields(store, event, below_event)
+                if (above_event is not None
+                        and events_queue.detect_intersection(event,
+                                                             above_event)):
+                    self.compute_store_fields(store, event, below_event)
+                    self.compute_store_fields(store, above_event, event)
+                if (below_event is not None
+                        and events_queue.detect_intersection(below_event,
+                                                             event)):
+                    self.compute_store_fields(store, below_event,
+                                              sweep_line.below(below_event))
+                    self.compute_store_fields(store, event, below_event)
+                continue
+            left_event = opposites[event]
+            if left_event in sweep_line:
+                above_event, below_event = (sweep_line.above(left_event),
+                                            sweep_line.below(left_event))
+                sweep_line.remove(left_event)
+                if above_event is not None and below_event is not None:
+                    events_queue.detect_intersection(below_event, above_event)
+            if store.from_shaped_result[left_event >> 1]:
+                area = cross_product(origin, starts[left_event], origin,
+                                     start)
+                if self.result_interior_to_left(EventView(store, left_event)):
+                    result += area
+                else:
+                    result -= area
+        return result
+
+    def compute_store_fields(self,
+                             store: EventsStore,
+                             event: int,
+                             below_event: Optional[int]) -> None:
+        """
+        Same as ``compute_fields``, but for events from store,
+        skips fields which are used only for building contours.
+        """
+        segment_id = event >> 1
+        if below_event is not None:
+            below_segment_id = below_event >> 1
+            store.other_interior_to_left[segment_id] = (
+                store.other_interior_to_left[below_segment_id]
+                if (store.from_first_operand[segment_id]
+                    == store.from_first_operand[below_segment_id])
+                else store.interior_to_left[below_segment_id]
+            )
+        store.from_shaped_result[segment_id] = self.from_shaped_result(
+                EventView(store, event)
+        )
+
+    def sweep_doubled_area(self, compact: bool) -> Scalar:
+        x_max = self.to_sweep_x_max()
+        return (self.sweep_compact_doubled_area_until(x_max)
+                if compact
+                else self.sweep_doubled_area_until(x_max))
+
+    def sweep_doubled_area_until(self, x_max: Optional[Scalar]) -> Scalar:
+        """
+        Sweeps events up to the abscissa (if any)
+        summing up doubled signed areas of triangles
+        formed by origin & segments of the result.
+
+        Segment's fields can be changed
+        while its left event is in the sweep line,
+        so the segment is taken into account
+        when its right event is processed.
+        """
+        self.fill_queue()
+        result = 0
+        context = self.context
+        cross_product, origin = context.cross_product, context.origin
+        # processed events are not needed afterwards,
+        # so the same list is cleared at each step
+        processed_events = []  # type: List[Event]
+        events_queue = self._events_queue
+        sweep_line = self.to_sweep_line()
+        while events_queue:
+            event = events_queue.pop()
+            if x_max is not None and x_max < event.start.x:
+                break
+            self.process_event(event, processed_events, sweep_line)
+            processed_events.clear()
+            if event.is_left:
+                continue
+            left_event = event.left
+            if left_event.from_shaped_result:
+                area = cross_product(origin, left_event.start, origin,
+                                     event.start)
+                if self.result_interior_to_left(left_event):
+                    result += area
+                else:
+                    result -= area
+        return result
+
+    def sweep_interacting_polygons(self) -> List[Polygon]:
+        """
+        Sweeps polygons of operands which can interact
+        and adds the rest of them to the result as is.
+
+        Operation should not change isolated polygons,
+        like union & symmetric difference do.
+        """
+        return list(self.iter_interacting_polygons())
+
+    def iter_interacting_polygons(self) -> Iterator[Polygon]:
+        """
+        Lazy version of ``sweep_interacting_polygons``.
+        """
+        isolated_polygons = self.isolate_polygons()
+        if not self.first.polygons:
+            isolated_polygons.sort(key=to_first_border_vertex)
+            return iter(isolated_polygons)
+        return iter_merged_polygons(self.iter_events_to_polygons(self.sweep()),
+                                    isolated_polygons)
+
+
+class NaryOperation(ABC):
+    __slots__ = 'context', 'operands', 'sweep_line_backend', '_events_queue'
+
+    def __init__(self,
+                 operands: Sequence[HoleyOperand],
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine
+                 ) -> None:
+        """
+        Initializes operation.
+
+        :param operands: operands.
+        :param context: operation context.
+        :param sweep_line_backend: factory of sweep line by events' key.
+        """
+        context = (to_integer_context(context)
+                   if (context is get_context()
+                       and all(operand.is_integral() for operand in operands))
+                   else to_filtered_context(context))
+        self.context, self.operands = context, operands
+        self.sweep_line_backend = sweep_line_backend
+        self._events_queue = NaryEventsQueue(context)
+
+    __repr__ = generate_repr(__init__)
+
+    @abstractmethod
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Computes result of the operation.
+        """
+
+    def compute_fields(self,
+                       event: LeftNaryEvent,
+                       below_event: Optional[LeftNaryEvent]) -> None:
+        if below_event is None:
+            event.below_coverage = event.overlap_below_coverage = 0
+        else:
+            event.below_coverage = below_event.above_coverage
+            if (below_event.start == event.start
+                    and below_event.end == event.end):
+                # segments of different operands overlap,
+                # only the topmost of them can be a part of the result
+                below_event.from_shaped_result = False
+                event.overlap_below_coverage = (
+                    below_event.overlap_below_coverage
+                )
+            else:
+                event.overlap_below_coverage = event.below_coverage
+            event.below_event_from_shaped_result = (
+                below_event.below_event_from_shaped_result
+                if (not below_event.from_shaped_result
+                    or below_event.is_vertical)
+                else below_event
+            )
+        event.from_shaped_result = self.from_shaped_result(event)
+
+    def events_to_polygons(self,
+                           events: Sequence[NaryEvent]) -> Sequence[Polygon]:
+        return events_to_polygons(events, self._events_queue.key,
+                                  self.context)
+
+    def fill_queue(self) -> None:
+        context, events_queue = self.context, self._events_queue
+        for operand_id, operand in enumerate(self.operands):
+            for polygon in operand.polygons:
+                events_queue.register(
+                        operand.to_oriented_edges_endpoints(polygon, context),
+                        operand_id
+                )
+
+    @abstractmethod
+    def from_shaped_result(self, event: LeftNaryEvent) -> bool:
+        """Detects if event is a part of resulting shaped geometry."""
+
+    def process_event(self,
+                      event: NaryEvent,
+                      processed_events: List[NaryEvent],
+                      sweep_line: SweepLine) -> None:
+        if not event.is_left:
+            opposite_event = event.left
+            if opposite_event in sweep_line:
+                above_event, below_event = (sweep_line.above(opposite_event),
+                                            sweep_line.below(opposite_event))
+                sweep_line.remove(opposite_event)
+                if above_event is not None and below_event is not None:
+                    self._events_queue.detect_intersection(below_event,
+                                                           above_event)
+            processed_events.append(event)
+        elif event not in sweep_line:
+            sweep_line.add(event)
+            above_event, below_event = (sweep_line.above(event),
+                                        sweep_line.below(event))
+            self.compute_fields(event, below_event)
+            if (above_event is not None
+                    and self._events_queue.detect_intersection(event,
+                                                               above_event)):
+                self.compute_fields(event, below_event)
+                self.compute_fields(above_event, event)
+            if (below_event is not None
+                    and self._events_queue.detect_intersection(below_event,
+                                                               event)):
+                below_below_event = sweep_line.below(below_event)
+                self.compute_fields(below_event, below_below_event)
+                self.compute_fields(event, below_event)
+            self.process_overlaps(event, sweep_line)
+            processed_events.append(event)
+
+    def process_overlaps(self,
+                         event: LeftNaryEvent,
+                         sweep_line: SweepLine) -> None:
+        # segments of more than two operands can overlap,
+        # in which case only adjacent ones were divided so far,
+        # so we are dividing the rest to make them all identical
+        # and recomputing their fields from the bottom one
+        events_queue, orienteer = (self._events_queue,
+                                   self.context.angle_orientation)
+        bottom_event = event
+        below_event = sweep_line.below(bottom_event)
+        while (below_event is not None
+               and below_event.start == event.start
+               and (orienteer(event.start, event.end, below_event.end)
+                    is Orientation.COLLINEAR)):
+            events_queue.detect_intersection(below_event, event)
+            bottom_event, below_event = (below_event,
+                                         sweep_line.below(below_event))
+        top_event = event
+        above_event = sweep_line.above(top_event)
+        while (above_event is not None
+               and above_event.start == event.start
+               and (orienteer(event.start, event.end, above_event.end)
+                    is Orientation.COLLINEAR)):
+            events_queue.detect_intersection(event, above_event)
+            top_event, above_event = above_event, sweep_line.above(above_event)
+        if bottom_event is top_event:
+            return
+        self.compute_fields(bottom_event, below_event)
+        while bottom_event is not top_event:
+            bottom_event, below_event = (sweep_line.above(bottom_event),
+                                         bottom_event)
+            self.compute_fields(bottom_event, below_event)
+
+    def sweep(self) -> List[NaryEvent]:
+        self.fill_queue()
+        result = []
+        sweep_line = self.to_sweep_line()
+        events_queue = self._events_queue
+        event = events_queue.pop()
+        current_endpoint = event.start
+        current_endpoint_id = event.start_id = 0
+        self.process_event(event, result, sweep_line)
+        while events_queue:
+            event = events_queue.pop()
+            if event.start != current_endpoint:
+                current_endpoint = event.start
+                current_endpoint_id += 1
+            event.start_id = current_endpoint_id
+            self.process_event(event, result, sweep_line)
+        return result
+
+    def to_sweep_line(self) -> SweepLine:
+        return self.sweep_line_backend(
+                partial(NaryHoleySweepLineKey, self.context.angle_orientation)
+        )
+
+
+class NaryUnion(NaryOperation):
+    __slots__ = ()
+
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        operands = self.operands
+        if len(operands) < 2:
+            return operands[0].value if operands else self.context.empty
+        return unpack_polygons(self.events_to_polygons(self.sweep()),
+                               self.context)
+
+    def from_shaped_result(self, event: LeftNaryEvent) -> bool:
+        return ((event.overlap_below_coverage == 0)
+                is not (event.above_coverage == 0))
+
+
+class NaryDifference(NaryOperation):
+    """
+    Operation which subtracts all the operands
+    except the first one from the first one.
+    """
+    __slots__ = ()
+
+    def __init__(self,
+                 operands: Sequence[HoleyOperand],
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine
+                 ) -> None:
+        super().__init__(operands, context, sweep_line_backend)
+        self._events_queue = NaryEventsQueue(self.context,
+                                             LeftNaryDifferenceEvent)
+
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        minuend = self.operands[MINUEND_OPERAND_ID]
+        isolated_polygons = self.isolate_polygons()
+        return (unpack_polygons(
+                        merge_polygons(self.events_to_polygons(self.sweep()),
+                                       isolated_polygons),
+                        self.context
+                )
+                if minuend.polygons
+                else minuend.value)
+
+    def compute_fields(self,
+                       event: LeftNaryDifferenceEvent,
+                       below_event: Optional[LeftNaryDifferenceEvent]
+                       ) -> None:
+        if below_event is None:
+            event.below_minuend_coverage = (
+                event.overlap_below_minuend_coverage
+            ) = 0
+        else:
+            event.below_minuend_coverage = below_event.above_minuend_coverage
+            event.overlap_below_minuend_coverage = (
+                below_event.overlap_below_minuend_coverage
+                if (below_event.start == event.start
+                    and below_event.end == event.end)
+                else event.below_minuend_coverage
+            )
+        super().compute_fields(event, below_event)
+
+    def from_shaped_result(self, event: LeftNaryDifferenceEvent) -> bool:
+        return ((event.overlap_below_minuend_coverage
+                 == event.overlap_below_coverage
+                 == 1)
+                is not (event.above_minuend_coverage
+                        == event.above_coverage
+                        == 1))
+
+    def isolate_polygons(self) -> List[Polygon]:
+        """
+        Removes polygons of minuend which cannot be affected by subtrahends
+        and returns them, polygons of subtrahends which cannot affect minuend
+        are removed as well.
+        """
+        context = self.context
+        minuend = self.operands[MINUEND_OPERAND_ID]
+        minuend_box = minuend.to_box(context)
+        subtrahends_polygons = [
+            polygon
+            for operand_id, operand in enumerate(self.operands)
+            if operand_id != MINUEND_OPERAND_ID
+            for polygon in operand.polygons
+        ]
+        subtrahends_polygons = bounding.to_polygons_coupled_with_polygons(
+                bounding.to_coupled_polygons(minuend_box, subtrahends_polygons,
+                                             context),
+                minuend.polygons, context
+        )
+        if not subtrahends_polygons:
+            result, minuend.polygons = minuend.polygons, []
+            return result
+        result, minuend.polygons = (
+            bounding.split_polygons_coupled_with_polygons(
+                    minuend.polygons, subtrahends_polygons, context
+            )
+        )
+        # polygons of the same subtrahend do not overlap,
+        # so each of them can be swept as a separate operand
+        self.operands = [minuend,
+                         *map(PolygonOperand, subtrahends_polygons)]
+        return result
+
+    def sweep(self) -> List[NaryEvent]:
+        self.fill_queue()
+        result = []
+        sweep_line = self.to_sweep_line()
+        events_queue = self._events_queue
+        minuend_x_max = to_polygons_x_max(
+                self.operands[MINUEND_OPERAND_ID].polygons
+        )
+        event = events_queue.pop()
+        current_endpoint = event.start
+        current_endpoint_id = event.start_id = 0
+        self.process_event(event, result, sweep_line)
+        while events_queue:
+            event = events_queue.pop()
+            if minuend_x_max < event.start.x:
+                break
+            if event.start != current_endpoint:
+                current_endpoint = event.start
+                current_endpoint_id += 1
+            event.start_id = current_endpoint_id
+            self.process_event(event, result, sweep_line)
+        return result
+
+
+class NaryIntersection(NaryOperation):
+    __slots__ = ()
+
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        operands = self.operands
+        if len(operands) < 2:
+            return operands[0].value if operands else self.context.empty
+        return (unpack_polygons(self.events_to_polygons(self.sweep()),
+                                self.context)
+                if self.select_coupled_polygons()
+                else self.context.empty)
+
+    def from_shaped_result(self, event: LeftNaryEvent) -> bool:
+        operands_count = len(self.operands)
+        return ((event.overlap_below_coverage == operands_count)
+                is not (event.above_coverage == operands_count))
+
+    def select_coupled_polygons(self) -> bool:
+        """
+        Removes polygons of operands which cannot have common area
+        with all the other operands
+        and checks if each operand has polygons left.
+
+        Removal of polygons narrows the box common to all the operands,
+        so it is repeated until no more polygons can be removed.
+        """
+        context, operands = self.context, self.operands
+        while True:
+            boxes = [operand.to_box(context) for operand in operands]
+            min_x, max_x = (max(box.min_x for box in boxes),
+                            min(box.max_x for box in boxes))
+            min_y, max_y = (max(box.min_y for box in boxes),
+                            min(box.max_y for box in boxes))
+            if max_x < min_x or max_y < min_y:
+                return False
+            common_box = context.box_cls(min_x, max_x, min_y, max_y)
+            narrowed = False
+            for operand in operands:
+                polygons = bounding.to_coupled_polygons(
+                        common_box, operand.polygons, context
+                )
+                if not polygons:
+                    return False
+                elif len(polygons) < len(operand.polygons):
+                    operand.polygons, narrowed = polygons, True
+            if not narrowed:
+                return True
+
+    def sweep(self) -> List[NaryEvent]:
+        self.fill_queue()
+        result = []
+        sweep_line = self.to_sweep_line()
         events_queue = self._events_queue
+        min_max_x = min(to_polygons_x_max(operand.polygons)
+                        for operand in self.operands)
         event = events_queue.pop()
         current_endpoint = event.start
         current_endpoint_id = event.start_id = 0
         self.process_event(event, result, sweep_line)
         while events_queue:
             event = events_queue.pop()
+            if min_max_x < event.start.x:
+                break
             if event.start != current_endpoint:
                 current_endpoint = event.start
                 current_endpoint_id += 1
@@ -203,6 +780,276 @@ class Operation(ABC):
         return result
 
 
+class LayersIntersection(NaryOperation):
+    """
+    Intersection of two layers of polygons
+    which result is split by pairs of indices of intersecting polygons.
+
+    Each polygon is swept as a separate operand,
+    so polygons of the same layer can share edges, but should not overlap.
+    """
+    __slots__ = 'first', 'second', '_first_count', '_polygons_ids'
+
+    def __init__(self,
+                 first: Sequence[Polygon],
+                 second: Sequence[Polygon],
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine
+                 ) -> None:
+        super().__init__([PolygonOperand(polygon)
+                          for layer in (first, second)
+                          for polygon in layer],
+                         context, sweep_line_backend)
+        self.first, self.second = first, second
+        self._events_queue = NaryEventsQueue(self.context, LeftLayerEvent)
+        self._first_count = len(first)
+        self._polygons_ids = [*range(len(first)), *range(len(second))]
+
+    __repr__ = generate_repr(__init__)
+
+    def compute(self) -> List[Tuple[int, int, Union_[Multipolygon, Polygon]]]:
+        if not self.select_coupled_polygons():
+            return []
+        events = self.sweep()
+        # chains of result events below are shared by all pairs,
+        # so they are saved before being narrowed to each pair
+        below_events = {
+            event: event.below_event_from_shaped_result
+            for event in events
+            if event.is_left
+        }  # type: Dict[LeftLayerEvent, Optional[LeftLayerEvent]]
+        pairs_events = {}  # type: Dict[Tuple[int, int], List[NaryEvent]]
+        for event in events:
+            if event.primary.from_shaped_result:
+                for polygons_ids in _to_faces_polygons_ids(event.primary):
+                    pairs_events.setdefault(polygons_ids, []).append(event)
+        context, result = self.context, []
+        for polygons_ids, pair_events in sorted(pairs_events.items()):
+            first_id, second_id = polygons_ids
+            min_y = max(context.contour_box(self.first[first_id].border).min_y,
+                        context.contour_box(self.second[second_id].border)
+                        .min_y)
+            for event in pair_events:
+                if event.is_left:
+                    event.below_event_from_shaped_result = (
+                        _to_face_below_event(below_events[event],
+                                             polygons_ids, min_y,
+                                             below_events)
+                    )
+            # endpoints are renumbered
+            # to keep assembling proportional to the pair's events count
+            _renumber_endpoints(pair_events)
+            polygons = self.events_to_polygons(pair_events)
+            result.append((first_id, second_id,
+                           unpack_polygons(polygons, context)))
+        return result
+
+    def compute_fields(self,
+                       event: LeftLayerEvent,
+                       below_event: Optional[LeftLayerEvent]) -> None:
+        below_polygons_ids = ((UNDEFINED_INDEX, UNDEFINED_INDEX)
+                              if below_event is None
+                              else below_event.above_polygons_ids)
+        layer_id = event.operand_id >= self._first_count
+        polygon_id = self._polygons_ids[event.operand_id]
+        below_polygon_id = below_polygons_ids[layer_id]
+        above_polygon_id = (polygon_id
+                            if event.interior_to_left
+                            else (UNDEFINED_INDEX
+                                  if below_polygon_id == polygon_id
+                                  else below_polygon_id))
+        event.above_polygons_ids = (
+            (below_polygons_ids[0], above_polygon_id)
+            if layer_id
+            else (above_polygon_id, below_polygons_ids[1])
+        )
+        event.overlap_below_polygons_ids = (
+            below_event.overlap_below_polygons_ids
+            if (below_event is not None
+                and below_event.start == event.start
+                and below_event.end == event.end)
+            else below_polygons_ids
+        )
+        super().compute_fields(event, below_event)
+
+    def from_shaped_result(self, event: LeftLayerEvent) -> bool:
+        return (event.overlap_below_polygons_ids != event.above_polygons_ids
+                and bool(_to_faces_polygons_ids(event)))
+
+    def select_coupled_polygons(self) -> bool:
+        """
+        Removes polygons of layers which boxes are not coupled
+        with boxes of the other layer's polygons keeping indices of the rest
+        and checks if both layers have polygons left.
+        """
+        context, first, second = self.context, self.first, self.second
+        if not first or not second:
+            return False
+        first_ids = bounding.to_polygons_ids_coupled_with_polygons(
+                first, second, context
+        )
+        if not first_ids:
+            return False
+        second_ids = bounding.to_polygons_ids_coupled_with_polygons(
+                second, [first[polygon_id] for polygon_id in first_ids],
+                context
+        )
+        if not second_ids:
+            return False
+        self.operands = [
+            *[PolygonOperand(first[polygon_id]) for polygon_id in first_ids],
+            *[PolygonOperand(second[polygon_id]) for polygon_id in second_ids]
+        ]
+        self._first_count = len(first_ids)
+        self._polygons_ids = [*first_ids, *second_ids]
+        return True
+
+
+class NaryExpression(NaryOperation):
+    """
+    Operation which result covers regions
+    where given predicate holds for the bitmask of operands covering them.
+    """
+    __slots__ = 'predicate',
+
+    def __init__(self,
+                 operands: Sequence[HoleyOperand],
+                 predicate: Callable[[int], bool],
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine
+                 ) -> None:
+        super().__init__(operands, context, sweep_line_backend)
+        self.predicate = predicate
+        self._events_queue = NaryEventsQueue(self.context,
+                                             LeftExpressionEvent)
+
+    __repr__ = generate_repr(__init__)
+
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        return (unpack_polygons(self.events_to_polygons(self.sweep()),
+                                self.context)
+                if any(operand.polygons for operand in self.operands)
+                else self.context.empty)
+
+    def compute_fields(self,
+                       event: LeftExpressionEvent,
+                       below_event: Optional[LeftExpressionEvent]) -> None:
+        if below_event is None:
+            event.below_operands = event.overlap_below_operands = 0
+        else:
+            event.below_operands = below_event.above_operands
+            if (below_event.start == event.start
+                    and below_event.end == event.end):
+                # segments of different operands overlap,
+                # only the topmost of them can be a part of the result
+                below_event.from_shaped_result = False
+                event.overlap_below_operands = (
+                    below_event.overlap_below_operands
+                )
+            else:
+                event.overlap_below_operands = event.below_operands
+            event.below_event_from_shaped_result = (
+                below_event.below_event_from_shaped_result
+                if (not below_event.from_shaped_result
+                    or below_event.is_vertical)
+                else below_event
+            )
+        event.from_shaped_result = self.from_shaped_result(event)
+
+    def from_shaped_result(self, event: LeftExpressionEvent) -> bool:
+        return (self.predicate(event.overlap_below_operands)
+                is not self.predicate(event.above_operands))
+
+
+def events_to_polygons(events: Sequence[Event],
+                       key: Callable[[Event], Any],
+                       context: Context) -> Sequence[Polygon]:
+    return list(iter_events_to_polygons(events, key, context))
+
+
+def iter_events_to_polygons(events: Sequence[Event],
+                            key: Callable[[Event], Any],
+                            context: Context) -> Iterator[Polygon]:
+    """
+    Yields polygons in the same order as ``events_to_polygons`` returns them
+    as soon as their borders & holes are built.
+
+    Contours are built in the order of their leftmost vertices
+    and holes lie strictly inside their borders,
+    so contour can not get new holes
+    after reaching contours which start not to the left of its rightmost
+    vertex.
+    """
+    events = [event
+              for event in events
+              if event.primary.from_shaped_result]
+    if not events:
+        return
+    max_endpoint_id = events[-1].start_id
+    assert max_endpoint_id != UNDEFINED_INDEX
+    assert all(event.start_id <= max_endpoint_id for event in events)
+    events.sort(key=key)
+    for event_id, event in enumerate(events):
+        event.id = event_id
+    are_internal, depths, holes, parents = [], [], [], []
+    are_events_processed = [False] * len(events)
+    contour_cls, orienteer = context.contour_cls, context.angle_orientation
+    polygon_cls = context.polygon_cls
+    # contours are released after yielding their polygons
+    contours = {}  # type: Dict[int, Contour]
+    contours_x_maxs = []  # type: List[Scalar]
+    connectivity = events_to_connectivity(events)
+    visited_endpoints_positions = [UNDEFINED_INDEX] * (max_endpoint_id + 1)
+    completed_contours_count = 0
+    for event_id, event in enumerate(events):
+        if are_events_processed[event_id]:
+            continue
+        while (completed_contours_count < len(contours_x_maxs)
+               and (contours_x_maxs[completed_contours_count]
+                    <= event.start.x)):
+            yield from _pop_contour_polygons(completed_contours_count,
+                                             are_internal, contours, holes,
+                                             polygon_cls)
+            completed_contours_count += 1
+        contour_id = len(contours_x_maxs)
+        _compute_relations(event, contour_id, are_internal, depths, holes,
+                           parents)
+        contour_events = _to_contour_events(event, events, connectivity,
+                                            are_events_processed,
+                                            visited_endpoints_positions)
+        _process_contour_events(contour_events, contour_id,
+                                are_events_processed)
+        vertices = _contour_events_to_vertices(contour_events, orienteer)
+        if depths[contour_id] % 2:
+            # holes will be in clockwise order
+            vertices[:] = vertices[:1] + vertices[:0:-1]
+        contours[contour_id] = contour_cls(vertices)
+        contours_x_maxs.append(max(vertex.x for vertex in vertices))
+    for contour_id in range(completed_contours_count, len(contours_x_maxs)):
+        yield from _pop_contour_polygons(contour_id, are_internal, contours,
+                                         holes, polygon_cls)
+
+
+def iter_merged_polygons(swept: Iterable[Polygon],
+                         isolated: List[Polygon]) -> Iterator[Polygon]:
+    """
+    Lazy version of ``merge_polygons``.
+    """
+    isolated.sort(key=to_min_border_vertex)
+    return merge(swept, isolated,
+                 key=to_min_border_vertex)
+
+
+def merge_polygons(swept: Sequence[Polygon],
+                   isolated: List[Polygon]) -> List[Polygon]:
+    """
+    Merges polygons passed through the operation as is
+    into the swept ones keeping the order of the latter,
+    which is the order of their minimal vertices.
+    """
+    return list(iter_merged_polygons(swept, isolated))
+
+
 def _contour_events_to_vertices(events: Sequence[Event],
                                 orienteer: Orienteer) -> List[Point]:
     result = [events[0].start] + [event.end for event in events[:-1]]
@@ -216,16 +1063,25 @@ class CompleteIntersection(Operation):
     def compute(self) -> Union_[Empty, Mix, Multipoint, Multipolygon,
                                 Multisegment, Polygon, Segment]:
         context = self.context
-        first_box, second_box = (context.polygons_box(self.first.polygons),
-                                 context.polygons_box(self.second.polygons))
+        first_box, second_box = (self.first.to_box(context),
+                                 self.second.to_box(context))
         if bounding.disjoint_with(first_box, second_box):
             return context.empty
         self.first.polygons = bounding.to_intersecting_polygons(
-                second_box, self.first.polygons, context)
+                second_box,
+                bounding.to_polygons_intersecting_polygons(
+                        self.first.polygons, self.second.polygons, context
+                ),
+                context
+        )
         if not self.first.polygons:
             return context.empty
         self.second.polygons = bounding.to_intersecting_polygons(
-                first_box, self.second.polygons, context
+                first_box,
+                bounding.to_polygons_intersecting_polygons(
+                        self.second.polygons, self.first.polygons, context
+                ),
+                context
         )
         if not self.second.polygons:
             return context.empty
@@ -262,7 +1118,7 @@ class CompleteIntersection(Operation):
         self.fill_queue()
         result = []
         events_queue = self._events_queue
-        sweep_line = SweepLine(self.context)
+        sweep_line = self.to_sweep_line()
         min_max_x = min(to_polygons_x_max(self.first.polygons),
                         to_polygons_x_max(self.second.polygons))
         event = events_queue.pop()
@@ -285,28 +1141,68 @@ class Difference(Operation):
     __slots__ = ()
 
     def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        isolated_polygons = self.isolate_polygons()
+        return (unpack_polygons(
+                        merge_polygons(self.events_to_polygons(self.sweep()),
+                                       isolated_polygons),
+                        self.context
+                )
+                if self.first.polygons
+                else self.first.value)
+
+    def iter_polygons(self) -> Iterator[Polygon]:
+        isolated_polygons = self.isolate_polygons()
+        if self.first.polygons:
+            yield from iter_merged_polygons(
+                    self.iter_events_to_polygons(self.sweep()),
+                    isolated_polygons
+            )
+        else:
+            yield from isolated_polygons
+
+    def isolate_polygons(self) -> List[Polygon]:
+        """
+        Removes polygons of minuend which cannot be affected by subtrahend
+        and returns them, polygons of subtrahend which cannot affect minuend
+        are removed as well.
+        """
         context = self.context
-        first_box = context.polygons_box(self.first.polygons)
+        first_box = self.first.to_box(context)
         if bounding.disjoint_with(first_box,
-                                  context.polygons_box(self.second.polygons)):
-            return self.first.value
+                                  self.second.to_box(context)):
+            result, self.first.polygons = self.first.polygons, []
+            return result
         self.second.polygons = bounding.to_coupled_polygons(
-                first_box, self.second.polygons, context
+                first_box,
+                bounding.to_polygons_coupled_with_polygons(
+                        self.second.polygons, self.first.polygons, context
+                ),
+                context
         )
-        return (unpack_polygons(self.events_to_polygons(self.sweep()), context)
-                if self.second.polygons
-                else self.first.value)
+        if not self.second.polygons:
+            result, self.first.polygons = self.first.polygons, []
+            return result
+        result, self.first.polygons = (
+            bounding.split_polygons_coupled_with_polygons(
+                    self.first.polygons, self.second.polygons, context
+            )
+        )
+        return result
+
+    def result_interior_to_left(self, event: LeftEvent) -> bool:
+        return event.interior_to_left is event.from_first_operand
+
+    def to_sweep_x_max(self) -> Scalar:
+        return to_polygons_x_max(self.first.polygons)
 
     def from_shaped_result(self, event: LeftEvent) -> bool:
-        return (event.outside
-                if event.from_first_operand
-                else event.inside or event.is_common_polyline_component)
+        return _in_difference(event)
 
     def sweep(self) -> List[Event]:
         self.fill_queue()
         result = []
         events_queue = self._events_queue
-        sweep_line = SweepLine(self.context)
+        sweep_line = self.to_sweep_line()
         first_x_max = to_polygons_x_max(self.first.polygons)
         event = events_queue.pop()
         current_endpoint = event.start
@@ -328,33 +1224,57 @@ class Intersection(Operation):
     __slots__ = ()
 
     def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        return (unpack_polygons(self.events_to_polygons(self.sweep()),
+                                self.context)
+                if self.select_coupled_polygons()
+                else self.context.empty)
+
+    def iter_polygons(self) -> Iterator[Polygon]:
+        if self.select_coupled_polygons():
+            yield from self.iter_events_to_polygons(self.sweep())
+
+    def select_coupled_polygons(self) -> bool:
+        """
+        Removes polygons of operands which cannot have common area
+        with the other operand
+        and checks if both operands have polygons left.
+        """
         context = self.context
-        first_box, second_box = (context.polygons_box(self.first.polygons),
-                                 context.polygons_box(self.second.polygons))
+        first_box, second_box = (self.first.to_box(context),
+                                 self.second.to_box(context))
         if bounding.disjoint_with(first_box, second_box):
-            return context.empty
+            return False
         self.first.polygons = bounding.to_coupled_polygons(
-                second_box, self.first.polygons, context
+                second_box,
+                bounding.to_polygons_coupled_with_polygons(
+                        self.first.polygons, self.second.polygons, context
+                ),
+                context
         )
         if not self.first.polygons:
-            return context.empty
+            return False
         self.second.polygons = bounding.to_coupled_polygons(
-                first_box, self.second.polygons, context
+                first_box,
+                bounding.to_polygons_coupled_with_polygons(
+                        self.second.polygons, self.first.polygons, context
+                ),
+                context
         )
-        return (unpack_polygons(self.events_to_polygons(self.sweep()), context)
-                if self.second.polygons
-                else context.empty)
+        return bool(self.second.polygons)
+
+    def compute_area(self, compact: bool = False) -> Scalar:
+        return (HALF * self.sweep_doubled_area(compact)
+                if self.select_coupled_polygons()
+                else 0)
 
     def from_shaped_result(self, event: LeftEvent) -> bool:
-        return (event.inside
-                or (not event.from_first_operand
-                    and event.is_common_region_boundary))
+        return _in_intersection(event)
 
     def sweep(self) -> List[Event]:
         self.fill_queue()
         result = []
         events_queue = self._events_queue
-        sweep_line = SweepLine(self.context)
+        sweep_line = self.to_sweep_line()
         min_max_x = min(to_polygons_x_max(self.first.polygons),
                         to_polygons_x_max(self.second.polygons))
         event = events_queue.pop()
@@ -372,23 +1292,159 @@ class Intersection(Operation):
             self.process_event(event, result, sweep_line)
         return result
 
+    def to_sweep_x_max(self) -> Scalar:
+        return min(to_polygons_x_max(self.first.polygons),
+                   to_polygons_x_max(self.second.polygons))
+
+
+class OverlapDetection(Intersection):
+    __slots__ = ()
+
+    def compute(self) -> bool:
+        return self.select_coupled_polygons() and self.has_shaped_result()
+
+    def has_shaped_result(self) -> bool:
+        """
+        Sweeps until the first segment of the intersection is found.
+
+        Segment's fields can be changed
+        while its left event is in the sweep line,
+        so the segment is checked when its right event is processed.
+        """
+        self.fill_queue()
+        processed_events = []  # type: List[Event]
+        events_queue = self._events_queue
+        sweep_line = self.to_sweep_line()
+        min_max_x = min(to_polygons_x_max(self.first.polygons),
+                        to_polygons_x_max(self.second.polygons))
+        event = events_queue.pop()
+        current_endpoint = event.start
+        current_endpoint_id = event.start_id = 0
+        self.process_event(event, processed_events, sweep_line)
+        while events_queue:
+            event = events_queue.pop()
+            if min_max_x < event.start.x:
+                break
+            if event.start != current_endpoint:
+                current_endpoint = event.start
+                current_endpoint_id += 1
+            event.start_id = current_endpoint_id
+            self.process_event(event, processed_events, sweep_line)
+            if not event.is_left and event.primary.from_shaped_result:
+                return True
+        return False
+
+
+class Window:
+    __slots__ = ('box', 'context', 'is_box', 'polygons', 'polygons_boxes',
+                 'polygons_edges_endpoints', '_is_integral')
+
+    def __init__(self, polygons: Sequence[Polygon], context: Context) -> None:
+        """
+        Initializes window with precomputed data shared between operations.
+
+        :param polygons: polygons of the window.
+        :param context: operations context.
+        """
+        self.context, self.polygons = context, polygons
+        self.box = context.polygons_box(polygons)
+        self.polygons_boxes = [context.contour_box(polygon.border)
+                               for polygon in polygons]
+        self.polygons_edges_endpoints = [
+            list(polygon_to_oriented_edges_endpoints(polygon, context))
+            for polygon in polygons
+        ]
+        self.is_box = (len(polygons) == 1
+                       and not polygons[0].holes
+                       and (set(polygons[0].border.vertices)
+                            == set(bounding.to_vertices(self.box, context))))
+        self._is_integral = are_polygons_integral(polygons)
+
+    __repr__ = generate_repr(__init__)
+
+    def intersect(self, operand: HoleyOperand
+                  ) -> Union_[Empty, Multipolygon, Polygon]:
+        return WindowIntersection(self, operand, self.context).compute()
+
+    def is_integral(self) -> bool:
+        return self._is_integral
+
+
+class WindowIntersection(Intersection):
+    __slots__ = '_window_polygons_ids',
+
+    def __init__(self,
+                 first: Window,
+                 second: HoleyOperand,
+                 context: Context) -> None:
+        super().__init__(first, second, context)
+        self._window_polygons_ids = []  # type: List[int]
+
+    def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
+        context, window = self.context, self.first
+        second_box = self.second.to_box(context)
+        if bounding.disjoint_with(window.box, second_box):
+            return context.empty
+        elif window.is_box and bounding.is_subset_of(second_box, window.box):
+            return unpack_polygons(self.second.polygons, context)
+        self._window_polygons_ids = [
+            polygon_id
+            for polygon_id, polygon_box in enumerate(window.polygons_boxes)
+            if bounding.coupled_with(polygon_box, second_box)
+        ]
+        if not self._window_polygons_ids:
+            return context.empty
+        self.second.polygons = bounding.to_coupled_polygons(
+                window.box, self.second.polygons, context
+        )
+        return (unpack_polygons(self.events_to_polygons(self.sweep()), context)
+                if self.second.polygons
+                else context.empty)
+
+    def fill_queue(self) -> None:
+        events_queue, window = self._events_queue, self.first
+        for polygon_id in self._window_polygons_ids:
+            events_queue.register(window.polygons_edges_endpoints[polygon_id],
+                                  True)
+        for polygon in self.second.polygons:
+            events_queue.register(
+                    self.second.to_oriented_edges_endpoints(polygon,
+                                                            self.context),
+                    False
+            )
+
 
 class SymmetricDifference(Operation):
     __slots__ = ()
 
     def compute(self) -> Union_[Empty, Multipolygon, Polygon]:
         context = self.context
-        if bounding.disjoint_with(context.polygons_box(self.first.polygons),
-                                  context.polygons_box(self.second.polygons)):
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
             polygons = []
             polygons += self.first.polygons
             polygons += self.second.polygons
             polygons.sort(key=to_first_border_vertex)
             return context.multipolygon_cls(polygons)
-        return unpack_polygons(self.events_to_polygons(self.sweep()), context)
+        return unpack_polygons(self.sweep_interacting_polygons(), context)
+
+    def iter_polygons(self) -> Iterator[Polygon]:
+        context = self.context
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
+            polygons = []
+            polygons += self.first.polygons
+            polygons += self.second.polygons
+            polygons.sort(key=to_first_border_vertex)
+            yield from polygons
+        else:
+            yield from self.iter_interacting_polygons()
 
     def from_shaped_result(self, event: LeftEvent) -> bool:
-        return not event.is_overlap
+        return _in_symmetric_difference(event)
+
+    def result_interior_to_left(self, event: LeftEvent) -> bool:
+        return event.interior_to_left is not event.other_interior_to_left
 
 
 class Union(Operation):
@@ -396,19 +1452,216 @@ class Union(Operation):
 
     def compute(self) -> Union_[Multipolygon, Polygon]:
         context = self.context
-        if bounding.disjoint_with(context.polygons_box(self.first.polygons),
-                                  context.polygons_box(self.second.polygons)):
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
             polygons = []
             polygons += self.first.polygons
             polygons += self.second.polygons
             polygons.sort(key=to_first_border_vertex)
             return context.multipolygon_cls(polygons)
-        return unpack_polygons(self.events_to_polygons(self.sweep()), context)
+        return unpack_polygons(self.sweep_interacting_polygons(), context)
+
+    def iter_polygons(self) -> Iterator[Polygon]:
+        context = self.context
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
+            polygons = []
+            polygons += self.first.polygons
+            polygons += self.second.polygons
+            polygons.sort(key=to_first_border_vertex)
+            yield from polygons
+        else:
+            yield from self.iter_interacting_polygons()
 
     def from_shaped_result(self, event: LeftEvent) -> bool:
-        return (event.outside
-                or (not event.from_first_operand
-                    and event.is_common_region_boundary))
+        return _in_union(event)
+
+
+class Overlay(Operation):
+    """
+    Arrangement of operands' edges swept once
+    and assembled into results of different operations.
+    """
+    __slots__ = ('_events', '_fields_snapshots', '_first_isolated_polygons',
+                 '_second_isolated_polygons')
+
+    def __init__(self,
+                 first: HoleyOperand,
+                 second: HoleyOperand,
+                 context: Context,
+                 sweep_line_backend: SweepLineBackend = TreeSweepLine,
+                 snap_tolerance: Optional[Scalar] = None) -> None:
+        super().__init__(first, second, context, sweep_line_backend,
+                         snap_tolerance)
+        self._events = None  # type: Optional[List[Event]]
+        self._fields_snapshots = []  # type: List[FieldsSnapshot]
+        self._first_isolated_polygons = []  # type: List[Polygon]
+        self._second_isolated_polygons = []  # type: List[Polygon]
+
+    __repr__ = generate_repr(__init__)
+
+    def compute(self) -> List[Event]:
+        """
+        Sweeps operands' polygons which can interact
+        and returns processed events annotated with their relations
+        to the other operand.
+        """
+        if self._events is None:
+            context = self.context
+            self._first_isolated_polygons, self.first.polygons = (
+                bounding.split_polygons_coupled_with_polygons(
+                        self.first.polygons, self.second.polygons, context
+                )
+            )
+            self._second_isolated_polygons, self.second.polygons = (
+                bounding.split_polygons_coupled_with_polygons(
+                        self.second.polygons, self.first.polygons, context
+                )
+            )
+            self._events = self.sweep() if self.first.polygons else []
+        return self._events
+
+    def compute_fields(self, event: LeftEvent, below_event: Optional[LeftEvent]
+                       ) -> None:
+        if below_event is not None:
+            event.other_interior_to_left = (
+                below_event.other_interior_to_left
+                if event.from_first_operand is below_event.from_first_operand
+                else below_event.interior_to_left
+            )
+        # fields which depend on the operation
+        # are computed before assembling of its result
+        # by replaying the sweep state at the moment of each computation
+        self._fields_snapshots.append(
+                (event, event.other_interior_to_left, event.overlap_kind,
+                 None, False, OverlapKind.NONE)
+                if below_event is None
+                else (event, event.other_interior_to_left, event.overlap_kind,
+                      below_event, below_event.other_interior_to_left,
+                      below_event.overlap_kind)
+        )
+
+    def difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        events = self.compute()
+        return (unpack_polygons(
+                        merge_polygons(self._to_polygons(events,
+                                                         _in_difference),
+                                       list(self._first_isolated_polygons)),
+                        self.context
+                )
+                if self.first.polygons
+                else self.first.value)
+
+    def from_shaped_result(self, event: LeftEvent) -> bool:
+        # assigned by the last assembled operation
+        return event.from_shaped_result
+
+    def intersection(self) -> Union_[Empty, Multipolygon, Polygon]:
+        events = self.compute()
+        return (unpack_polygons(self._to_polygons(events, _in_intersection),
+                                self.context)
+                if self.first.polygons
+                else self.context.empty)
+
+    def reversed_difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        events = self.compute()
+        return (unpack_polygons(
+                        merge_polygons(
+                                self._to_polygons(events,
+                                                  _in_reversed_difference),
+                                list(self._second_isolated_polygons)
+                        ),
+                        self.context
+                )
+                if self.second.polygons
+                else self.second.value)
+
+    def symmetric_difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        return self._to_interacting_polygons(_in_symmetric_difference)
+
+    def union(self) -> Union_[Multipolygon, Polygon]:
+        return self._to_interacting_polygons(_in_union)
+
+    def _to_interacting_polygons(
+            self, from_shaped_result: Callable[[LeftEvent], bool]
+    ) -> Union_[Empty, Multipolygon, Polygon]:
+        events = self.compute()
+        isolated_polygons = (self._first_isolated_polygons
+                             + self._second_isolated_polygons)
+        if not self.first.polygons:
+            isolated_polygons.sort(key=to_first_border_vertex)
+            return unpack_polygons(isolated_polygons, self.context)
+        return unpack_polygons(
+                merge_polygons(self._to_polygons(events, from_shaped_result),
+                               isolated_polygons),
+                self.context
+        )
+
+    def _to_polygons(self,
+                     events: Sequence[Event],
+                     from_shaped_result: Callable[[LeftEvent], bool]
+                     ) -> Sequence[Polygon]:
+        left_events = [event for event in events if event.is_left]
+        final_fields = [(event.other_interior_to_left, event.overlap_kind)
+                        for event in left_events]
+        # fields left by the previously assembled operation are reset
+        for event in events:
+            event.id = UNDEFINED_INDEX
+        for event in left_events:
+            event.below_event_from_shaped_result = event.contour_id = None
+            event.from_in_to_out = event.from_shaped_result = False
+        for (event, other_interior_to_left, overlap_kind, below_event,
+             below_other_interior_to_left,
+             below_overlap_kind) in self._fields_snapshots:
+            event.other_interior_to_left, event.overlap_kind = (
+                other_interior_to_left, overlap_kind
+            )
+            if below_event is not None:
+                below_event.other_interior_to_left = (
+                    below_other_interior_to_left
+                )
+                below_event.overlap_kind = below_overlap_kind
+                event.below_event_from_shaped_result = (
+                    below_event.below_event_from_shaped_result
+                    if (not from_shaped_result(below_event)
+                        or below_event.is_vertical)
+                    else below_event
+                )
+            event.from_shaped_result = from_shaped_result(event)
+        for event, (other_interior_to_left, overlap_kind) in zip(left_events,
+                                                                 final_fields):
+            event.other_interior_to_left, event.overlap_kind = (
+                other_interior_to_left, overlap_kind
+            )
+        return self.events_to_polygons(events)
+
+
+def _in_difference(event: LeftEvent) -> bool:
+    return (event.outside
+            if event.from_first_operand
+            else event.inside or event.is_common_polyline_component)
+
+
+def _in_intersection(event: LeftEvent) -> bool:
+    return (event.inside
+            or (not event.from_first_operand
+                and event.is_common_region_boundary))
+
+
+def _in_reversed_difference(event: LeftEvent) -> bool:
+    return (event.inside or event.is_common_polyline_component
+            if event.from_first_operand
+            else event.outside)
+
+
+def _in_symmetric_difference(event: LeftEvent) -> bool:
+    return not event.is_overlap
+
+
+def _in_union(event: LeftEvent) -> bool:
+    return (event.outside
+            or (not event.from_first_operand
+                and event.is_common_region_boundary))
 
 
 def _compute_relations(event: LeftEvent,
@@ -441,6 +1694,25 @@ def _compute_relations(event: LeftEvent,
     are_internal.append(is_internal)
 
 
+def _pop_contour_polygons(contour_id: int,
+                          are_internal: Sequence[bool],
+                          contours: Dict[int, Contour],
+                          holes: Sequence[Sequence[int]],
+                          polygon_cls: Callable[[Contour, Sequence[Contour]],
+                                                Polygon]) -> List[Polygon]:
+    contour = contours.pop(contour_id)
+    if are_internal[contour_id]:
+        # hole of a hole is an external polygon
+        return [polygon_cls(contours[hole_id],
+                            [contours[hole_hole_id]
+                             for hole_hole_id in holes[hole_id]])
+                for hole_id in holes[contour_id]]
+    else:
+        return [polygon_cls(contour,
+                            [contours[hole_id]
+                             for hole_id in holes[contour_id]])]
+
+
 def _to_contour_events(event: LeftEvent,
                        events: Sequence[Event],
                        connectivity: Sequence[int],
@@ -490,6 +1762,40 @@ def _process_contour_events(contour_events: Iterable[Event],
             event.opposite.contour_id = contour_id
 
 
+def _renumber_endpoints(events: Sequence[Event]) -> None:
+    endpoint, endpoint_id = None, -1
+    for event in events:
+        if event.start != endpoint:
+            endpoint, endpoint_id = event.start, endpoint_id + 1
+        event.start_id = endpoint_id
+
+
+def _to_face_below_event(event: Optional[LeftLayerEvent],
+                         polygons_ids: Tuple[int, int],
+                         min_y: Scalar,
+                         below_events: Dict[LeftLayerEvent,
+                                            Optional[LeftLayerEvent]]
+                         ) -> Optional[LeftLayerEvent]:
+    # segments bounding the face lie not below its box
+    while (event is not None
+           and polygons_ids not in _to_faces_polygons_ids(event)):
+        if max(event.start.y, event.end.y) < min_y:
+            return None
+        event = below_events[event]
+    return event
+
+
+def _to_faces_polygons_ids(event: LeftLayerEvent) -> List[Tuple[int, int]]:
+    """
+    Returns pairs of indices of polygons which intersections
+    lie right below or right above the overlap group of the event.
+    """
+    return [polygons_ids
+            for polygons_ids in (event.overlap_below_polygons_ids,
+                                 event.above_polygons_ids)
+            if UNDEFINED_INDEX not in polygons_ids]
+
+
 def _to_next_event_id(event_id: int,
                       are_events_processed: Sequence[bool],
                       connectivity: Sequence[int]) -> int:
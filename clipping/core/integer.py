@@ -0,0 +1,134 @@
+from functools import lru_cache
+from typing import (Iterable,
+                    Type)
+
+from cfractions import Fraction
+from ground.base import (Context,
+                         Orientation,
+                         get_context)
+from ground.hints import (Contour,
+                          Point,
+                          Polygon,
+                          Scalar,
+                          Segment)
+
+from .filtered import (FilteredContext,
+                       to_filtered_orienteer)
+
+
+class IntegerContext(FilteredContext):
+    """
+    Context specialised for operands with integer coordinates.
+
+    Constructions are computed by inlined formulas
+    instead of the generic arithmetic dispatch of the base context,
+    they stay exact for rational coordinates of intersection points.
+    """
+    __slots__ = ()
+
+    def __init__(self, base: Context) -> None:
+        super().__init__(base)
+        self._orienteer = filtered_orientation
+
+    def segments_intersection(self, first: Segment, second: Segment) -> Point:
+        return segments_intersection(first, second, self.point_cls)
+
+
+def to_integer_context(context: Context) -> Context:
+    """
+    Returns integer context with the same geometries' types
+    if given context is the default one,
+    given context itself otherwise, so contexts chosen by users are kept.
+    """
+    return (_to_integer_context(context)
+            if context is get_context()
+            else context)
+
+
+def are_polygons_integral(polygons: Iterable[Polygon]) -> bool:
+    return all(is_contour_integral(polygon.border)
+               and all(is_contour_integral(hole) for hole in polygon.holes)
+               for polygon in polygons)
+
+
+def are_segments_integral(segments: Iterable[Segment]) -> bool:
+    return all(is_point_integral(segment.start)
+               and is_point_integral(segment.end)
+               for segment in segments)
+
+
+def is_contour_integral(contour: Contour) -> bool:
+    return all(is_point_integral(vertex) for vertex in contour.vertices)
+
+
+def is_point_integral(point: Point) -> bool:
+    return type(point.x) is int and type(point.y) is int
+
+
+def orientation(vertex: Point,
+                first_ray_point: Point,
+                second_ray_point: Point) -> Orientation:
+    vertex_x, vertex_y = vertex.x, vertex.y
+    cross_product = ((first_ray_point.x - vertex_x)
+                     * (second_ray_point.y - vertex_y)
+                     - (first_ray_point.y - vertex_y)
+                     * (second_ray_point.x - vertex_x))
+    return (Orientation.COUNTERCLOCKWISE
+            if cross_product > 0
+            else (Orientation.CLOCKWISE
+                  if cross_product < 0
+                  else Orientation.COLLINEAR))
+
+
+filtered_orientation = to_filtered_orienteer(orientation)
+
+
+def segments_intersection(first: Segment,
+                          second: Segment,
+                          point_cls: Type[Point]) -> Point:
+    first_start, first_end = first.start, first.end
+    second_start, second_end = second.start, second.end
+    first_dx, first_dy = (first_end.x - first_start.x,
+                          first_end.y - first_start.y)
+    second_dx, second_dy = (second_end.x - second_start.x,
+                            second_end.y - second_start.y)
+    denominator = first_dx * second_dy - first_dy * second_dx
+    if not denominator:
+        # collinear segments touch at the common endpoint
+        return (first_start
+                if first_start == second_start or first_start == second_end
+                else first_end)
+    first_numerator = ((second_start.x - first_start.x) * second_dy
+                       - (second_start.y - first_start.y) * second_dx)
+    second_numerator = ((second_start.x - first_start.x) * first_dy
+                        - (second_start.y - first_start.y) * first_dx)
+    # like in the base context touching endpoints are returned as they are
+    # and the rest of intersection points have rational coordinates
+    if not second_numerator:
+        return second_start
+    elif second_numerator == denominator:
+        return second_end
+    elif not first_numerator:
+        return first_start
+    elif first_numerator == denominator:
+        return first_end
+    return point_cls(_divide(first_start.x * denominator
+                             + first_dx * first_numerator,
+                             denominator),
+                     _divide(first_start.y * denominator
+                             + first_dy * first_numerator,
+                             denominator))
+
+
+@lru_cache(maxsize=None)
+def _to_integer_context(context: Context) -> IntegerContext:
+    return (context
+            if isinstance(context, IntegerContext)
+            else IntegerContext(context))
+
+
+def _divide(numerator: Scalar, denominator: Scalar) -> Scalar:
+    return (Fraction(numerator, denominator)
+            if type(numerator) is int and type(denominator) is int
+            # coordinates of intersection points are already rational
+            else numerator / denominator)
@@ -3,18 +3,22 @@ from abc import (ABC,
 from itertools import groupby
 from operator import attrgetter
 from typing import (Iterable,
+                    Iterator,
                     List,
+                    Optional,
                     Sequence,
                     Union as Union_)
 
 from ground.base import (Context,
                          Orientation,
-                         Relation)
+                         Relation,
+                         get_context)
 from ground.hints import (Empty,
                           Mix,
                           Multipoint,
                           Multisegment,
                           Point,
+                          Scalar,
                           Segment)
 from reprit.base import generate_repr
 
@@ -23,7 +27,9 @@ from .event import (LeftBinaryEvent as LeftEvent,
                     RightBinaryEvent as RightEvent)
 from .events_queue import (LinearEventsQueue as BinaryEventsQueue,
                            NaryEventsQueue)
+from .filtered import to_filtered_context
 from .hints import SegmentEndpoints
+from .integer import to_integer_context
 from .operands import LinearOperand
 from .sweep_line import (BinarySweepLine,
                          NarySweepLine)
@@ -34,6 +40,8 @@ from .utils import (all_equal,
                     endpoints_to_segments,
                     segments_to_endpoints,
                     to_endpoints,
+                    to_endpoints_length,
+                    to_segments_length,
                     to_segments_x_max)
 
 Event = Union_[LeftEvent, RightEvent]
@@ -76,21 +84,31 @@ def _merge_segments(segments: Sequence[Segment],
 
 
 class Operation(ABC):
-    __slots__ = 'context', 'first', 'second', '_events_queue'
+    __slots__ = 'context', 'first', 'snap_tolerance', 'second', '_events_queue'
 
     def __init__(self,
                  first: LinearOperand,
                  second: LinearOperand,
-                 context: Context) -> None:
+                 context: Context,
+                 snap_tolerance: Optional[Scalar] = None) -> None:
         """
         Initializes operation.
 
         :param first: first operand.
         :param second: second operand.
         :param context: operation context.
+        :param snap_tolerance:
+            distance to snap intersection points to segments' endpoints
+            within, if any.
         """
+        context = (to_integer_context(context)
+                   if (context is get_context()
+                       and first.is_integral()
+                       and second.is_integral())
+                   else to_filtered_context(context))
         self.context, self.first, self.second = context, first, second
-        self._events_queue = BinaryEventsQueue(context)
+        self.snap_tolerance = snap_tolerance
+        self._events_queue = BinaryEventsQueue(context, snap_tolerance)
 
     __repr__ = generate_repr(__init__)
 
@@ -100,13 +118,20 @@ class Operation(ABC):
         Computes result of the operation.
         """
 
+    def compute_length(self) -> Scalar:
+        """
+        Computes length of the result of the operation without building it.
+        """
+        context = self.context
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
+            return (to_segments_length(self.first.segments, context)
+                    + to_segments_length(self.second.segments, context))
+        return to_endpoints_length(self.to_result_endpoints(), context)
+
     def fill_queue(self) -> None:
-        self._events_queue.register(
-                segments_to_endpoints(self.first.segments), True
-        )
-        self._events_queue.register(
-                segments_to_endpoints(self.second.segments), False
-        )
+        self._events_queue.register(self.first.to_endpoints(), True)
+        self._events_queue.register(self.second.to_endpoints(), False)
 
     def process_event(self,
                       event: Event,
@@ -129,6 +154,12 @@ class Operation(ABC):
                     self._events_queue.detect_intersection(below_event,
                                                            above_event)
 
+    def from_result(self, events: Iterable[LeftEvent]) -> bool:
+        """
+        Detects if events of the same segment are a part of the result.
+        """
+        return True
+
     def sweep(self) -> Iterable[LeftEvent]:
         self.fill_queue()
         result = []
@@ -141,35 +172,53 @@ class Operation(ABC):
                 result.append(event.left)
         return result
 
+    def to_result_endpoints(self) -> Iterator[SegmentEndpoints]:
+        """
+        Sweeps operands and returns endpoints of resulting segments lazily.
+        """
+        return (endpoints
+                for endpoints, events in groupby(self.sweep(),
+                                                 key=to_endpoints)
+                if self.from_result(events))
+
 
 class Difference(Operation):
     __slots__ = ()
 
     def compute(self) -> Union_[Empty, Segment, Multisegment]:
         context = self.context
-        first_box, second_box = (context.segments_box(self.first.segments),
-                                 context.segments_box(self.second.segments))
+        return (unpack_segments(
+                        endpoints_to_segments(
+                                sorted(self.to_result_endpoints()), context
+                        ),
+                        context
+                )
+                if self.select_coupled_segments()
+                else self.first.value)
+
+    def compute_length(self) -> Scalar:
+        context = self.context
+        return (to_endpoints_length(self.to_result_endpoints(), context)
+                if self.select_coupled_segments()
+                else to_segments_length(self.first.segments, context))
+
+    def from_result(self, events: Iterable[LeftEvent]) -> bool:
+        return all(event.from_first_operand for event in events)
+
+    def select_coupled_segments(self) -> bool:
+        """
+        Removes segments of subtrahend which cannot affect minuend
+        and detects if any of them are left.
+        """
+        context = self.context
+        first_box, second_box = (self.first.to_box(context),
+                                 self.second.to_box(context))
         if bounding.disjoint_with(first_box, second_box):
-            return self.first.value
+            return False
         self.second.segments = bounding.to_coupled_segments(
                 first_box, self.second.segments, context
         )
-        return (
-            unpack_segments(
-                    endpoints_to_segments(
-                            sorted(endpoints
-                                   for endpoints, events
-                                   in groupby(self.sweep(),
-                                              key=to_endpoints)
-                                   if all(event.from_first_operand
-                                          for event in events)),
-                            context
-                    ),
-                    context
-            )
-            if self.second.segments
-            else self.first.value
-        )
+        return bool(self.second.segments)
 
     def sweep(self) -> Iterable[LeftEvent]:
         self.fill_queue()
@@ -192,26 +241,40 @@ class Intersection(Operation):
 
     def compute(self) -> Union_[Empty, Segment, Multisegment]:
         context = self.context
-        first_box, second_box = (context.segments_box(self.first.segments),
-                                 context.segments_box(self.second.segments))
+        return (unpack_segments(
+                        endpoints_to_segments(
+                                sorted(self.to_result_endpoints()), context
+                        ),
+                        context
+                )
+                if self.select_coupled_segments()
+                else context.empty)
+
+    def compute_length(self) -> Scalar:
+        return (to_endpoints_length(self.to_result_endpoints(), self.context)
+                if self.select_coupled_segments()
+                else 0)
+
+    def from_result(self, events: Iterable[LeftEvent]) -> bool:
+        return not all_equal(event.from_first_operand for event in events)
+
+    def select_coupled_segments(self) -> bool:
+        """
+        Removes segments of operands which cannot be a part of the result
+        and detects if any of them are left.
+        """
+        context = self.context
+        first_box, second_box = (self.first.to_box(context),
+                                 self.second.to_box(context))
         if bounding.disjoint_with(first_box, second_box):
-            return context.empty
+            return False
         self.first.segments = bounding.to_coupled_segments(
                 second_box, self.first.segments, context)
         if not self.first.segments:
-            return context.empty
+            return False
         self.second.segments = bounding.to_coupled_segments(
                 first_box, self.second.segments, context)
-        return (unpack_segments(endpoints_to_segments(
-                sorted(endpoints
-                       for endpoints, events in groupby(self.sweep(),
-                                                        key=to_endpoints)
-                       if not all_equal(event.from_first_operand
-                                        for event in events)),
-                context),
-                context)
-                if self.second.segments
-                else context.empty)
+        return bool(self.second.segments)
 
     def sweep(self) -> Sequence[LeftEvent]:
         self.fill_queue()
@@ -235,8 +298,8 @@ class CompleteIntersection(Operation):
 
     def compute(self) -> Union_[Empty, Mix, Multipoint, Multisegment, Segment]:
         context = self.context
-        first_box, second_box = (context.segments_box(self.first.segments),
-                                 context.segments_box(self.second.segments))
+        first_box, second_box = (self.first.to_box(context),
+                                 self.second.to_box(context))
         if bounding.disjoint_with(first_box, second_box):
             return context.empty
         self.first.segments = bounding.to_intersecting_segments(
@@ -293,21 +356,21 @@ class SymmetricDifference(Operation):
 
     def compute(self) -> Union_[Empty, Segment, Multisegment]:
         context = self.context
-        if bounding.disjoint_with(context.segments_box(self.first.segments),
-                                  context.segments_box(self.second.segments)):
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
             segments = []
             segments += self.first.segments
             segments += self.second.segments
             segments.sort(key=to_endpoints)
             return context.multisegment_cls(segments)
-        return unpack_segments(endpoints_to_segments(
-                sorted(endpoints
-                       for endpoints, events in groupby(self.sweep(),
-                                                        key=to_endpoints)
-                       if all_equal(event.from_first_operand
-                                    for event in events)),
-                context),
-                context)
+        return unpack_segments(
+                endpoints_to_segments(sorted(self.to_result_endpoints()),
+                                      context),
+                context
+        )
+
+    def from_result(self, events: Iterable[LeftEvent]) -> bool:
+        return all_equal(event.from_first_operand for event in events)
 
 
 class Union(Operation):
@@ -315,18 +378,15 @@ class Union(Operation):
 
     def compute(self) -> Multisegment:
         context = self.context
-        if bounding.disjoint_with(context.segments_box(self.first.segments),
-                                  context.segments_box(self.second.segments)):
+        if bounding.disjoint_with(self.first.to_box(context),
+                                  self.second.to_box(context)):
             segments = []
             segments += self.first.segments
             segments += self.second.segments
             segments.sort(key=to_endpoints)
             return context.multisegment_cls(segments)
         return context.multisegment_cls(endpoints_to_segments(
-                sorted(endpoints
-                       for endpoints, _ in groupby(self.sweep(),
-                                                   key=to_endpoints)),
-                context))
+                sorted(self.to_result_endpoints()), context))
 
 
 def intersect_segments(first: Segment,
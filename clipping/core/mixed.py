@@ -3,6 +3,7 @@ from abc import (ABC,
 from itertools import groupby
 from operator import attrgetter
 from typing import (Iterable,
+                    Iterator,
                     List,
                     Optional,
                     Union as Union_)
@@ -15,6 +16,7 @@ from ground.hints import (Empty,
                           Multisegment,
                           Point,
                           Polygon,
+                          Scalar,
                           Segment)
 from reprit.base import generate_repr
 
@@ -22,6 +24,8 @@ from . import bounding
 from .event import (LeftMixedEvent as LeftEvent,
                     RightMixedEvent as RightEvent)
 from .events_queue import MixedEventsQueue as EventsQueue
+from .filtered import to_filtered_context
+from .hints import SegmentEndpoints
 from .operands import (HoleyOperand,
                        LinearOperand)
 from .sweep_line import BinarySweepLine as SweepLine
@@ -30,10 +34,10 @@ from .unpacking import (unpack_linear_mix,
                         unpack_segments)
 from .utils import (all_equal,
                     endpoints_to_segments,
-                    polygon_to_oriented_edges_endpoints,
-                    segments_to_endpoints,
                     to_endpoints,
+                    to_endpoints_length,
                     to_polygons_x_max,
+                    to_segments_length,
                     to_segments_x_max)
 
 Event = Union_[LeftEvent, RightEvent]
@@ -53,6 +57,7 @@ class Operation(ABC):
         :param shaped: second operand.
         :param context: operation context.
         """
+        context = to_filtered_context(context)
         self.context, self.linear, self.shaped = context, linear, shaped
         self._events_queue = EventsQueue(context)
 
@@ -77,11 +82,11 @@ class Operation(ABC):
 
     def fill_queue(self) -> None:
         events_queue = self._events_queue
-        events_queue.register(segments_to_endpoints(self.linear.segments),
-                              True)
+        events_queue.register(self.linear.to_endpoints(), True)
         for polygon in self.shaped.polygons:
             events_queue.register(
-                    polygon_to_oriented_edges_endpoints(polygon, self.context),
+                    self.shaped.to_oriented_edges_endpoints(polygon,
+                                                            self.context),
                     False
             )
 
@@ -116,29 +121,61 @@ class Operation(ABC):
                 self.compute_fields(below_event, below_below_event)
                 self.compute_fields(event, below_event)
 
+    @abstractmethod
+    def sweep(self) -> Iterable[LeftEvent]:
+        """
+        Sweeps operands and returns processed events.
+        """
+
+    def to_result_endpoints(self) -> Iterator[SegmentEndpoints]:
+        """
+        Sweeps operands and returns endpoints of resulting segments lazily.
+        """
+        return (to_endpoints(event)
+                for event in self.sweep()
+                if event.from_result)
+
 
 class Difference(Operation):
     __slots__ = ()
 
     def compute(self) -> Union_[Empty, Multisegment, Segment]:
         context = self.context
-        segments_box = context.segments_box(self.linear.segments)
-        if bounding.disjoint_with(segments_box,
-                                  context.polygons_box(self.shaped.polygons)):
-            return self.linear.value
-        self.shaped.polygons = bounding.to_coupled_polygons(
-                segments_box, self.shaped.polygons, context)
-        if not self.shaped.polygons:
-            return self.linear.value
-        return unpack_segments(endpoints_to_segments([to_endpoints(event)
-                                                      for event in self.sweep()
-                                                      if event.from_result],
-                                                     context),
-                               context)
+        return (unpack_segments(
+                        endpoints_to_segments(
+                                list(self.to_result_endpoints()), context
+                        ),
+                        context
+                )
+                if self.select_coupled_polygons()
+                else self.linear.value)
+
+    def compute_length(self) -> Scalar:
+        """
+        Computes length of the result of the operation without building it.
+        """
+        context = self.context
+        return (to_endpoints_length(self.to_result_endpoints(), context)
+                if self.select_coupled_polygons()
+                else to_segments_length(self.linear.segments, context))
 
     def from_result(self, event: LeftEvent) -> bool:
         return event.from_first_operand and event.outside
 
+    def select_coupled_polygons(self) -> bool:
+        """
+        Removes polygons which cannot affect segments
+        and detects if any of them are left.
+        """
+        context = self.context
+        segments_box = self.linear.to_box(context)
+        if bounding.disjoint_with(segments_box,
+                                  self.shaped.to_box(context)):
+            return False
+        self.shaped.polygons = bounding.to_coupled_polygons(
+                segments_box, self.shaped.polygons, context)
+        return bool(self.shaped.polygons)
+
     def sweep(self) -> Iterable[LeftEvent]:
         self.fill_queue()
         result = []
@@ -160,8 +197,8 @@ class CompleteIntersection(Operation):
 
     def compute(self) -> Union_[Empty, Mix, Multipoint, Multisegment, Segment]:
         context = self.context
-        linear_box, shaped_box = (context.segments_box(self.linear.segments),
-                                  context.polygons_box(self.shaped.polygons))
+        linear_box, shaped_box = (self.linear.to_box(context),
+                                  self.shaped.to_box(context))
         if bounding.disjoint_with(linear_box, shaped_box):
             return context.empty
         self.linear.segments = bounding.to_intersecting_segments(
@@ -216,26 +253,43 @@ class Intersection(Operation):
 
     def compute(self) -> Union_[Empty, Segment, Multisegment]:
         context = self.context
-        linear_box, shaped_box = (context.segments_box(self.linear.segments),
-                                  context.polygons_box(self.shaped.polygons))
+        return (unpack_segments(
+                        endpoints_to_segments(
+                                list(self.to_result_endpoints()), context
+                        ),
+                        context
+                )
+                if self.select_intersecting_operands()
+                else context.empty)
+
+    def compute_length(self) -> Scalar:
+        """
+        Computes length of the result of the operation without building it.
+        """
+        return (to_endpoints_length(self.to_result_endpoints(), self.context)
+                if self.select_intersecting_operands()
+                else 0)
+
+    def from_result(self, event: LeftEvent) -> bool:
+        return event.from_first_operand and not event.outside
+
+    def select_intersecting_operands(self) -> bool:
+        """
+        Removes segments & polygons which cannot be a part of the result
+        and detects if any of them are left.
+        """
+        context = self.context
+        linear_box, shaped_box = (self.linear.to_box(context),
+                                  self.shaped.to_box(context))
         if bounding.disjoint_with(linear_box, shaped_box):
-            return context.empty
+            return False
         self.linear.segments = bounding.to_intersecting_segments(
                 shaped_box, self.linear.segments, context)
         if not self.linear.segments:
-            return context.empty
+            return False
         self.shaped.polygons = bounding.to_intersecting_polygons(
                 linear_box, self.shaped.polygons, context)
-        if not self.shaped.polygons:
-            return context.empty
-        segments = endpoints_to_segments([to_endpoints(event)
-                                          for event in self.sweep()
-                                          if event.from_result],
-                                         context)
-        return unpack_segments(segments, context)
-
-    def from_result(self, event: LeftEvent) -> bool:
-        return event.from_first_operand and not event.outside
+        return bool(self.shaped.polygons)
 
     def sweep(self) -> Iterable[LeftEvent]:
         self.fill_queue()
@@ -260,8 +314,8 @@ class Union(Operation):
     def compute(self) -> Union_[Empty, Mix, Multipolygon, Multisegment,
                                 Polygon, Segment]:
         context = self.context
-        linear_box, shaped_box = (context.segments_box(self.linear.segments),
-                                  context.polygons_box(self.shaped.polygons))
+        linear_box, shaped_box = (self.linear.to_box(context),
+                                  self.shaped.to_box(context))
         if bounding.disjoint_with(linear_box, shaped_box):
             return context.mix_cls(context.empty, self.linear.value,
                                    self.shaped.value)
@@ -1,15 +1,25 @@
 from abc import (ABC,
                  abstractmethod)
-from typing import Union
+from typing import (Iterable,
+                    Union)
 
-from ground.hints import (Multipolygon,
+from ground.base import Context
+from ground.hints import (Box,
+                          Multipolygon,
                           Multisegment,
                           Polygon,
                           Segment)
 from reprit.base import generate_repr
 
 from .hints import (Multiregion,
-                    Region)
+                    Region,
+                    SegmentEndpoints)
+from .integer import (are_polygons_integral,
+                      are_segments_integral)
+from .prepared import (PreparedMultipolygon,
+                       PreparedMultisegment)
+from .utils import (polygon_to_oriented_edges_endpoints,
+                    segments_to_endpoints)
 
 
 class LinearOperand(ABC):
@@ -20,17 +30,57 @@ class LinearOperand(ABC):
     def value(self) -> Union[Multisegment, Segment]:
         """Returns value of the operand."""
 
+    def is_integral(self) -> bool:
+        """Checks if the operand's segments have integer coordinates."""
+        return are_segments_integral(self.segments)
+
+    def to_box(self, context: Context) -> Box:
+        """Returns box of the operand's segments."""
+        return context.segments_box(self.segments)
+
+    def to_endpoints(self) -> Iterable[SegmentEndpoints]:
+        """Returns endpoints of the operand's segments."""
+        return segments_to_endpoints(self.segments)
+
 
 class MultisegmentOperand(LinearOperand):
-    __slots__ = '_value'
+    __slots__ = '_prepared', '_value'
 
-    def __init__(self, value: Multisegment) -> None:
-        self.segments, self._value = value.segments, value
+    def __init__(self,
+                 value: Union[Multisegment, PreparedMultisegment]) -> None:
+        if isinstance(value, PreparedMultisegment):
+            self._prepared, value = value, value.value
+            self.segments = self._prepared.segments
+        else:
+            self._prepared, self.segments = None, value.segments
+        self._value = value
 
     @property
     def value(self) -> Multisegment:
         return self._value
 
+    def is_integral(self) -> bool:
+        # segments of the multisegment can only be filtered out,
+        # so its integrality holds for them as well
+        return (super().is_integral()
+                if self._prepared is None
+                else self._prepared.is_integral)
+
+    def to_box(self, context: Context) -> Box:
+        return (self._prepared.box
+                if self._is_prepared()
+                else super().to_box(context))
+
+    def to_endpoints(self) -> Iterable[SegmentEndpoints]:
+        return (self._prepared.endpoints
+                if self._is_prepared()
+                else super().to_endpoints())
+
+    def _is_prepared(self) -> bool:
+        # precomputed data is valid only for the whole multisegment
+        return (self._prepared is not None
+                and self.segments is self._prepared.segments)
+
 
 class SegmentOperand(LinearOperand):
     __slots__ = '_value'
@@ -86,12 +136,33 @@ class HoleyOperand(ABC):
     def value(self) -> Union[Multipolygon, Polygon]:
         """Returns value of the operand."""
 
+    def is_integral(self) -> bool:
+        """Checks if the operand's polygons have integer coordinates."""
+        return are_polygons_integral(self.polygons)
+
+    def to_box(self, context: Context) -> Box:
+        """Returns box of the operand's polygons."""
+        return context.polygons_box(self.polygons)
+
+    def to_oriented_edges_endpoints(self,
+                                    polygon: Polygon,
+                                    context: Context
+                                    ) -> Iterable[SegmentEndpoints]:
+        """Returns oriented edges of the operand's polygon."""
+        return polygon_to_oriented_edges_endpoints(polygon, context)
+
 
 class MultipolygonOperand(HoleyOperand):
-    __slots__ = '_value',
+    __slots__ = '_prepared', '_value'
 
-    def __init__(self, value: Multipolygon) -> None:
-        self._value, self.polygons = value, value.polygons
+    def __init__(self,
+                 value: Union[Multipolygon, PreparedMultipolygon]) -> None:
+        if isinstance(value, PreparedMultipolygon):
+            self._prepared, value = value, value.value
+            self.polygons = self._prepared.polygons
+        else:
+            self._prepared, self.polygons = None, value.polygons
+        self._value = value
 
     __repr__ = generate_repr(__init__)
 
@@ -99,6 +170,28 @@ class MultipolygonOperand(HoleyOperand):
     def value(self) -> Multipolygon:
         return self._value
 
+    def is_integral(self) -> bool:
+        # polygons of the multipolygon can only be filtered out,
+        # so its integrality holds for them as well
+        return (super().is_integral()
+                if self._prepared is None
+                else self._prepared.is_integral)
+
+    def to_box(self, context: Context) -> Box:
+        # precomputed box is valid only for the whole multipolygon
+        return (self._prepared.box
+                if (self._prepared is not None
+                    and self.polygons is self._prepared.polygons)
+                else super().to_box(context))
+
+    def to_oriented_edges_endpoints(self,
+                                    polygon: Polygon,
+                                    context: Context
+                                    ) -> Iterable[SegmentEndpoints]:
+        return (super().to_oriented_edges_endpoints(polygon, context)
+                if self._prepared is None
+                else self._prepared.to_oriented_edges_endpoints(polygon))
+
 
 class PolygonOperand(HoleyOperand):
     __slots__ = '_value',
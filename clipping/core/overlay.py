@@ -0,0 +1,194 @@
+from typing import (Iterator,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union as Union_)
+
+from ground.base import (Context,
+                         get_context)
+from ground.hints import (Empty,
+                          Multipolygon,
+                          Polygon)
+from reprit.base import generate_repr
+
+from .holey import (LayersIntersection,
+                    Overlay)
+from .operands import MultipolygonOperand
+
+
+class MultipolygonsOverlay:
+    """
+    Overlay of two multipolygons
+    which sweeps their edges once for all boolean operations.
+
+    Operands' edges are divided at their intersections
+    and annotated with relations to the other operand only once,
+    so each result costs only assembling of its contours.
+    """
+    __slots__ = 'context', 'first', 'second', '_overlay'
+
+    def __init__(self,
+                 first: Multipolygon,
+                 second: Multipolygon,
+                 *,
+                 context: Optional[Context] = None) -> None:
+        """
+        Initializes overlay.
+
+        Time complexity:
+            ``O(segments_count * log segments_count)`` for the first result
+        Memory complexity:
+            ``O(segments_count)``
+
+        where ``segments_count = edges_count + intersections_count``,
+        ``edges_count`` --- number of edges of operands,
+        ``intersections_count`` --- number of intersections between
+        operands edges.
+
+        :param first: first operand.
+        :param second: second operand.
+        :param context: geometric context.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour = context.contour_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> first = Multipolygon([Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                        Point(4, 4), Point(0, 4)]),
+        ...                               [])])
+        >>> second = Multipolygon([Polygon(Contour([Point(2, 2), Point(6, 2),
+        ...                                         Point(6, 6),
+        ...                                         Point(2, 6)]),
+        ...                                [])])
+        >>> overlay = MultipolygonsOverlay(first, second)
+        >>> overlay.intersection() == Polygon(Contour([Point(2, 2),
+        ...                                            Point(4, 2),
+        ...                                            Point(4, 4),
+        ...                                            Point(2, 4)]), [])
+        True
+        >>> overlay.difference() == Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                          Point(4, 2), Point(2, 2),
+        ...                                          Point(2, 4),
+        ...                                          Point(0, 4)]), [])
+        True
+        >>> overlay.reversed_difference() == Polygon(
+        ...     Contour([Point(2, 4), Point(4, 4), Point(4, 2), Point(6, 2),
+        ...              Point(6, 6), Point(2, 6)]), [])
+        True
+        >>> overlay.union() == Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                     Point(4, 2), Point(6, 2),
+        ...                                     Point(6, 6), Point(2, 6),
+        ...                                     Point(2, 4), Point(0, 4)]),
+        ...                            [])
+        True
+        """
+        if context is None:
+            context = get_context()
+        self.context, self.first, self.second = context, first, second
+        self._overlay = Overlay(MultipolygonOperand(first),
+                                MultipolygonOperand(second), context)
+
+    __repr__ = generate_repr(__init__)
+
+    def difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Returns difference of the first operand with the second one.
+
+        Equivalent to
+        ``clipping.planar.subtract_multipolygons(first, second)``.
+        """
+        return self._overlay.difference()
+
+    def intersection(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Returns intersection of operands.
+
+        Equivalent to
+        ``clipping.planar.intersect_multipolygons(first, second)``.
+        """
+        return self._overlay.intersection()
+
+    def reversed_difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Returns difference of the second operand with the first one.
+
+        Equivalent to
+        ``clipping.planar.subtract_multipolygons(second, first)``.
+        """
+        return self._overlay.reversed_difference()
+
+    def symmetric_difference(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Returns symmetric difference of operands.
+
+        Equivalent to
+        ``clipping.planar.symmetric_subtract_multipolygons(first, second)``.
+        """
+        return self._overlay.symmetric_difference()
+
+    def union(self) -> Union_[Multipolygon, Polygon]:
+        """
+        Returns union of operands.
+
+        Equivalent to ``clipping.planar.unite_multipolygons(first, second)``.
+        """
+        return self._overlay.union()
+
+
+def overlay_layers(first: Sequence[Polygon],
+                   second: Sequence[Polygon],
+                   *,
+                   context: Optional[Context] = None
+                   ) -> Iterator[Tuple[int, int, Union_[Multipolygon,
+                                                        Polygon]]]:
+    """
+    Yields intersections of polygons from the first layer
+    with polygons from the second layer which have common area
+    along with indices of the intersecting polygons
+    ordered by indices.
+
+    Both layers are swept once together,
+    polygons of the same layer should not overlap.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count`` --- number of edges of layers' polygons,
+    ``intersections_count`` --- number of intersections between
+    layers' edges.
+
+    :param first: polygons of the first layer.
+    :param second: polygons of the second layer.
+    :param context: geometric context.
+    :returns:
+        triplets of index of the first layer's polygon,
+        index of the second layer's polygon & their intersection.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> def to_square(min_x, min_y, size):
+    ...     return Polygon(Contour([Point(min_x, min_y),
+    ...                             Point(min_x + size, min_y),
+    ...                             Point(min_x + size, min_y + size),
+    ...                             Point(min_x, min_y + size)]), [])
+    >>> first = [to_square(0, 0, 4), to_square(4, 0, 4)]
+    >>> second = [to_square(10, 10, 2), to_square(2, 2, 4)]
+    >>> (list(overlay_layers(first, second))
+    ...  == [(0, 1, to_square(2, 2, 2)),
+    ...      (1, 1, Polygon(Contour([Point(4, 2), Point(6, 2), Point(6, 4),
+    ...                              Point(4, 4)]), []))])
+    True
+    >>> list(overlay_layers(first, []))
+    []
+    """
+    return iter(LayersIntersection(
+            first, second, get_context() if context is None else context
+    ).compute())
@@ -0,0 +1,597 @@
+from bisect import (bisect_left,
+                    bisect_right)
+from typing import (Dict,
+                    FrozenSet,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Set,
+                    Tuple,
+                    Type,
+                    Union as Union_)
+
+from ground.base import (Context,
+                         Orientation,
+                         get_context)
+from ground.hints import (Box,
+                          Empty,
+                          Multipolygon,
+                          Point,
+                          Polygon,
+                          Scalar)
+
+from . import bounding
+from .holey import (Intersection,
+                    NaryUnion,
+                    Operation,
+                    Union,
+                    Window)
+from .operands import (HoleyOperand,
+                       MultipolygonOperand,
+                       PolygonOperand)
+from .sweep_line import (SweepLineBackend,
+                         TreeSweepLine)
+from .unpacking import unpack_polygons
+from .utils import (polygon_to_oriented_edges_endpoints,
+                    shrink_collinear_vertices,
+                    to_first_border_vertex)
+
+Shaped = Union_[Empty, Multipolygon, Polygon]
+# strip's index with index of polygon in the strip
+PieceKey = Tuple[int, int]
+# pairs of polygons joined by the seam with edges left on it
+Joint = Tuple[List[Tuple[PieceKey, PieceKey]],
+              List[Tuple[PieceKey, Point, Point]]]
+
+
+def intersect_in_strips(first: HoleyOperand,
+                        second: HoleyOperand,
+                        strips_count: int,
+                        context: Context,
+                        sweep_line_backend: SweepLineBackend = TreeSweepLine,
+                        snap_tolerance: Optional[Scalar] = None
+                        ) -> Union_[Empty, Multipolygon, Polygon]:
+    """
+    Intersects operands strip by strip and stitches strips' results.
+    """
+    first_box, second_box = first.to_box(context), second.to_box(context)
+    if bounding.disjoint_with(first_box, second_box):
+        return context.empty
+    box = context.box_cls(max(first_box.min_x, second_box.min_x),
+                          min(first_box.max_x, second_box.max_x),
+                          max(first_box.min_y, second_box.min_y),
+                          min(first_box.max_y, second_box.max_y))
+    strips = to_strips(box, [*first.polygons, *second.polygons],
+                       strips_count, context)
+    if len(strips) == 1 or box.min_y == box.max_y:
+        return Intersection(first, second, context, sweep_line_backend,
+                            snap_tolerance).compute()
+    first_boxed_polygons, second_boxed_polygons = (
+        _to_boxed_polygons(first.polygons, context),
+        _to_boxed_polygons(second.polygons, context)
+    )
+    strips_polygons = []
+    for strip in strips:
+        window = _to_window(strip, context)
+        first_pieces = _clip_polygons(window, first_boxed_polygons)
+        if not first_pieces:
+            strips_polygons.append([])
+            continue
+        second_pieces = _clip_polygons(window, second_boxed_polygons)
+        strips_polygons.append(
+                _compute_strip(Intersection, first_pieces, second_pieces,
+                               context, sweep_line_backend, snap_tolerance)
+                if second_pieces
+                else []
+        )
+    return _stitch([strip.max_x for strip in strips[:-1]], strips_polygons,
+                   context)
+
+
+def unite_in_strips(first: HoleyOperand,
+                    second: HoleyOperand,
+                    strips_count: int,
+                    context: Context,
+                    sweep_line_backend: SweepLineBackend = TreeSweepLine,
+                    snap_tolerance: Optional[Scalar] = None
+                    ) -> Union_[Multipolygon, Polygon]:
+    """
+    Unites operands strip by strip and stitches strips' results.
+    """
+    first_box, second_box = first.to_box(context), second.to_box(context)
+    if bounding.disjoint_with(first_box, second_box):
+        return Union(first, second, context, sweep_line_backend,
+                     snap_tolerance).compute()
+    box = context.box_cls(min(first_box.min_x, second_box.min_x),
+                          max(first_box.max_x, second_box.max_x),
+                          min(first_box.min_y, second_box.min_y),
+                          max(first_box.max_y, second_box.max_y))
+    strips = to_strips(box, [*first.polygons, *second.polygons],
+                       strips_count, context)
+    if len(strips) == 1:
+        return Union(first, second, context, sweep_line_backend,
+                     snap_tolerance).compute()
+    first_boxed_polygons, second_boxed_polygons = (
+        _to_boxed_polygons(first.polygons, context),
+        _to_boxed_polygons(second.polygons, context)
+    )
+    strips_polygons = []
+    for strip in strips:
+        window = _to_window(strip, context)
+        first_pieces, second_pieces = (
+            _clip_polygons(window, first_boxed_polygons),
+            _clip_polygons(window, second_boxed_polygons)
+        )
+        strips_polygons.append(
+                _compute_strip(Union, first_pieces, second_pieces, context,
+                               sweep_line_backend, snap_tolerance)
+                if first_pieces and second_pieces
+                else first_pieces or second_pieces
+        )
+    return _stitch([strip.max_x for strip in strips[:-1]], strips_polygons,
+                   context)
+
+
+class IncrementalUnion:
+    """
+    Union of polygons which can be updated polygon by polygon.
+
+    Plane is split into vertical strips by seams
+    placed once at initialization,
+    union of polygons' pieces is kept for each strip,
+    joints of strips' polygons are kept for each seam
+    and stitched polygons are kept for each group of polygons
+    joined across seams,
+    so adding, removing or replacing a polygon
+    re-sweeps only strips spanned by it
+    and re-joins only seams next to them afterwards.
+    """
+    __slots__ = ('context', '_boxes', '_joints', '_next_id', '_polygons',
+                 '_seams', '_stitches', '_strips_ids', '_strips_polygons',
+                 '_value')
+
+    def __init__(self,
+                 polygons: Sequence[Polygon],
+                 *,
+                 strips_count: int = 16,
+                 context: Optional[Context] = None) -> None:
+        """
+        Initializes union.
+
+        :param polygons: initial polygons.
+        :param strips_count:
+            maximum number of vertical strips to split the plane into.
+        :param context: geometric context.
+
+        >>> from ground.base import get_context
+        >>> context = get_context()
+        >>> Contour = context.contour_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                 Point(4, 4), Point(0, 4)]), [])
+        >>> second_square = Polygon(Contour([Point(4, 0), Point(8, 0),
+        ...                                  Point(8, 4), Point(4, 4)]), [])
+        >>> third_square = Polygon(Contour([Point(8, 0), Point(12, 0),
+        ...                                 Point(12, 4), Point(8, 4)]), [])
+        >>> union = IncrementalUnion([first_square, third_square])
+        >>> union.value == context.multipolygon_cls([first_square,
+        ...                                           third_square])
+        True
+        >>> second_square_id = union.add(second_square)
+        >>> union.value == Polygon(Contour([Point(0, 0), Point(12, 0),
+        ...                                 Point(12, 4), Point(0, 4)]), [])
+        True
+        >>> union.remove(second_square_id)
+        >>> union.value == context.multipolygon_cls([first_square,
+        ...                                           third_square])
+        True
+        """
+        if strips_count < 1:
+            raise ValueError('Strips count should be positive, '
+                             'but found: {count}.'.format(count=strips_count))
+        if context is None:
+            context = get_context()
+        self.context = context
+        self._polygons = dict(enumerate(polygons))  # type: Dict[int, Polygon]
+        self._boxes = {polygon_id: context.contour_box(polygon.border)
+                       for polygon_id, polygon in self._polygons.items()}
+        self._next_id = len(polygons)
+        self._seams = ([strip.max_x
+                        for strip in to_strips(context.polygons_box(polygons),
+                                               polygons, strips_count,
+                                               context)[:-1]]
+                       if polygons
+                       else [])  # type: List[Scalar]
+        self._strips_ids = [
+            set() for _ in range(len(self._seams) + 1)
+        ]  # type: List[Set[int]]
+        self._strips_polygons = [
+            None
+        ] * len(self._strips_ids)  # type: List[Optional[List[Polygon]]]
+        self._joints = [None] * len(self._seams)  # type: List[Optional[Joint]]
+        self._stitches = {}  # type: Dict[FrozenSet[PieceKey], List[Polygon]]
+        for polygon_id in self._polygons:
+            self._register(polygon_id)
+        self._value = None  # type: Optional[Shaped]
+
+    @property
+    def polygons(self) -> Dict[int, Polygon]:
+        """Returns current polygons by their identifiers."""
+        return dict(self._polygons)
+
+    @property
+    def value(self) -> Union_[Empty, Multipolygon, Polygon]:
+        """
+        Returns union of current polygons
+        re-sweeping strips changed since the last call.
+        """
+        if self._value is None:
+            strips_polygons = self._strips_polygons
+            for strip_index, strip_polygons in enumerate(strips_polygons):
+                if strip_polygons is None:
+                    strips_polygons[strip_index] = self._unite_strip(
+                            strip_index
+                    )
+            context, joints, seams = self.context, self._joints, self._seams
+            for seam_index, joint in enumerate(joints):
+                if joint is None:
+                    joints[seam_index] = _join_seam(seams[seam_index],
+                                                    seam_index,
+                                                    strips_polygons, context)
+            groups = _to_groups(joints)
+            result = [polygon
+                      for strip_index, strip_polygons
+                      in enumerate(strips_polygons)
+                      for polygon_index, polygon in enumerate(strip_polygons)
+                      if (strip_index, polygon_index) not in groups]
+            for group in set(groups.values()):
+                try:
+                    result += self._stitches[group]
+                except KeyError:
+                    stitch = self._stitches[group] = _stitch_group(
+                            group, seams, strips_polygons, joints, context
+                    )
+                    result += stitch
+            result.sort(key=to_first_border_vertex)
+            self._value = unpack_polygons(result, context)
+        return self._value
+
+    def add(self, polygon: Polygon) -> int:
+        """Adds polygon to the union and returns its identifier."""
+        polygon_id, self._next_id = self._next_id, self._next_id + 1
+        self._polygons[polygon_id] = polygon
+        self._boxes[polygon_id] = self.context.contour_box(polygon.border)
+        self._register(polygon_id)
+        return polygon_id
+
+    def remove(self, polygon_id: int) -> None:
+        """Removes polygon with given identifier from the union."""
+        self._unregister(polygon_id)
+        del self._polygons[polygon_id], self._boxes[polygon_id]
+
+    def replace(self, polygon_id: int, polygon: Polygon) -> None:
+        """Replaces polygon with given identifier keeping the identifier."""
+        self._unregister(polygon_id)
+        self._polygons[polygon_id] = polygon
+        self._boxes[polygon_id] = self.context.contour_box(polygon.border)
+        self._register(polygon_id)
+
+    def _invalidate_strip(self, strip_index: int) -> None:
+        self._strips_polygons[strip_index] = None
+        if strip_index:
+            self._joints[strip_index - 1] = None
+        if strip_index < len(self._joints):
+            self._joints[strip_index] = None
+        for group in [group
+                      for group in self._stitches
+                      if any(piece_strip_index == strip_index
+                             for piece_strip_index, _ in group)]:
+            del self._stitches[group]
+
+    def _register(self, polygon_id: int) -> None:
+        for strip_index in self._to_strips_indices(self._boxes[polygon_id]):
+            self._strips_ids[strip_index].add(polygon_id)
+            self._invalidate_strip(strip_index)
+        self._value = None
+
+    def _to_strips_indices(self, box: Box) -> range:
+        # strips which interiors overlap with the box's one
+        return range(bisect_right(self._seams, box.min_x),
+                     bisect_left(self._seams, box.max_x) + 1)
+
+    def _unite_strip(self, strip_index: int) -> List[Polygon]:
+        polygons_ids = sorted(self._strips_ids[strip_index])
+        if not polygons_ids:
+            return []
+        boxes, context, seams = self._boxes, self.context, self._seams
+        boxed_polygons = [(boxes[polygon_id], self._polygons[polygon_id])
+                          for polygon_id in polygons_ids]
+        strip = context.box_cls(
+                (seams[strip_index - 1]
+                 if strip_index
+                 else min(box.min_x for box, _ in boxed_polygons)),
+                (seams[strip_index]
+                 if strip_index < len(seams)
+                 else max(box.max_x for box, _ in boxed_polygons)),
+                min(box.min_y for box, _ in boxed_polygons),
+                max(box.max_y for box, _ in boxed_polygons)
+        )
+        pieces = _clip_polygons(_to_window(strip, context), boxed_polygons)
+        return _to_polygons(
+                NaryUnion([PolygonOperand(piece) for piece in pieces],
+                          context).compute(),
+                context
+        )
+
+    def _unregister(self, polygon_id: int) -> None:
+        for strip_index in self._to_strips_indices(self._boxes[polygon_id]):
+            self._strips_ids[strip_index].remove(polygon_id)
+            self._invalidate_strip(strip_index)
+        self._value = None
+
+
+def to_strips(box: Box,
+              polygons: Sequence[Polygon],
+              strips_count: int,
+              context: Context) -> List[Box]:
+    """
+    Splits the box into vertical strips
+    with (roughly) equal numbers of polygons' border vertices in each.
+
+    Seams are placed at abscissas of vertices,
+    so strips' coordinates have the same type as polygons' ones.
+    """
+    abscissas = sorted(vertex.x
+                       for polygon in polygons
+                       for vertex in polygon.border.vertices
+                       if box.min_x < vertex.x < box.max_x)
+    seams = (sorted({abscissas[len(abscissas) * index // strips_count]
+                     for index in range(1, strips_count)})
+             if abscissas
+             else [])
+    edges = [box.min_x, *seams, box.max_x]
+    box_cls = context.box_cls
+    return [box_cls(min_x, max_x, box.min_y, box.max_y)
+            for min_x, max_x in zip(edges, edges[1:])]
+
+
+def _clip_polygons(window: Window,
+                   boxed_polygons: Iterable[Tuple[Box, Polygon]]
+                   ) -> List[Polygon]:
+    context, strip = window.context, window.box
+    result = []
+    for polygon_box, polygon in boxed_polygons:
+        if (not bounding.intersects_with(polygon_box, strip)
+                or bounding.touches_with(polygon_box, strip)):
+            # shaped parts can come only from overlap of boxes' interiors
+            continue
+        elif bounding.is_subset_of(polygon_box, strip):
+            result.append(polygon)
+        else:
+            result += _to_polygons(window.intersect(PolygonOperand(polygon)),
+                                   context)
+    return result
+
+
+def _compute_strip(operation_cls: Type[Operation],
+                   first_pieces: List[Polygon],
+                   second_pieces: List[Polygon],
+                   context: Context,
+                   sweep_line_backend: SweepLineBackend,
+                   snap_tolerance: Optional[Scalar]) -> List[Polygon]:
+    multipolygon_cls = context.multipolygon_cls
+    return _to_polygons(
+            operation_cls(MultipolygonOperand(multipolygon_cls(first_pieces)),
+                          MultipolygonOperand(multipolygon_cls(second_pieces)),
+                          context, sweep_line_backend,
+                          snap_tolerance).compute(),
+            context
+    )
+
+
+def _join_seam(seam: Scalar,
+               seam_index: int,
+               strips_polygons: Sequence[List[Polygon]],
+               context: Context) -> Joint:
+    # edges of polygons from both sides which lie on the seam
+    # are split into elementary segments between their endpoints,
+    # oppositely directed segments cancel each other out
+    # joining their polygons & the rest become edges of stitched ones
+    seam_edges = []
+    for strip_index in (seam_index, seam_index + 1):
+        for polygon_index, polygon in enumerate(strips_polygons[strip_index]):
+            seam_edges += [
+                ((strip_index, polygon_index), start, end)
+                for start, end in polygon_to_oriented_edges_endpoints(polygon,
+                                                                      context)
+                if start.x == seam and end.x == seam
+            ]
+    points = {}  # type: Dict[Scalar, Point]
+    for _, start, end in seam_edges:
+        points.setdefault(start.y, start)
+        points.setdefault(end.y, end)
+    ordinates = sorted(points)
+    segments_owners = {}  # type: Dict[int, Tuple[List[PieceKey], ...]]
+    for owner, start, end in seam_edges:
+        is_upward = start.y < end.y
+        min_y, max_y = (start.y, end.y) if is_upward else (end.y, start.y)
+        for index in range(bisect_left(ordinates, min_y),
+                           bisect_left(ordinates, max_y)):
+            segments_owners.setdefault(index, ([], []))[is_upward].append(
+                    owner
+            )
+    links, edges = [], []
+    for index, (downward_owners, upward_owners) in sorted(
+            segments_owners.items()
+    ):
+        links += zip(upward_owners, downward_owners)
+        bottom, top = points[ordinates[index]], points[ordinates[index + 1]]
+        edges += [(owner, bottom, top)
+                  for owner in upward_owners[len(downward_owners):]]
+        edges += [(owner, top, bottom)
+                  for owner in downward_owners[len(upward_owners):]]
+    return links, edges
+
+
+def _stitch(seams: Sequence[Scalar],
+            strips_polygons: Sequence[List[Polygon]],
+            context: Context) -> Union_[Empty, Multipolygon, Polygon]:
+    # only polygons joined across seams between strips are continued
+    # in neighbouring strips, so the rest of them are final
+    joints = [_join_seam(seam, seam_index, strips_polygons, context)
+              for seam_index, seam in enumerate(seams)]
+    groups = _to_groups(joints)
+    result = [polygon
+              for strip_index, strip_polygons in enumerate(strips_polygons)
+              for polygon_index, polygon in enumerate(strip_polygons)
+              if (strip_index, polygon_index) not in groups]
+    for group in set(groups.values()):
+        result += _stitch_group(group, seams, strips_polygons, joints,
+                                context)
+    result.sort(key=to_first_border_vertex)
+    return unpack_polygons(result, context)
+
+
+def _stitch_group(group: FrozenSet[PieceKey],
+                  seams: Sequence[Scalar],
+                  strips_polygons: Sequence[List[Polygon]],
+                  joints: Sequence[Joint],
+                  context: Context) -> List[Polygon]:
+    # boundary of the group's union consists of its polygons' edges
+    # except the ones on seams which are replaced by seams' leftovers,
+    # so contours are traced without sweeping
+    next_vertices = {}  # type: Dict[Point, List[Point]]
+    for strip_index, polygon_index in group:
+        seams_x = seams[max(strip_index - 1, 0):strip_index + 1]
+        for start, end in polygon_to_oriented_edges_endpoints(
+                strips_polygons[strip_index][polygon_index], context
+        ):
+            if not (start.x == end.x and start.x in seams_x):
+                next_vertices.setdefault(start, []).append(end)
+    seams_indices = {seam_index
+                     for strip_index, _ in group
+                     for seam_index in (strip_index - 1, strip_index)
+                     if 0 <= seam_index < len(seams)}
+    for seam_index in sorted(seams_indices):
+        for owner, start, end in joints[seam_index][1]:
+            if owner in group:
+                next_vertices.setdefault(start, []).append(end)
+    rings = _trace_rings(next_vertices)
+    if rings is None:
+        return _unite_group(group, strips_polygons, context)
+    borders, holes = [], []
+    orienteer = context.angle_orientation
+    for vertices in rings:
+        shrink_collinear_vertices(vertices, orienteer)
+        if len(vertices) < 3:
+            return _unite_group(group, strips_polygons, context)
+        min_index = min(range(len(vertices)), key=vertices.__getitem__)
+        vertices = vertices[min_index:] + vertices[:min_index]
+        (borders
+         if (orienteer(vertices[-1], vertices[0], vertices[1])
+             is Orientation.COUNTERCLOCKWISE)
+         else holes).append(context.contour_cls(vertices))
+    if len(borders) != 1:
+        # joined polygons have connected interiors,
+        # so their union has a single border
+        # unless contours are degenerate
+        return _unite_group(group, strips_polygons, context)
+    return [context.polygon_cls(borders[0], holes)]
+
+
+def _to_boxed_polygons(polygons: Sequence[Polygon],
+                       context: Context) -> List[Tuple[Box, Polygon]]:
+    return [(context.contour_box(polygon.border), polygon)
+            for polygon in polygons]
+
+
+def _to_groups(joints: Iterable[Joint]
+               ) -> Dict[PieceKey, FrozenSet[PieceKey]]:
+    # groups of strips' polygons joined across seams
+    parents = {}  # type: Dict[PieceKey, PieceKey]
+
+    def to_root(key: PieceKey) -> PieceKey:
+        root = parents.setdefault(key, key)
+        while root != parents[root]:
+            root = parents[root]
+        while key != root:
+            parents[key], key = root, parents[key]
+        return root
+
+    for links, _ in joints:
+        for left, right in links:
+            parents[to_root(left)] = to_root(right)
+    members = {}  # type: Dict[PieceKey, List[PieceKey]]
+    for key in parents:
+        members.setdefault(to_root(key), []).append(key)
+    return {key: group
+            for group in map(frozenset, members.values())
+            for key in group}
+
+
+def _to_polygons(geometry: Union_[Empty, Multipolygon, Polygon],
+                 context: Context) -> List[Polygon]:
+    return ([]
+            if geometry is context.empty
+            else (list(geometry.polygons)
+                  if isinstance(geometry, context.multipolygon_cls)
+                  else [geometry]))
+
+
+def _to_window(strip: Box, context: Context) -> Window:
+    return Window([context.polygon_cls(
+            context.contour_cls(list(bounding.to_vertices(strip, context))),
+            []
+    )], context)
+
+
+def _trace_rings(next_vertices: Dict[Point, List[Point]]
+                 ) -> Optional[List[List[Point]]]:
+    # walks edges splitting the walk into rings on revisited vertices,
+    # so vertices shared by several rings do not need to be paired up,
+    # returns nothing if some edge has no continuation
+    rings = []
+    while next_vertices:
+        start = next(iter(next_vertices))
+        path, positions = [start], {start: 0}
+        cursor = start
+        while True:
+            try:
+                ends = next_vertices[cursor]
+            except KeyError:
+                return None
+            cursor = ends.pop()
+            if not ends:
+                del next_vertices[path[-1]]
+            try:
+                index = positions[cursor]
+            except KeyError:
+                positions[cursor] = len(path)
+                path.append(cursor)
+                continue
+            rings.append(path[index:])
+            for vertex in path[index + 1:]:
+                del positions[vertex]
+            del path[index + 1:]
+            if not index and cursor not in next_vertices:
+                break
+    return rings
+
+
+def _unite_group(group: FrozenSet[PieceKey],
+                 strips_polygons: Sequence[List[Polygon]],
+                 context: Context) -> List[Polygon]:
+    strips_pieces = {}  # type: Dict[int, List[Polygon]]
+    for strip_index, polygon_index in sorted(group):
+        strips_pieces.setdefault(strip_index, []).append(
+                strips_polygons[strip_index][polygon_index]
+        )
+    multipolygon_cls = context.multipolygon_cls
+    return _to_polygons(
+            NaryUnion([MultipolygonOperand(multipolygon_cls(pieces))
+                       for pieces in strips_pieces.values()],
+                      context).compute(),
+            context
+    )
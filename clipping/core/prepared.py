@@ -0,0 +1,130 @@
+from typing import (Dict,
+                    Optional,
+                    Sequence)
+
+from ground.base import (Context,
+                         get_context)
+from ground.hints import (Multipolygon,
+                          Multisegment,
+                          Polygon)
+from reprit.base import generate_repr
+
+from .hints import SegmentEndpoints
+from .integer import (are_polygons_integral,
+                      are_segments_integral)
+from .utils import (polygon_to_oriented_edges_endpoints,
+                    segments_to_endpoints)
+
+
+class PreparedMultipolygon:
+    """
+    Multipolygon with precomputed box, oriented edges
+    & integrality of coordinates shared between operations.
+
+    Can be passed to ``clipping.planar`` functions
+    instead of the multipolygon it is prepared from,
+    precomputed data is never changed after initialization,
+    so the object can be used by concurrent operations.
+    """
+    __slots__ = ('box', 'context', 'is_integral', 'polygons', 'value',
+                 '_edges_endpoints')
+
+    def __init__(self,
+                 value: Multipolygon,
+                 *,
+                 context: Optional[Context] = None) -> None:
+        """
+        Initializes prepared multipolygon.
+
+        :param value: multipolygon to prepare.
+        :param context: geometric context.
+
+        >>> from ground.base import get_context
+        >>> from clipping.planar import subtract_multipolygons
+        >>> context = get_context()
+        >>> Contour = context.contour_cls
+        >>> Multipolygon = context.multipolygon_cls
+        >>> Point = context.point_cls
+        >>> Polygon = context.polygon_cls
+        >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+        ...                                 Point(4, 4), Point(0, 4)]), [])
+        >>> second_square = Polygon(Contour([Point(2, 0), Point(6, 0),
+        ...                                  Point(6, 4), Point(2, 4)]), [])
+        >>> prepared = PreparedMultipolygon(Multipolygon([second_square]))
+        >>> (subtract_multipolygons(Multipolygon([first_square]), prepared)
+        ...  == Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 4),
+        ...                      Point(0, 4)]), []))
+        True
+        """
+        if context is None:
+            context = get_context()
+        self.context, self.polygons, self.value = (context, value.polygons,
+                                                   value)
+        self.box = context.polygons_box(self.polygons)
+        self.is_integral = are_polygons_integral(self.polygons)
+        self._edges_endpoints = {
+            id(polygon): tuple(polygon_to_oriented_edges_endpoints(polygon,
+                                                                   context))
+            for polygon in self.polygons
+        }  # type: Dict[int, Sequence[SegmentEndpoints]]
+
+    __repr__ = generate_repr(__init__)
+
+    def to_oriented_edges_endpoints(self, polygon: Polygon
+                                    ) -> Sequence[SegmentEndpoints]:
+        """
+        Returns precomputed oriented edges of the polygon
+        which should be one of the multipolygon's polygons.
+        """
+        return self._edges_endpoints[id(polygon)]
+
+
+class PreparedMultisegment:
+    """
+    Multisegment with precomputed box, segments' endpoints
+    & integrality of coordinates shared between operations.
+
+    Can be passed to ``clipping.planar`` functions
+    instead of the multisegment it is prepared from,
+    precomputed data is never changed after initialization,
+    so the object can be used by concurrent operations.
+    """
+    __slots__ = ('box', 'context', 'endpoints', 'is_integral', 'segments',
+                 'value')
+
+    def __init__(self,
+                 value: Multisegment,
+                 *,
+                 context: Optional[Context] = None) -> None:
+        """
+        Initializes prepared multisegment.
+
+        :param value: multisegment to prepare.
+        :param context: geometric context.
+
+        >>> from ground.base import get_context
+        >>> from clipping.planar import subtract_multisegments
+        >>> context = get_context()
+        >>> Multisegment = context.multisegment_cls
+        >>> Point = context.point_cls
+        >>> Segment = context.segment_cls
+        >>> prepared = PreparedMultisegment(
+        ...     Multisegment([Segment(Point(2, 0), Point(6, 0)),
+        ...                   Segment(Point(0, 2), Point(4, 2))]))
+        >>> (subtract_multisegments(
+        ...      Multisegment([Segment(Point(0, 0), Point(4, 0)),
+        ...                    Segment(Point(0, 4), Point(4, 4))]),
+        ...      prepared)
+        ...  == Multisegment([Segment(Point(0, 0), Point(2, 0)),
+        ...                   Segment(Point(0, 4), Point(4, 4))]))
+        True
+        """
+        if context is None:
+            context = get_context()
+        self.context, self.segments, self.value = (context, value.segments,
+                                                   value)
+        self.box = context.segments_box(self.segments)
+        self.endpoints = tuple(segments_to_endpoints(self.segments))
+        self.is_integral = are_segments_integral(self.segments)
+
+    __repr__ = generate_repr(__init__)
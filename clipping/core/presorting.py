@@ -0,0 +1,119 @@
+from typing import (Callable,
+                    Generic,
+                    List,
+                    Optional,
+                    Sequence,
+                    TypeVar)
+
+from prioq.base import PriorityQueue
+from reprit.base import generate_repr
+
+from .event import Event
+
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
+
+Key = TypeVar('Key')
+Value = TypeVar('Value')
+Presort = Callable[[Sequence[Value], Callable[[Value], Key]], List[Value]]
+# integers with greater absolute values
+# can not be exactly represented as double precision floats
+MAX_EXACT_INTEGER = 2 ** 53
+
+
+class PresortedQueue(Generic[Key, Value]):
+    """
+    Priority queue which sorts values pushed before the first pop at once
+    and keeps only the values pushed afterwards in a heap.
+    """
+    __slots__ = '_dynamic', '_is_sorted', '_key', '_presort', '_sorted'
+
+    def __init__(self,
+                 key: Callable[[Value], Key],
+                 presort: Optional[Presort] = None) -> None:
+        self._key, self._presort = key, (presort_events
+                                         if presort is None
+                                         else presort)
+        self._dynamic = PriorityQueue(key=key)
+        self._is_sorted, self._sorted = False, []  # type: bool, List[Value]
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._sorted or self._dynamic)
+
+    @property
+    def key(self) -> Callable[[Value], Key]:
+        return self._key
+
+    def pop(self) -> Value:
+        if not self._is_sorted:
+            # values are stored in descending order to pop from the end
+            self._sorted = self._presort(self._sorted, self._key)[::-1]
+            self._is_sorted = True
+        sorted_, dynamic = self._sorted, self._dynamic
+        return (sorted_.pop()
+                if (not dynamic
+                    or sorted_ and not (self._key(dynamic.peek())
+                                        < self._key(sorted_[-1])))
+                else dynamic.pop())
+
+    def push(self, value: Value) -> None:
+        if self._is_sorted:
+            self._dynamic.push(value)
+        else:
+            self._sorted.append(value)
+
+
+def presort_events(events: Sequence[Event],
+                   key: Callable[[Event], Key]) -> List[Event]:
+    """
+    Returns events sorted by given key.
+
+    If ``numpy`` is available and all coordinates of events' starts
+    are exactly representable by double precision floats,
+    events are sorted by starts & sides in a single vectorized pass,
+    leaving to ``key`` only events which share both of them.
+    """
+    if _numpy is None or not all(_is_exact_float(event.start.x)
+                                 and _is_exact_float(event.start.y)
+                                 for event in events):
+        return sorted(events,
+                      key=key)
+    xs = _numpy.fromiter((event.start.x for event in events),
+                         dtype=float,
+                         count=len(events))
+    ys = _numpy.fromiter((event.start.y for event in events),
+                         dtype=float,
+                         count=len(events))
+    are_left = _numpy.fromiter((event.is_left for event in events),
+                               dtype=bool,
+                               count=len(events))
+    # right events with the same start are processed first
+    order = _numpy.lexsort((are_left, ys, xs))
+    xs, ys, are_left = xs[order], ys[order], are_left[order]
+    groups_stops = (_numpy.flatnonzero((xs[1:] != xs[:-1])
+                                       | (ys[1:] != ys[:-1])
+                                       | (are_left[1:] != are_left[:-1]))
+                    + 1).tolist()
+    groups_stops.append(len(events))
+    order = order.tolist()
+    result = []
+    group_start = 0
+    for group_stop in groups_stops:
+        group = [events[index] for index in order[group_start:group_stop]]
+        if len(group) > 1:
+            # events with the same start and side
+            # are ordered by their segments' slopes
+            group.sort(key=key)
+        result.extend(group)
+        group_start = group_stop
+    return result
+
+
+def _is_exact_float(value: object) -> bool:
+    return (isinstance(value, float)
+            or (isinstance(value, int)
+                and -MAX_EXACT_INTEGER <= value <= MAX_EXACT_INTEGER))
@@ -0,0 +1,150 @@
+from math import (ceil,
+                  sqrt)
+from typing import (Callable,
+                    List,
+                    Sequence,
+                    Union)
+
+from ground.base import Context
+from ground.hints import (Box,
+                          Scalar)
+from reprit.base import generate_repr
+
+Predicate = Callable[[Box, Box], bool]
+
+
+class Leaf:
+    __slots__ = 'box', 'index'
+
+    def __init__(self, box: Box, index: int) -> None:
+        self.box, self.index = box, index
+
+    __repr__ = generate_repr(__init__)
+
+
+class Node:
+    __slots__ = 'box', 'children'
+
+    def __init__(self, box: Box, children: Sequence[Union[Leaf, 'Node']]
+                 ) -> None:
+        self.box, self.children = box, children
+
+    __repr__ = generate_repr(__init__)
+
+
+class RTree:
+    """
+    Packed R-tree of boxes built with Sort-Tile-Recursive algorithm.
+
+    Reference:
+        https://doi.org/10.1109/ICDE.1997.582015
+    """
+    __slots__ = 'boxes', 'context', 'max_children', '_root'
+
+    def __init__(self,
+                 boxes: Sequence[Box],
+                 context: Context,
+                 *,
+                 max_children: int = 16) -> None:
+        """
+        Initializes tree from boxes.
+
+        :param boxes: boxes to index.
+        :param context: geometric context.
+        :param max_children: maximum number of children of a node.
+        """
+        self.boxes, self.context, self.max_children = (boxes, context,
+                                                       max_children)
+        self._root = _build(boxes, max_children, context)
+
+    __repr__ = generate_repr(__init__)
+
+    def find_indices(self, box: Box, predicate: Predicate) -> List[int]:
+        """
+        Returns sorted indices of boxes which satisfy predicate with the box.
+
+        Predicate should hold for every box
+        which contains a box satisfying predicate,
+        since it is used for pruning nodes as well.
+        """
+        result = []
+        if self._root is None:
+            return result
+        queue = [self._root]
+        while queue:
+            node = queue.pop()
+            if predicate(node.box, box):
+                if isinstance(node, Leaf):
+                    result.append(node.index)
+                else:
+                    queue.extend(node.children)
+        result.sort()
+        return result
+
+    def has_box(self, box: Box, predicate: Predicate) -> bool:
+        """
+        Checks if any of boxes satisfies predicate with the box.
+
+        Predicate should hold for every box
+        which contains a box satisfying predicate,
+        since it is used for pruning nodes as well.
+        """
+        if self._root is None:
+            return False
+        queue = [self._root]
+        while queue:
+            node = queue.pop()
+            if predicate(node.box, box):
+                if isinstance(node, Leaf):
+                    return True
+                queue.extend(node.children)
+        return False
+
+
+def _build(boxes: Sequence[Box],
+           max_children: int,
+           context: Context) -> Union[Leaf, Node, None]:
+    if not boxes:
+        return None
+    nodes = [
+        Leaf(box, index) for index, box in enumerate(boxes)
+    ]  # type: List[Union[Leaf, Node]]
+    while len(nodes) > 1:
+        nodes = [Node(_merge_boxes([child.box for child in children],
+                                   context),
+                      children)
+                 for children in _to_tiles(nodes, max_children)]
+    return nodes[0]
+
+
+def _merge_boxes(boxes: Sequence[Box], context: Context) -> Box:
+    return context.box_cls(min(box.min_x for box in boxes),
+                           max(box.max_x for box in boxes),
+                           min(box.min_y for box in boxes),
+                           max(box.max_y for box in boxes))
+
+
+def _to_tiles(nodes: List[Union[Leaf, Node]],
+              max_children: int) -> List[Sequence[Union[Leaf, Node]]]:
+    tiles_count = ceil(len(nodes) / max_children)
+    slice_size = ceil(sqrt(tiles_count)) * max_children
+    # doubled centers' coordinates do not need division
+    nodes = sorted(nodes,
+                   key=_to_doubled_center_x)
+    result = []
+    for slice_start in range(0, len(nodes), slice_size):
+        slice_ = sorted(nodes[slice_start:slice_start + slice_size],
+                        key=_to_doubled_center_y)
+        result.extend(slice_[tile_start:tile_start + max_children]
+                      for tile_start in range(0, len(slice_), max_children))
+    return result
+
+
+def _to_doubled_center_x(node: Union[Leaf, Node]) -> Scalar:
+    box = node.box
+    return box.min_x + box.max_x
+
+
+def _to_doubled_center_y(node: Union[Leaf, Node]) -> Scalar:
+    box = node.box
+    return box.min_y + box.max_y
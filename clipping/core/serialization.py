@@ -0,0 +1,128 @@
+from typing import (Any,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from ground.base import Context
+from ground.hints import (Contour,
+                          Empty,
+                          Mix,
+                          Multipoint,
+                          Multipolygon,
+                          Multisegment,
+                          Point,
+                          Polygon,
+                          Segment)
+
+from .enums import GeometryKind
+from .hints import Multiregion
+
+Geometry = Union[Contour, Empty, Mix, Multipoint, Multipolygon, Multiregion,
+                 Multisegment, Polygon, Segment]
+PackedPoint = Tuple[Any, Any]
+PackedContour = Tuple[PackedPoint, ...]
+PackedPolygon = Tuple[PackedContour, Tuple[PackedContour, ...]]
+Packed = Tuple[Any, ...]
+
+
+def pack(geometry: Geometry, context: Context) -> Packed:
+    """
+    Packs geometry into nested tuples of coordinates
+    which are cheap to pickle.
+    """
+    if geometry is context.empty:
+        return GeometryKind.EMPTY,
+    elif isinstance(geometry, context.multipoint_cls):
+        return GeometryKind.MULTIPOINT, _pack_points(geometry.points)
+    elif isinstance(geometry, context.segment_cls):
+        return GeometryKind.SEGMENT, _pack_segment(geometry)
+    elif isinstance(geometry, context.multisegment_cls):
+        return GeometryKind.MULTISEGMENT, tuple(map(_pack_segment,
+                                                    geometry.segments))
+    elif isinstance(geometry, context.contour_cls):
+        return GeometryKind.CONTOUR, _pack_contour(geometry)
+    elif isinstance(geometry, context.polygon_cls):
+        return GeometryKind.POLYGON, _pack_polygon(geometry)
+    elif isinstance(geometry, context.multipolygon_cls):
+        return GeometryKind.MULTIPOLYGON, tuple(map(_pack_polygon,
+                                                    geometry.polygons))
+    elif isinstance(geometry, context.mix_cls):
+        return (GeometryKind.MIX, pack(geometry.discrete, context),
+                pack(geometry.linear, context),
+                pack(geometry.shaped, context))
+    elif isinstance(geometry, (list, tuple)):
+        return GeometryKind.MULTIREGION, tuple(map(_pack_contour, geometry))
+    raise TypeError('Unsupported geometry type: {type}.'
+                    .format(type=type(geometry)))
+
+
+def unpack(packed: Packed, context: Context) -> Geometry:
+    """
+    Restores geometry packed by ``pack`` function.
+    """
+    kind = packed[0]
+    if kind is GeometryKind.EMPTY:
+        return context.empty
+    elif kind is GeometryKind.MULTIPOINT:
+        return context.multipoint_cls(_unpack_points(packed[1], context))
+    elif kind is GeometryKind.SEGMENT:
+        return _unpack_segment(packed[1], context)
+    elif kind is GeometryKind.MULTISEGMENT:
+        return context.multisegment_cls([_unpack_segment(segment, context)
+                                         for segment in packed[1]])
+    elif kind is GeometryKind.CONTOUR:
+        return _unpack_contour(packed[1], context)
+    elif kind is GeometryKind.MULTIREGION:
+        return [_unpack_contour(contour, context) for contour in packed[1]]
+    elif kind is GeometryKind.POLYGON:
+        return _unpack_polygon(packed[1], context)
+    elif kind is GeometryKind.MULTIPOLYGON:
+        return context.multipolygon_cls([_unpack_polygon(polygon, context)
+                                         for polygon in packed[1]])
+    else:
+        assert kind is GeometryKind.MIX, kind
+        return context.mix_cls(unpack(packed[1], context),
+                               unpack(packed[2], context),
+                               unpack(packed[3], context))
+
+
+def _pack_contour(contour: Contour) -> PackedContour:
+    return _pack_points(contour.vertices)
+
+
+def _pack_points(points: Sequence[Point]) -> Tuple[PackedPoint, ...]:
+    return tuple((point.x, point.y) for point in points)
+
+
+def _pack_polygon(polygon: Polygon) -> PackedPolygon:
+    return (_pack_contour(polygon.border),
+            tuple(map(_pack_contour, polygon.holes)))
+
+
+def _pack_segment(segment: Segment) -> Tuple[PackedPoint, PackedPoint]:
+    start, end = segment.start, segment.end
+    return (start.x, start.y), (end.x, end.y)
+
+
+def _unpack_contour(vertices: PackedContour, context: Context) -> Contour:
+    return context.contour_cls(_unpack_points(vertices, context))
+
+
+def _unpack_points(points: Sequence[PackedPoint],
+                   context: Context) -> Sequence[Point]:
+    point_cls = context.point_cls
+    return [point_cls(x, y) for x, y in points]
+
+
+def _unpack_polygon(polygon: PackedPolygon, context: Context) -> Polygon:
+    border, holes = polygon
+    return context.polygon_cls(_unpack_contour(border, context),
+                               [_unpack_contour(hole, context)
+                                for hole in holes])
+
+
+def _unpack_segment(segment: Tuple[PackedPoint, PackedPoint],
+                    context: Context) -> Segment:
+    start, end = segment
+    point_cls = context.point_cls
+    return context.segment_cls(point_cls(*start), point_cls(*end))
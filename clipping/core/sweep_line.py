@@ -1,9 +1,14 @@
 from abc import (ABC,
                  abstractmethod)
 from functools import partial
-from typing import (Generic,
+from random import Random
+from typing import (Callable,
+                    Dict,
+                    Generic,
+                    List,
                     Optional,
-                    TypeVar)
+                    TypeVar,
+                    Union)
 
 from dendroid import red_black
 from ground.base import (Context,
@@ -12,9 +17,13 @@ from reprit.base import generate_repr
 
 from .event import LeftEvent
 from .hints import Orienteer
+from .tracing import current_trace
 
 Event = TypeVar('Event',
                 bound=LeftEvent)
+Key = TypeVar('Key')
+# skip list levels are limited to handle up to ``2 ** MAX_LEVEL`` events
+MAX_LEVEL = 32
 
 
 class SweepLine(ABC, Generic[Event]):
@@ -29,8 +38,12 @@ class SweepLine(ABC, Generic[Event]):
         """Returns event which is above the given one."""
 
     @abstractmethod
-    def add(self, event: Event) -> None:
-        """Adds given event to the sweep line."""
+    def add(self, event: Event) -> 'Handle':
+        """
+        Adds given event to the sweep line
+        and returns handle of its position
+        which stays valid until the event is removed.
+        """
 
     @abstractmethod
     def below(self, event: Event) -> Optional[Event]:
@@ -41,64 +54,167 @@ class SweepLine(ABC, Generic[Event]):
         """Removes given event from the sweep line."""
 
 
-class BinarySweepLine(SweepLine):
-    __slots__ = 'context', '_set'
+class TreeSweepLine(SweepLine):
+    """
+    Sweep line backed by a red-black tree.
 
-    def __init__(self, context: Context) -> None:
-        self.context = context
-        self._set = red_black.set_(key=partial(BinarySweepLineKey,
-                                               context.angle_orientation))
+    Events' nodes are kept by events, so only addition searches the tree.
+    """
+    __slots__ = 'key', '_handles', '_trace', '_tree'
+
+    def __init__(self, key: Callable[[Event], Key]) -> None:
+        self.key = key
+        self._handles = {}  # type: Dict[Event, red_black.Node]
+        self._trace = current_trace()
+        self._tree = red_black.Tree.from_components([])
+
+    __repr__ = generate_repr(__init__)
 
     def __contains__(self, event: Event) -> bool:
-        return event in self._set
+        return event in self._handles
 
-    def add(self, event: Event) -> None:
-        self._set.add(event)
+    def add(self, event: Event) -> red_black.Node:
+        result = self._handles[event] = self._tree.insert(self.key(event),
+                                                          event)
+        if self._trace is not None:
+            self._trace.record_sweep_line_size(len(self._handles))
+        return result
 
     def remove(self, event: Event) -> None:
-        self._set.remove(event)
+        self._tree.remove(self._handles.pop(event))
 
     def above(self, event: Event) -> Optional[Event]:
-        try:
-            return self._set.next(event)
-        except ValueError:
-            return None
+        node = self._tree.successor(self._handles[event])
+        return None if node is red_black.NIL else node.value
 
     def below(self, event: Event) -> Optional[Event]:
-        try:
-            return self._set.prev(event)
-        except ValueError:
-            return None
+        node = self._tree.predecessor(self._handles[event])
+        return None if node is red_black.NIL else node.value
 
 
-class NarySweepLine(SweepLine):
-    __slots__ = 'context', '_set'
+class SkipListNode:
+    __slots__ = 'key', 'nexts', 'previous', 'value'
 
-    def __init__(self, context: Context) -> None:
-        self.context = context
-        self._set = red_black.set_(key=partial(NarySweepLineKey,
-                                               context.angle_orientation))
+    def __init__(self, key: Optional[Key], value: Optional[Event],
+                 level: int) -> None:
+        self.key, self.value = key, value
+        self.nexts = [None] * level  # type: List[Optional[SkipListNode]]
+        self.previous = [None] * level  # type: List[Optional[SkipListNode]]
+
+    __repr__ = generate_repr(__init__)
 
-    def __contains__(self, event: Event) -> bool:
-        return event in self._set
 
-    def add(self, event: Event) -> None:
-        self._set.add(event)
+class SkipListSweepLine(SweepLine):
+    """
+    Sweep line backed by a skip list.
+
+    Nodes are linked in both directions on each level,
+    so neighbours & removal do not compare events at all.
+    """
+    __slots__ = ('key', 'seed', '_handles', '_head', '_level', '_random',
+                 '_trace')
+
+    def __init__(self, key: Callable[[Event], Key], seed: int = 0) -> None:
+        self.key, self.seed = key, seed
+        self._handles = {}  # type: Dict[Event, SkipListNode]
+        self._head = SkipListNode(None, None, MAX_LEVEL)
+        self._level, self._random = 1, Random(seed)
+        self._trace = current_trace()
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, event: Event) -> bool:
+        return event in self._handles
+
+    def add(self, event: Event) -> SkipListNode:
+        key = self.key(event)
+        node = self._head
+        predecessors = [node] * MAX_LEVEL
+        for level in reversed(range(self._level)):
+            candidate = node.nexts[level]
+            while candidate is not None and candidate.key < key:
+                node, candidate = candidate, candidate.nexts[level]
+            predecessors[level] = node
+        result_level = self._to_random_level()
+        self._level = max(self._level, result_level)
+        result = self._handles[event] = SkipListNode(key, event, result_level)
+        for level in range(result_level):
+            predecessor = predecessors[level]
+            successor = predecessor.nexts[level]
+            result.previous[level], result.nexts[level] = (predecessor,
+                                                           successor)
+            predecessor.nexts[level] = result
+            if successor is not None:
+                successor.previous[level] = result
+        if self._trace is not None:
+            self._trace.record_sweep_line_size(len(self._handles))
+        return result
 
     def remove(self, event: Event) -> None:
-        self._set.remove(event)
+        node = self._handles.pop(event)
+        for level in range(len(node.nexts)):
+            predecessor, successor = (node.previous[level],
+                                      node.nexts[level])
+            predecessor.nexts[level] = successor
+            if successor is not None:
+                successor.previous[level] = predecessor
 
     def above(self, event: Event) -> Optional[Event]:
-        try:
-            return self._set.next(event)
-        except ValueError:
-            return None
+        node = self._handles[event].nexts[0]
+        return None if node is None else node.value
 
     def below(self, event: Event) -> Optional[Event]:
-        try:
-            return self._set.prev(event)
-        except ValueError:
-            return None
+        node = self._handles[event].previous[0]
+        return None if node is self._head else node.value
+
+    def _to_random_level(self) -> int:
+        # each next level is chosen with probability of one half
+        bits, result = self._random.getrandbits(MAX_LEVEL - 1), 1
+        while bits & 1:
+            bits >>= 1
+            result += 1
+        return result
+
+
+Handle = Union[red_black.Node, SkipListNode]
+SweepLineBackend = Callable[[Callable[[Event], Key]], SweepLine]
+SWEEP_LINE_BACKENDS = {
+    'skip_list': SkipListSweepLine,
+    'tree': TreeSweepLine
+}  # type: Dict[str, SweepLineBackend]
+
+
+class BinarySweepLine(TreeSweepLine):
+    __slots__ = 'context',
+
+    def __init__(self, context: Context) -> None:
+        self.context = context
+        super().__init__(partial(BinarySweepLineKey,
+                                 context.angle_orientation))
+
+    __repr__ = generate_repr(__init__)
+
+
+class NarySweepLine(TreeSweepLine):
+    __slots__ = 'context',
+
+    def __init__(self, context: Context) -> None:
+        self.context = context
+        super().__init__(partial(NarySweepLineKey,
+                                 context.angle_orientation))
+
+    __repr__ = generate_repr(__init__)
+
+
+class NaryHoleySweepLine(TreeSweepLine):
+    __slots__ = 'context',
+
+    def __init__(self, context: Context) -> None:
+        self.context = context
+        super().__init__(partial(NaryHoleySweepLineKey,
+                                 context.angle_orientation))
+
+    __repr__ = generate_repr(__init__)
 
 
 class BinarySweepLineKey:
@@ -210,3 +326,59 @@ class NarySweepLineKey:
             return start_orientation is Orientation.CLOCKWISE
         else:
             return other_start_orientation is Orientation.COUNTERCLOCKWISE
+
+
+class NaryHoleySweepLineKey:
+    __slots__ = 'event', 'orienteer'
+
+    def __init__(self, orienteer: Orienteer, event: Event) -> None:
+        self.orienteer, self.event = orienteer, event
+
+    __repr__ = generate_repr(__init__)
+
+    def __lt__(self, other: 'NaryHoleySweepLineKey') -> bool:
+        """
+        Checks if the segment (or at least the point) associated with event
+        is lower than other's.
+        """
+        event, other_event = self.event, other.event
+        if event is other_event:
+            return False
+        start, other_start = event.start, other_event.start
+        end, other_end = event.end, other_event.end
+        other_start_orientation = self.orienteer(start, end, other_start)
+        other_end_orientation = self.orienteer(start, end, other_end)
+        if other_start_orientation is other_end_orientation:
+            if other_start_orientation is not Orientation.COLLINEAR:
+                # other segment fully lies on one side
+                return other_start_orientation is Orientation.COUNTERCLOCKWISE
+            # segments are collinear
+            elif event.operand_id != other_event.operand_id:
+                return event.operand_id < other_event.operand_id
+            elif start.x == other_start.x:
+                if start.y != other_start.y:
+                    # segments are vertical
+                    return start.y < other_start.y
+                # segments have same start
+                elif end.y != other_end.y:
+                    return end.y < other_end.y
+                else:
+                    # segments are horizontal
+                    return end.x < other_end.x
+            elif start.y != other_start.y:
+                return start.y < other_start.y
+            else:
+                # segments are horizontal
+                return start.x < other_start.x
+        start_orientation = self.orienteer(other_start, other_end, start)
+        end_orientation = self.orienteer(other_start, other_end, end)
+        if start_orientation is end_orientation:
+            return start_orientation is Orientation.CLOCKWISE
+        elif other_start_orientation is Orientation.COLLINEAR:
+            return other_end_orientation is Orientation.COUNTERCLOCKWISE
+        elif start_orientation is Orientation.COLLINEAR:
+            return end_orientation is Orientation.CLOCKWISE
+        elif end_orientation is Orientation.COLLINEAR:
+            return start_orientation is Orientation.CLOCKWISE
+        else:
+            return other_start_orientation is Orientation.COUNTERCLOCKWISE
@@ -0,0 +1,140 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import (Callable,
+                    Dict,
+                    Iterator,
+                    Optional,
+                    Union)
+
+from ground.base import Relation
+from reprit.base import generate_repr
+
+from .presorting import (Key,
+                         Presort,
+                         PresortedQueue,
+                         Value)
+
+FILL_PHASE = 'fill'
+SORT_PHASE = 'sort'
+SWEEP_PHASE = 'sweep'
+
+
+class Trace:
+    """
+    Counters & wall times of operations' phases
+    accumulated while tracing is enabled.
+
+    Phases are
+
+    - ``'fill'``: from creation of events queue till its first pop,
+      i.e. bounding filtering of operands & registration of their edges,
+    - ``'sort'``: presorting of registered events,
+    - ``'sweep'``: from the first pop of events till the last one,
+
+    the rest of ``total_time`` is spent on building the results.
+    """
+    __slots__ = ('bounding_candidates', 'bounding_survivors', 'divisions',
+                 'events_popped', 'events_pushed', 'phases_times',
+                 'relations', 'sweep_line_max_size', 'total_time')
+
+    def __init__(self) -> None:
+        self.bounding_candidates = self.bounding_survivors = 0
+        self.divisions = self.events_popped = self.events_pushed = 0
+        self.phases_times = dict.fromkeys([FILL_PHASE, SORT_PHASE,
+                                           SWEEP_PHASE],
+                                          0.)  # type: Dict[str, float]
+        self.relations = Counter()  # type: Counter[Relation]
+        self.sweep_line_max_size = 0
+        self.total_time = 0.
+
+    def __repr__(self) -> str:
+        return ('{}.{}('.format(type(self).__module__,
+                                type(self).__qualname__)
+                + ', '.join('{}={!r}'.format(name, getattr(self, name))
+                            for name in self.__slots__)
+                + ')')
+
+    def record_bounding(self, candidates_count: int,
+                        survivors_count: int) -> None:
+        self.bounding_candidates += candidates_count
+        self.bounding_survivors += survivors_count
+
+    def record_sweep_line_size(self, size: int) -> None:
+        if size > self.sweep_line_max_size:
+            self.sweep_line_max_size = size
+
+
+_trace = ContextVar('trace',
+                    default=None)  # type: ContextVar[Optional[Trace]]
+
+
+def current_trace() -> Optional[Trace]:
+    """Returns trace which is being accumulated if any."""
+    return _trace.get()
+
+
+@contextmanager
+def tracing() -> Iterator[Trace]:
+    """
+    Enables accumulation of counters & timings of operations
+    started in the current context till exit.
+    """
+    result = Trace()
+    token = _trace.set(result)
+    start = perf_counter()
+    try:
+        yield result
+    finally:
+        result.total_time += perf_counter() - start
+        _trace.reset(token)
+
+
+class TracedPresortedQueue(PresortedQueue):
+    """Presorted queue which records its traffic & timings to a trace."""
+    __slots__ = 'trace', '_created_at', '_popped_at'
+
+    def __init__(self,
+                 key: Callable[[Value], Key],
+                 trace: Trace,
+                 presort: Optional[Presort] = None) -> None:
+        super().__init__(key, presort)
+        self.trace = trace
+        self._created_at = perf_counter()
+        self._popped_at = None  # type: Optional[float]
+
+    __repr__ = generate_repr(__init__)
+
+    def pop(self) -> Value:
+        trace = self.trace
+        if self._popped_at is None:
+            sort_start = perf_counter()
+            trace.phases_times[FILL_PHASE] += sort_start - self._created_at
+            result = super().pop()
+            self._popped_at = perf_counter()
+            trace.phases_times[SORT_PHASE] += self._popped_at - sort_start
+        else:
+            result = super().pop()
+            popped_at = perf_counter()
+            trace.phases_times[SWEEP_PHASE] += popped_at - self._popped_at
+            self._popped_at = popped_at
+        trace.events_popped += 1
+        return result
+
+    def push(self, value: Value) -> None:
+        self.trace.events_pushed += 1
+        super().push(value)
+
+
+def to_presorted_queue(key: Callable[[Value], Key],
+                       presort: Optional[Presort] = None
+                       ) -> Union[PresortedQueue, TracedPresortedQueue]:
+    """
+    Returns presorted queue with given key
+    which is traced if tracing is enabled.
+    """
+    trace = _trace.get()
+    return (PresortedQueue(key, presort)
+            if trace is None
+            else TracedPresortedQueue(key, trace, presort))
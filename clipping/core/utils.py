@@ -1,3 +1,4 @@
+from fractions import Fraction
 from itertools import (chain,
                        groupby)
 from typing import (Any,
@@ -17,6 +18,8 @@ from .hints import (Orienteer,
                     Region,
                     SegmentEndpoints)
 
+HALF = Fraction(1, 2)
+
 
 def all_equal(iterable: Iterable[Any]) -> bool:
     groups = groupby(iterable)
@@ -61,6 +64,39 @@ def to_first_border_vertex(polygon: Polygon) -> Point:
     return polygon.border.vertices[0]
 
 
+def to_min_border_vertex(polygon: Polygon) -> Point:
+    return min(polygon.border.vertices)
+
+
+def to_polygons_doubled_area(polygons: Iterable[Polygon],
+                             context: Context) -> Scalar:
+    return sum(to_region_doubled_area(polygon.border, context)
+               - sum(to_region_doubled_area(hole, context)
+                     for hole in polygon.holes)
+               for polygon in polygons)
+
+
+def to_region_doubled_area(region: Region, context: Context) -> Scalar:
+    cross_product, origin = context.cross_product, context.origin
+    vertices = region.vertices
+    return abs(sum(cross_product(origin, vertices[index - 1], origin,
+                                 vertices[index])
+                   for index in range(len(vertices))))
+
+
+def to_endpoints_length(endpoints: Iterable[SegmentEndpoints],
+                        context: Context) -> Scalar:
+    points_squared_distance, sqrt = (context.points_squared_distance,
+                                     context.sqrt)
+    return sum(sqrt(points_squared_distance(start, end))
+               for start, end in endpoints)
+
+
+def to_segments_length(segments: Iterable[Segment],
+                       context: Context) -> Scalar:
+    return sum(context.segment_length(segment) for segment in segments)
+
+
 def to_regions_x_max(regions: Sequence[Region]) -> Scalar:
     return max(vertex.x
                for border in regions
@@ -0,0 +1,26 @@
+"""
+Lazy boolean expressions over multipolygons evaluated by a single sweep.
+
+>>> from ground.base import get_context
+>>> context = get_context()
+>>> Contour = context.contour_cls
+>>> Multipolygon = context.multipolygon_cls
+>>> Point = context.point_cls
+>>> Polygon = context.polygon_cls
+>>> first = Operand(Multipolygon([Polygon(Contour([Point(0, 0), Point(4, 0),
+...                                                Point(4, 4), Point(0, 4)]),
+...                                       [])]))
+>>> second = Operand(Multipolygon([Polygon(Contour([Point(2, 2), Point(6, 2),
+...                                                 Point(6, 6), Point(2, 6)]),
+...                                        [])]))
+>>> ((first | second) & first).evaluate() == first.value.polygons[0]
+True
+>>> (first - second).evaluate() == Polygon(
+...     Contour([Point(0, 0), Point(4, 0), Point(4, 2), Point(2, 2),
+...              Point(2, 4), Point(0, 4)]), [])
+True
+"""
+from .core import expression as _expression
+
+Expression = _expression.Expression
+Operand = _expression.Operand
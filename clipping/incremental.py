@@ -0,0 +1,4 @@
+"""Boolean operations updated as their operands change."""
+from .core import partition as _partition
+
+IncrementalUnion = _partition.IncrementalUnion
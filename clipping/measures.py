@@ -0,0 +1,499 @@
+"""Measures of boolean operations' results computed without building them."""
+from typing import (Optional as _Optional,
+                    Union as _Union)
+
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+from ground.hints import (Multipolygon as _Multipolygon,
+                          Multisegment as _Multisegment,
+                          Polygon as _Polygon,
+                          Scalar as _Scalar,
+                          Segment as _Segment)
+
+from .core import (holey as _holey,
+                   linear as _linear,
+                   mixed as _mixed,
+                   operands as _operands)
+
+_Linear = _Union[_Multisegment, _Segment]
+_Shaped = _Union[_Multipolygon, _Polygon]
+
+
+def intersection_area(first: _Shaped,
+                      second: _Shaped,
+                      *,
+                      compact: bool = False,
+                      context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns area of intersection of shaped geometries.
+
+    Signed areas of resulting edges are accumulated during the sweep,
+    so no contours are assembled.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of edges
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param compact:
+        flag which determines whether events of the measure's sweep
+        are kept in arrays of events store instead of separate objects,
+        trading speed for memory of the sweep.
+    :param context: geometric context.
+    :returns: area of intersection of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> intersection_area(first_square, first_square) == 16
+    True
+    >>> intersection_area(first_square, second_square) == 4
+    True
+    >>> intersection_area(first_square, second_square, compact=True) == 4
+    True
+    >>> intersection_area(first_square, third_square) == 0
+    True
+    >>> intersection_area(Multipolygon([first_square, third_square]),
+    ...                   second_square) == 4
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _holey.Intersection(_to_shaped_operand(first, context),
+                               _to_shaped_operand(second, context),
+                               context).compute_area(compact)
+
+
+def difference_area(minuend: _Shaped,
+                    subtrahend: _Shaped,
+                    *,
+                    compact: bool = False,
+                    context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns area of difference of shaped geometries.
+
+    Signed areas of resulting edges are accumulated during the sweep,
+    so no contours are assembled.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = minuend_edges_count + subtrahend_edges_count``,
+    ``minuend_edges_count`` & ``subtrahend_edges_count`` --- number of edges
+    of the minuend & the subtrahend respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param minuend: geometry to subtract from.
+    :param subtrahend: geometry to subtract.
+    :param compact:
+        flag which determines whether events of the measure's sweep
+        are kept in arrays of events store instead of separate objects,
+        trading speed for memory of the sweep.
+    :param context: geometric context.
+    :returns: area of difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> difference_area(first_square, first_square) == 0
+    True
+    >>> difference_area(first_square, second_square) == 12
+    True
+    >>> difference_area(first_square, third_square) == 16
+    True
+    >>> difference_area(Multipolygon([first_square, third_square]),
+    ...                 second_square) == 13
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _holey.Difference(_to_shaped_operand(minuend, context),
+                             _to_shaped_operand(subtrahend, context),
+                             context).compute_area(compact)
+
+
+def symmetric_difference_area(first: _Shaped,
+                              second: _Shaped,
+                              *,
+                              compact: bool = False,
+                              context: _Optional[_Context] = None
+                              ) -> _Scalar:
+    """
+    Returns area of symmetric difference of shaped geometries.
+
+    Signed areas of resulting edges are accumulated during the sweep,
+    so no contours are assembled.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of edges
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param compact:
+        flag which determines whether events of the measure's sweep
+        are kept in arrays of events store instead of separate objects,
+        trading speed for memory of the sweep.
+    :param context: geometric context.
+    :returns: area of symmetric difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> symmetric_difference_area(first_square, first_square) == 0
+    True
+    >>> symmetric_difference_area(first_square, second_square) == 24
+    True
+    >>> symmetric_difference_area(first_square, third_square) == 17
+    True
+    >>> symmetric_difference_area(Multipolygon([first_square, third_square]),
+    ...                           second_square) == 25
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _holey.SymmetricDifference(_to_shaped_operand(first, context),
+                                      _to_shaped_operand(second, context),
+                                      context).compute_area(compact)
+
+
+def union_area(first: _Shaped,
+               second: _Shaped,
+               *,
+               compact: bool = False,
+               context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns area of union of shaped geometries.
+
+    Signed areas of resulting edges are accumulated during the sweep,
+    so no contours are assembled.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of edges
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param compact:
+        flag which determines whether events of the measure's sweep
+        are kept in arrays of events store instead of separate objects,
+        trading speed for memory of the sweep.
+    :param context: geometric context.
+    :returns: area of union of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> union_area(first_square, first_square) == 16
+    True
+    >>> union_area(first_square, second_square) == 28
+    True
+    >>> union_area(first_square, third_square) == 17
+    True
+    >>> union_area(Multipolygon([first_square, third_square]),
+    ...            second_square) == 29
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _holey.Union(_to_shaped_operand(first, context),
+                        _to_shaped_operand(second, context),
+                        context).compute_area(compact)
+
+
+def intersection_length(first: _Linear,
+                        second: _Union[_Linear, _Shaped],
+                        *,
+                        context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns length of linear part of intersection
+    of linear geometry with linear or shaped one.
+
+    Lengths of resulting segments are accumulated during the sweep,
+    so no segments are built.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of edges
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: length of intersection of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multisegment = context.multisegment_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> intersection_length(Segment(Point(0, 0), Point(4, 0)),
+    ...                     Segment(Point(2, 0), Point(6, 0))) == 2
+    True
+    >>> intersection_length(Segment(Point(0, 0), Point(4, 0)),
+    ...                     Segment(Point(2, -2), Point(2, 2))) == 0
+    True
+    >>> intersection_length(Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                                   Segment(Point(2, 2), Point(6, 2))]),
+    ...                     square) == 6
+    True
+    """
+    if context is None:
+        context = _get_context()
+    linear = _to_linear_operand(first, context)
+    return (_mixed.Intersection(linear, _to_shaped_operand(second, context),
+                                context)
+            if _is_shaped(second, context)
+            else _linear.Intersection(linear,
+                                      _to_linear_operand(second, context),
+                                      context)).compute_length()
+
+
+def difference_length(minuend: _Linear,
+                      subtrahend: _Union[_Linear, _Shaped],
+                      *,
+                      context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns length of difference
+    of linear geometry with linear or shaped one.
+
+    Lengths of resulting segments are accumulated during the sweep,
+    so no segments are built.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = minuend_edges_count + subtrahend_edges_count``,
+    ``minuend_edges_count`` & ``subtrahend_edges_count`` --- number of edges
+    of the minuend & the subtrahend respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    edges.
+
+    :param minuend: geometry to subtract from.
+    :param subtrahend: geometry to subtract.
+    :param context: geometric context.
+    :returns: length of difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multisegment = context.multisegment_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> difference_length(Segment(Point(0, 0), Point(4, 0)),
+    ...                   Segment(Point(2, 0), Point(6, 0))) == 2
+    True
+    >>> difference_length(Segment(Point(0, 0), Point(4, 0)),
+    ...                   Segment(Point(2, -2), Point(2, 2))) == 4
+    True
+    >>> difference_length(Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                                 Segment(Point(2, 2), Point(6, 2))]),
+    ...                   square) == 2
+    True
+    """
+    if context is None:
+        context = _get_context()
+    linear = _to_linear_operand(minuend, context)
+    return (_mixed.Difference(linear, _to_shaped_operand(subtrahend, context),
+                              context)
+            if _is_shaped(subtrahend, context)
+            else _linear.Difference(linear,
+                                    _to_linear_operand(subtrahend, context),
+                                    context)).compute_length()
+
+
+def symmetric_difference_length(first: _Linear,
+                                second: _Linear,
+                                *,
+                                context: _Optional[_Context] = None
+                                ) -> _Scalar:
+    """
+    Returns length of symmetric difference of linear geometries.
+
+    Lengths of resulting segments are accumulated during the sweep,
+    so no segments are built.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of segments
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    segments.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: length of symmetric difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Multisegment = context.multisegment_cls
+    >>> Point = context.point_cls
+    >>> Segment = context.segment_cls
+    >>> symmetric_difference_length(Segment(Point(0, 0), Point(4, 0)),
+    ...                             Segment(Point(2, 0), Point(6, 0))) == 4
+    True
+    >>> symmetric_difference_length(
+    ...     Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                   Segment(Point(0, 2), Point(4, 2))]),
+    ...     Segment(Point(2, 0), Point(2, 2))) == 10
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _linear.SymmetricDifference(_to_linear_operand(first, context),
+                                       _to_linear_operand(second, context),
+                                       context).compute_length()
+
+
+def union_length(first: _Linear,
+                 second: _Linear,
+                 *,
+                 context: _Optional[_Context] = None) -> _Scalar:
+    """
+    Returns length of union of linear geometries.
+
+    Lengths of resulting segments are accumulated during the sweep,
+    so no segments are built.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count`` & ``second_edges_count`` --- number of segments
+    of the first & the second geometry respectively,
+    ``intersections_count`` --- number of intersections between geometries'
+    segments.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: length of union of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Multisegment = context.multisegment_cls
+    >>> Point = context.point_cls
+    >>> Segment = context.segment_cls
+    >>> union_length(Segment(Point(0, 0), Point(4, 0)),
+    ...              Segment(Point(2, 0), Point(6, 0))) == 6
+    True
+    >>> union_length(Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                            Segment(Point(0, 2), Point(4, 2))]),
+    ...              Segment(Point(2, 0), Point(2, 2))) == 10
+    True
+    """
+    if context is None:
+        context = _get_context()
+    return _linear.Union(_to_linear_operand(first, context),
+                         _to_linear_operand(second, context),
+                         context).compute_length()
+
+
+def _is_shaped(geometry: _Union[_Linear, _Shaped], context: _Context) -> bool:
+    return isinstance(geometry, (context.multipolygon_cls,
+                                 context.polygon_cls))
+
+
+def _to_linear_operand(geometry: _Linear,
+                       context: _Context) -> _operands.LinearOperand:
+    return (_operands.MultisegmentOperand(geometry)
+            if isinstance(geometry, context.multisegment_cls)
+            else _operands.SegmentOperand(geometry))
+
+
+def _to_shaped_operand(geometry: _Shaped,
+                       context: _Context) -> _operands.HoleyOperand:
+    return (_operands.MultipolygonOperand(geometry)
+            if isinstance(geometry, context.multipolygon_cls)
+            else _operands.PolygonOperand(geometry))
@@ -0,0 +1,5 @@
+"""Boolean operations on the same operands sharing a single sweep."""
+from .core import overlay as _overlay
+
+MultipolygonsOverlay = _overlay.MultipolygonsOverlay
+overlay_layers = _overlay.overlay_layers
@@ -0,0 +1,266 @@
+"""
+Boolean operations on many pairs of geometries
+executed in a pool of processes.
+"""
+import os as _os
+from collections import deque as _deque
+from concurrent.futures import (FIRST_COMPLETED as _FIRST_COMPLETED,
+                                Future as _Future,
+                                ProcessPoolExecutor as _ProcessPoolExecutor,
+                                wait as _wait)
+from itertools import (count as _count,
+                       islice as _islice)
+from typing import (Any as _Any,
+                    Deque as _Deque,
+                    Dict as _Dict,
+                    Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    List as _List,
+                    Optional as _Optional,
+                    Sequence as _Sequence,
+                    Tuple as _Tuple)
+
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+
+from . import planar as _planar
+from .core import serialization as _serialization
+
+# operations over sequences of multipolygons are not binary
+# and their operands are not supported by packing
+OPERATIONS_NAMES = frozenset(
+        name
+        for name in vars(_planar)
+        if (name.startswith(('complete_intersect_', 'intersect_', 'subtract_',
+                             'symmetric_subtract_', 'unite_'))
+            and '_many_' not in name)
+)
+DEFAULT_CHUNK_SIZE = 64
+
+
+def map_operation(operation_name: str,
+                  operands_pairs: _Iterable[_Tuple[_Any, _Any]],
+                  *,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  max_workers: _Optional[int] = None,
+                  context: _Optional[_Context] = None) -> _Iterator[_Any]:
+    """
+    Returns results of the operation from ``clipping.planar`` module
+    applied to each pair of operands in a pool of processes
+    in the same order as pairs.
+
+    Pairs are sent to workers in chunks
+    with geometries packed into tuples of coordinates.
+
+    Time complexity:
+        ``O(operations_complexity / workers_count)``
+    Memory complexity:
+        ``O(workers_count * chunk_size)``
+
+    where ``operations_complexity`` --- sum of complexities
+    of the operation applied to each pair of operands.
+
+    :param operation_name:
+        name of the binary operation from ``clipping.planar`` module.
+    :param operands_pairs: pairs of operands.
+    :param chunk_size: number of pairs sent to worker at once.
+    :param max_workers:
+        maximum number of processes,
+        defaults to the number of processors on the machine.
+    :param context: geometric context.
+    :returns: iterator over results of the operation.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> results = map_operation('intersect_polygons',
+    ...                         [(first_square, second_square),
+    ...                          (first_square, third_square)],
+    ...                         max_workers=2)
+    >>> next(results) == Polygon(Contour([Point(2, 2), Point(4, 2),
+    ...                                   Point(4, 4), Point(2, 4)]), [])
+    True
+    >>> next(results) is EMPTY
+    True
+    >>> next(results, None) is None
+    True
+    """
+    _validate(operation_name, chunk_size)
+    return _map_operation(operation_name, operands_pairs, chunk_size,
+                          _to_workers_count(max_workers), context)
+
+
+def map_operation_unordered(operation_name: str,
+                            operands_pairs: _Iterable[_Tuple[_Any, _Any]],
+                            *,
+                            chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            max_workers: _Optional[int] = None,
+                            context: _Optional[_Context] = None
+                            ) -> _Iterator[_Tuple[int, _Any]]:
+    """
+    Returns results of the operation from ``clipping.planar`` module
+    applied to each pair of operands in a pool of processes
+    as soon as they are computed along with indices of the pairs.
+
+    Time complexity:
+        ``O(operations_complexity / workers_count)``
+    Memory complexity:
+        ``O(workers_count * chunk_size)``
+
+    where ``operations_complexity`` --- sum of complexities
+    of the operation applied to each pair of operands.
+
+    :param operation_name:
+        name of the binary operation from ``clipping.planar`` module.
+    :param operands_pairs: pairs of operands.
+    :param chunk_size: number of pairs sent to worker at once.
+    :param max_workers:
+        maximum number of processes,
+        defaults to the number of processors on the machine.
+    :param context: geometric context.
+    :returns: iterator over indices of pairs with results of the operation.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> second_square = Polygon(Contour([Point(2, 2), Point(6, 2),
+    ...                                  Point(6, 6), Point(2, 6)]), [])
+    >>> third_square = Polygon(Contour([Point(8, 8), Point(9, 8),
+    ...                                 Point(9, 9), Point(8, 9)]), [])
+    >>> results = dict(map_operation_unordered(
+    ...     'intersect_polygons', [(first_square, second_square),
+    ...                            (first_square, third_square)],
+    ...     chunk_size=1,
+    ...     max_workers=2))
+    >>> results[0] == Polygon(Contour([Point(2, 2), Point(4, 2),
+    ...                                Point(4, 4), Point(2, 4)]), [])
+    True
+    >>> results[1] is EMPTY
+    True
+    """
+    _validate(operation_name, chunk_size)
+    return _map_operation_unordered(operation_name, operands_pairs,
+                                    chunk_size,
+                                    _to_workers_count(max_workers), context)
+
+
+def _execute_chunk(operation_name: str,
+                   chunk: _Sequence[_Tuple[_serialization.Packed,
+                                           _serialization.Packed]],
+                   context: _Optional[_Context]
+                   ) -> _List[_serialization.Packed]:
+    operation = getattr(_planar, operation_name)
+    pack, unpack = _serialization.pack, _serialization.unpack
+    # default context is resolved in the worker
+    # since only it is recognized there as the one to specialize
+    geometries_context = _get_context() if context is None else context
+    return [pack(operation(unpack(first, geometries_context),
+                           unpack(second, geometries_context),
+                           context=context),
+                 geometries_context)
+            for first, second in chunk]
+
+
+def _map_operation(operation_name: str,
+                   operands_pairs: _Iterable[_Tuple[_Any, _Any]],
+                   chunk_size: int,
+                   workers_count: int,
+                   context: _Optional[_Context]) -> _Iterator[_Any]:
+    geometries_context = _get_context() if context is None else context
+    with _ProcessPoolExecutor(workers_count) as executor:
+        # keeping workers busy while results are consumed
+        max_pending_count = 2 * workers_count
+        pending_futures = _deque()  # type: _Deque[_Future]
+        for chunk in _to_packed_chunks(operands_pairs, chunk_size,
+                                       geometries_context):
+            pending_futures.append(executor.submit(_execute_chunk,
+                                                   operation_name, chunk,
+                                                   context))
+            if len(pending_futures) == max_pending_count:
+                yield from _to_unpacked(pending_futures.popleft().result(),
+                                        geometries_context)
+        while pending_futures:
+            yield from _to_unpacked(pending_futures.popleft().result(),
+                                    geometries_context)
+
+
+def _map_operation_unordered(operation_name: str,
+                             operands_pairs: _Iterable[_Tuple[_Any, _Any]],
+                             chunk_size: int,
+                             workers_count: int,
+                             context: _Optional[_Context]
+                             ) -> _Iterator[_Tuple[int, _Any]]:
+    geometries_context = _get_context() if context is None else context
+    with _ProcessPoolExecutor(workers_count) as executor:
+        max_pending_count = 2 * workers_count
+        pending_futures = {}  # type: _Dict[_Future, int]
+        chunks = _to_packed_chunks(operands_pairs, chunk_size,
+                                   geometries_context)
+        for start, chunk in zip(_count(0, chunk_size), chunks):
+            pending_futures[executor.submit(_execute_chunk, operation_name,
+                                            chunk, context)] = start
+            if len(pending_futures) == max_pending_count:
+                yield from _to_unpacked_completed(pending_futures,
+                                                  geometries_context)
+        while pending_futures:
+            yield from _to_unpacked_completed(pending_futures,
+                                              geometries_context)
+
+
+def _to_packed_chunks(operands_pairs: _Iterable[_Tuple[_Any, _Any]],
+                      size: int,
+                      context: _Context
+                      ) -> _Iterator[_List[_Tuple[_serialization.Packed,
+                                                  _serialization.Packed]]]:
+    pack = _serialization.pack
+    iterator = iter(operands_pairs)
+    while True:
+        chunk = [(pack(first, context), pack(second, context))
+                 for first, second in _islice(iterator, size)]
+        if not chunk:
+            return
+        yield chunk
+
+
+def _to_unpacked(chunk: _Sequence[_serialization.Packed],
+                 context: _Context) -> _Iterator[_Any]:
+    unpack = _serialization.unpack
+    return (unpack(packed, context) for packed in chunk)
+
+
+def _to_unpacked_completed(pending_futures: _Dict[_Future, int],
+                           context: _Context
+                           ) -> _Iterator[_Tuple[int, _Any]]:
+    done_futures, _ = _wait(pending_futures,
+                            return_when=_FIRST_COMPLETED)
+    for future in done_futures:
+        start = pending_futures.pop(future)
+        yield from enumerate(_to_unpacked(future.result(), context), start)
+
+
+def _to_workers_count(max_workers: _Optional[int]) -> int:
+    return (_os.cpu_count() or 1) if max_workers is None else max_workers
+
+
+def _validate(operation_name: str, chunk_size: int) -> None:
+    if operation_name not in OPERATIONS_NAMES:
+        raise ValueError('Unsupported operation: {name!r}, should be one of '
+                         '{names}.'.format(name=operation_name,
+                                           names=sorted(OPERATIONS_NAMES)))
+    elif chunk_size < 1:
+        raise ValueError('Chunk size should be positive, but found: {size}.'
+                         .format(size=chunk_size))
@@ -28,13 +28,17 @@ from ground.hints import (Empty as _Empty,
                           Multipolygon as _Multipolygon,
                           Multisegment as _Multisegment,
                           Polygon as _Polygon,
+                          Scalar as _Scalar,
                           Segment as _Segment)
 
 from .core import (holeless as _holeless,
                    holey as _holey,
                    linear as _linear,
                    mixed as _mixed,
-                   operands as _operands)
+                   operands as _operands,
+                   partition as _partition)
+from .core.sweep_line import (SWEEP_LINE_BACKENDS as _SWEEP_LINE_BACKENDS,
+                              SweepLineBackend as _SweepLineBackend)
 from .hints import (Multiregion as _Multiregion,
                     Region as _Region)
 
@@ -1497,6 +1501,7 @@ def complete_intersect_multisegments(first: _Multisegment,
 def intersect_multisegments(first: _Multisegment,
                             second: _Multisegment,
                             *,
+                            snap_tolerance: _Optional[_Scalar] = None,
                             context: _Optional[_Context] = None
                             ) -> _Union[_Empty, _Segment, _Multisegment]:
     """
@@ -1513,6 +1518,12 @@ def intersect_multisegments(first: _Multisegment,
 
     :param first: first operand.
     :param second: second operand.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: intersection of operands.
 
@@ -1537,16 +1548,19 @@ def intersect_multisegments(first: _Multisegment,
     ...  == Segment(Point(0, 0), Point(1, 0)))
     True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return _linear.Intersection(
             _operands.MultisegmentOperand(first),
             _operands.MultisegmentOperand(second),
-            _get_context() if context is None else context
+            _get_context() if context is None else context,
+            snap_tolerance=snap_tolerance
     ).compute()
 
 
 def subtract_multisegments(minuend: _Multisegment,
                            subtrahend: _Multisegment,
                            *,
+                           snap_tolerance: _Optional[_Scalar] = None,
                            context: _Optional[_Context] = None
                            ) -> _Union[_Empty, _Segment, _Multisegment]:
     """
@@ -1563,6 +1577,12 @@ def subtract_multisegments(minuend: _Multisegment,
 
     :param minuend: multisegment to subtract from.
     :param subtrahend: multisegment to subtract.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: difference between minuend and subtrahend.
 
@@ -1586,16 +1606,29 @@ def subtract_multisegments(minuend: _Multisegment,
     ...                    Segment(Point(0, 0), Point(2, 2))]))
     ...  == Segment(Point(0, 1), Point(1, 1)))
     True
+    >>> from fractions import Fraction
+    >>> (subtract_multisegments(
+    ...      Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                    Segment(Point(0, 2), Point(4, 2))]),
+    ...      Multisegment([Segment(Point(4 - Fraction(1, 10 ** 9), -1),
+    ...                            Point(4, 1))]),
+    ...      snap_tolerance=Fraction(1, 10 ** 6))
+    ...  == Multisegment([Segment(Point(0, 0), Point(4, 0)),
+    ...                   Segment(Point(0, 2), Point(4, 2))]))
+    True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return (_linear.Difference(_operands.MultisegmentOperand(minuend),
                                _operands.MultisegmentOperand(subtrahend),
-                               _get_context() if context is None else context)
+                               _get_context() if context is None else context,
+                               snap_tolerance=snap_tolerance)
             .compute())
 
 
 def symmetric_subtract_multisegments(first: _Multisegment,
                                      second: _Multisegment,
                                      *,
+                                     snap_tolerance: _Optional[_Scalar] = None,
                                      context: _Optional[_Context] = None
                                      ) -> _Union[_Empty, _Segment,
                                                  _Multisegment]:
@@ -1613,6 +1646,12 @@ def symmetric_subtract_multisegments(first: _Multisegment,
 
     :param first: first operand.
     :param second: second operand.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: symmetric difference of operands.
 
@@ -1640,16 +1679,19 @@ def symmetric_subtract_multisegments(first: _Multisegment,
     ...                   Segment(Point(1, 1), Point(2, 2))]))
     True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return _linear.SymmetricDifference(
             _operands.MultisegmentOperand(first),
             _operands.MultisegmentOperand(second),
-            _get_context() if context is None else context
+            _get_context() if context is None else context,
+            snap_tolerance=snap_tolerance
     ).compute()
 
 
 def unite_multisegments(first: _Multisegment,
                         second: _Multisegment,
                         *,
+                        snap_tolerance: _Optional[_Scalar] = None,
                         context: _Optional[_Context] = None) -> _Multisegment:
     """
     Returns union of multisegments.
@@ -1665,6 +1707,12 @@ def unite_multisegments(first: _Multisegment,
 
     :param first: first operand.
     :param second: second operand.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: union of operands.
 
@@ -1691,9 +1739,11 @@ def unite_multisegments(first: _Multisegment,
     ...                   Segment(Point(1, 1), Point(2, 2))]))
     True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return (_linear.Union(_operands.MultisegmentOperand(first),
                           _operands.MultisegmentOperand(second),
-                          _get_context() if context is None else context)
+                          _get_context() if context is None else context,
+                          snap_tolerance=snap_tolerance)
             .compute())
 
 
@@ -3060,6 +3110,70 @@ def intersect_polygons(first: _Polygon,
     ).compute()
 
 
+def polygons_overlap(first: _Polygon,
+                     second: _Polygon,
+                     *,
+                     context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if intersection of polygons has area,
+    i.e. if ``intersect_polygons`` result is not empty.
+
+    Stops sweeping at the first segment of the intersection
+    without building resulting geometry.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count = len(first.border.vertices)\
+ + sum(len(hole.vertices) for hole in first.holes)``,
+    ``second_edges_count = len(second.border.vertices)\
+ + sum(len(hole.vertices) for hole in second.holes)``,
+    ``intersections_count`` --- number of intersections between polygons edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: true if operands overlap, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> first_inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                               Point(1, 3)])
+    >>> clockwise_first_inner_square = Contour([Point(1, 1), Point(1, 3),
+    ...                                         Point(3, 3), Point(3, 1)])
+    >>> polygons_overlap(Polygon(first_inner_square, []),
+    ...                  Polygon(second_square, []))
+    False
+    >>> polygons_overlap(Polygon(first_square, []),
+    ...                  Polygon(second_square, []))
+    False
+    >>> polygons_overlap(Polygon(first_inner_square, []),
+    ...                  Polygon(first_square, [clockwise_first_inner_square]))
+    False
+    >>> polygons_overlap(Polygon(first_square, []),
+    ...                  Polygon(first_inner_square, []))
+    True
+    >>> polygons_overlap(Polygon(first_square, [clockwise_first_inner_square]),
+    ...                  Polygon(first_square, [clockwise_first_inner_square]))
+    True
+    """
+    return _holey.OverlapDetection(
+            _operands.PolygonOperand(first), _operands.PolygonOperand(second),
+            _get_context() if context is None else context
+    ).compute()
+
+
 def subtract_polygons(minuend: _Polygon,
                       subtrahend: _Polygon,
                       *,
@@ -4097,6 +4211,7 @@ def complete_intersect_multipolygons(
         first: _Multipolygon,
         second: _Multipolygon,
         *,
+        sweep_line: str = 'tree',
         context: _Optional[_Context] = None
 ) -> _Union[_Empty, _Mix, _Multipoint, _Multipolygon, _Multisegment, _Polygon,
             _Segment]:
@@ -4122,6 +4237,9 @@ def complete_intersect_multipolygons(
 
     :param first: first operand.
     :param second: second operand.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
     :param context: geometric context.
     :returns: intersection of operands.
 
@@ -4291,18 +4409,32 @@ def complete_intersect_multipolygons(
     return _holey.CompleteIntersection(
             _operands.MultipolygonOperand(first),
             _operands.MultipolygonOperand(second),
-            _get_context() if context is None else context
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line)
     ).compute()
 
 
 def intersect_multipolygons(first: _Multipolygon,
                             second: _Multipolygon,
                             *,
+                            strips_count: int = 1,
+                            sweep_line: str = 'tree',
+                            snap_tolerance: _Optional[_Scalar] = None,
                             context: _Optional[_Context] = None
                             ) -> _Union[_Empty, _Multipolygon, _Polygon]:
     """
     Returns intersection of multipolygons.
 
+    With ``strips_count`` greater than one
+    common box of operands is split into vertical strips,
+    operands are intersected in each strip separately
+    and results joined across seams between strips are stitched afterwards
+    by tracing their contours without sweeping,
+    so the largest sweep holds either edges of a single operands' polygon
+    being clipped to a strip or edges of operands' pieces in a single strip,
+    while results of all strips are kept until stitched
+    and strips are processed sequentially.
+
     Time complexity:
         ``O(segments_count * log segments_count)``
     Memory complexity:
@@ -4321,6 +4453,18 @@ def intersect_multipolygons(first: _Multipolygon,
 
     :param first: first operand.
     :param second: second operand.
+    :param strips_count:
+        maximum number of vertical strips to split operands into,
+        sweeps whole operands at once if equals to one.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: intersection of operands.
 
@@ -4425,8 +4569,99 @@ def intersect_multipolygons(first: _Multipolygon,
     ...  == Multipolygon([Polygon(first_square, []),
     ...                   Polygon(third_square, [])]))
     True
+    >>> (intersect_multipolygons(Multipolygon([Polygon(first_square, []),
+    ...                                        Polygon(third_square, [])]),
+    ...                          Multipolygon([Polygon(first_square, []),
+    ...                                        Polygon(third_square, [])]),
+    ...                          strips_count=2)
+    ...  == Multipolygon([Polygon(first_square, []),
+    ...                   Polygon(third_square, [])]))
+    True
+    >>> from fractions import Fraction
+    >>> skewed_triangle = Contour([Point(2, 0), Point(8, 0),
+    ...                            Point(6, 8 + Fraction(1, 10 ** 9))])
+    >>> (intersect_multipolygons(Multipolygon([Polygon(first_square, [])]),
+    ...                          Multipolygon([Polygon(skewed_triangle, [])]),
+    ...                          snap_tolerance=Fraction(1, 10 ** 6))
+    ...  == Polygon(Contour([Point(2, 0), Point(4, 0), Point(4, 4)]), []))
+    True
     """
-    return _holey.Intersection(
+    _validate_strips_count(strips_count)
+    _validate_snap_tolerance(snap_tolerance)
+    sweep_line_backend = _to_sweep_line_backend(sweep_line)
+    first_operand, second_operand = (_operands.MultipolygonOperand(first),
+                                     _operands.MultipolygonOperand(second))
+    if context is None:
+        context = _get_context()
+    return (_holey.Intersection(first_operand, second_operand, context,
+                                sweep_line_backend, snap_tolerance).compute()
+            if strips_count == 1
+            else _partition.intersect_in_strips(first_operand, second_operand,
+                                                strips_count, context,
+                                                sweep_line_backend,
+                                                snap_tolerance))
+
+
+def multipolygons_overlap(first: _Multipolygon,
+                          second: _Multipolygon,
+                          *,
+                          context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if intersection of multipolygons has area,
+    i.e. if ``intersect_multipolygons`` result is not empty.
+
+    Stops sweeping at the first segment of the intersection
+    without building resulting geometry.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in first.polygons)``,
+    ``second_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in second.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: true if operands overlap, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> third_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                         Point(4, 8)])
+    >>> fourth_square = Contour([Point(0, 4), Point(4, 4), Point(4, 8),
+    ...                          Point(0, 8)])
+    >>> first_inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                               Point(1, 3)])
+    >>> multipolygons_overlap(Multipolygon([Polygon(first_square, []),
+    ...                                     Polygon(third_square, [])]),
+    ...                       Multipolygon([Polygon(second_square, []),
+    ...                                     Polygon(fourth_square, [])]))
+    False
+    >>> multipolygons_overlap(Multipolygon([Polygon(first_square, []),
+    ...                                     Polygon(third_square, [])]),
+    ...                       Multipolygon([Polygon(first_inner_square, []),
+    ...                                     Polygon(second_square, [])]))
+    True
+    """
+    return _holey.OverlapDetection(
             _operands.MultipolygonOperand(first),
             _operands.MultipolygonOperand(second),
             _get_context() if context is None else context
@@ -4436,6 +4671,8 @@ def intersect_multipolygons(first: _Multipolygon,
 def subtract_multipolygons(minuend: _Multipolygon,
                            subtrahend: _Multipolygon,
                            *,
+                           sweep_line: str = 'tree',
+                           snap_tolerance: _Optional[_Scalar] = None,
                            context: _Optional[_Context] = None
                            ) -> _Union[_Empty, _Multipolygon, _Polygon]:
     """
@@ -4459,6 +4696,15 @@ def subtract_multipolygons(minuend: _Multipolygon,
 
     :param minuend: multipolygon to subtract from.
     :param subtrahend: multipolygon to subtract.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: difference between minuend and subtrahend.
 
@@ -4570,16 +4816,21 @@ def subtract_multipolygons(minuend: _Multipolygon,
     ...                           [clockwise_third_inner_square])]))
     True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return _holey.Difference(
             _operands.MultipolygonOperand(minuend),
             _operands.MultipolygonOperand(subtrahend),
-            _get_context() if context is None else context
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line),
+            snap_tolerance
     ).compute()
 
 
 def symmetric_subtract_multipolygons(first: _Multipolygon,
                                      second: _Multipolygon,
                                      *,
+                                     sweep_line: str = 'tree',
+                                     snap_tolerance: _Optional[_Scalar] = None,
                                      context: _Optional[_Context] = None
                                      ) -> _Union[_Empty, _Multipolygon,
                                                  _Polygon]:
@@ -4604,6 +4855,15 @@ def symmetric_subtract_multipolygons(first: _Multipolygon,
 
     :param first: first operand.
     :param second: second operand.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: symmetric difference of operands.
 
@@ -4726,21 +4986,37 @@ def symmetric_subtract_multipolygons(first: _Multipolygon,
     ...                           [clockwise_third_inner_square])]))
     True
     """
+    _validate_snap_tolerance(snap_tolerance)
     return _holey.SymmetricDifference(
             _operands.MultipolygonOperand(first),
             _operands.MultipolygonOperand(second),
-            _get_context() if context is None else context
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line),
+            snap_tolerance
     ).compute()
 
 
 def unite_multipolygons(first: _Multipolygon,
                         second: _Multipolygon,
                         *,
+                        strips_count: int = 1,
+                        sweep_line: str = 'tree',
+                        snap_tolerance: _Optional[_Scalar] = None,
                         context: _Optional[_Context] = None
                         ) -> _Union[_Multipolygon, _Polygon]:
     """
     Returns union of multipolygons.
 
+    With ``strips_count`` greater than one
+    box of operands is split into vertical strips,
+    operands are united in each strip separately
+    and results joined across seams between strips are stitched afterwards
+    by tracing their contours without sweeping,
+    so the largest sweep holds either edges of a single operands' polygon
+    being clipped to a strip or edges of operands' pieces in a single strip,
+    while results of all strips are kept until stitched
+    and strips are processed sequentially.
+
     Time complexity:
         ``O(segments_count * log segments_count)``
     Memory complexity:
@@ -4759,6 +5035,18 @@ def unite_multipolygons(first: _Multipolygon,
 
     :param first: first operand.
     :param second: second operand.
+    :param strips_count:
+        maximum number of vertical strips to split operands into,
+        sweeps whole operands at once if equals to one.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param snap_tolerance:
+        distance along each axis within which intersection points
+        are snapped to endpoints of intersecting segments,
+        should be less than distances between distinct features
+        of each operand,
+        intersection points are computed as is if not specified.
     :param context: geometric context.
     :returns: union of operands.
 
@@ -4867,9 +5155,343 @@ def unite_multipolygons(first: _Multipolygon,
     ...                   Polygon(second_square, []),
     ...                   Polygon(third_inner_square, [])]))
     True
+    >>> (unite_multipolygons(Multipolygon([Polygon(first_square, []),
+    ...                                    Polygon(third_square, [])]),
+    ...                      Multipolygon([Polygon(second_square, []),
+    ...                                    Polygon(fourth_square, [])]),
+    ...                      strips_count=2)
+    ...  == Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 8),
+    ...                      Point(0, 8)]), []))
+    True
     """
-    return _holey.Union(
-            _operands.MultipolygonOperand(first),
-            _operands.MultipolygonOperand(second),
-            _get_context() if context is None else context
+    _validate_strips_count(strips_count)
+    _validate_snap_tolerance(snap_tolerance)
+    sweep_line_backend = _to_sweep_line_backend(sweep_line)
+    first_operand, second_operand = (_operands.MultipolygonOperand(first),
+                                     _operands.MultipolygonOperand(second))
+    if context is None:
+        context = _get_context()
+    return (_holey.Union(first_operand, second_operand, context,
+                         sweep_line_backend, snap_tolerance).compute()
+            if strips_count == 1
+            else _partition.unite_in_strips(first_operand, second_operand,
+                                            strips_count, context,
+                                            sweep_line_backend,
+                                            snap_tolerance))
+
+
+def unite_many_polygons(polygons: _Sequence[_Polygon],
+                        *,
+                        sweep_line: str = 'tree',
+                        context: _Optional[_Context] = None
+                        ) -> _Union[_Empty, _Multipolygon, _Polygon]:
+    """
+    Returns union of polygons computed in a single sweep.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in polygons)``,
+    ``intersections_count`` --- number of intersections between polygons
+    edges.
+
+    :param polygons: operands.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param context: geometric context.
+    :returns: union of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> third_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                         Point(4, 8)])
+    >>> fourth_square = Contour([Point(0, 4), Point(4, 4), Point(4, 8),
+    ...                          Point(0, 8)])
+    >>> inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                         Point(1, 3)])
+    >>> clockwise_inner_square = Contour([Point(1, 1), Point(1, 3),
+    ...                                   Point(3, 3), Point(3, 1)])
+    >>> unite_many_polygons([]) is EMPTY
+    True
+    >>> (unite_many_polygons([Polygon(first_square, []),
+    ...                       Polygon(second_square, []),
+    ...                       Polygon(third_square, []),
+    ...                       Polygon(fourth_square, [])])
+    ...  == Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 8),
+    ...                      Point(0, 8)]), []))
+    True
+    >>> (unite_many_polygons([Polygon(first_square,
+    ...                               [clockwise_inner_square]),
+    ...                       Polygon(inner_square, []),
+    ...                       Polygon(first_square, [])])
+    ...  == Polygon(first_square, []))
+    True
+    >>> (unite_many_polygons([Polygon(first_square, []),
+    ...                       Polygon(third_square, [])])
+    ...  == Multipolygon([Polygon(first_square, []),
+    ...                   Polygon(third_square, [])]))
+    True
+    >>> (unite_many_polygons([Polygon(first_square, []),
+    ...                       Polygon(second_square, [])],
+    ...                      sweep_line='skip_list')
+    ...  == Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 4),
+    ...                      Point(0, 4)]), []))
+    True
+    """
+    return _holey.NaryUnion(
+            [_operands.PolygonOperand(polygon) for polygon in polygons],
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line)
+    ).compute()
+
+
+def unite_many_multipolygons(multipolygons: _Sequence[_Multipolygon],
+                             *,
+                             sweep_line: str = 'tree',
+                             context: _Optional[_Context] = None
+                             ) -> _Union[_Empty, _Multipolygon, _Polygon]:
+    """
+    Returns union of multipolygons computed in a single sweep.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for multipolygon in multipolygons\
+ for polygon in multipolygon.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param multipolygons: operands.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param context: geometric context.
+    :returns: union of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> third_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                         Point(4, 8)])
+    >>> fourth_square = Contour([Point(0, 4), Point(4, 4), Point(4, 8),
+    ...                          Point(0, 8)])
+    >>> unite_many_multipolygons([]) is EMPTY
+    True
+    >>> (unite_many_multipolygons(
+    ...      [Multipolygon([Polygon(first_square, []),
+    ...                     Polygon(third_square, [])]),
+    ...       Multipolygon([Polygon(second_square, [])]),
+    ...       Multipolygon([Polygon(fourth_square, [])])])
+    ...  == Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 8),
+    ...                      Point(0, 8)]), []))
+    True
+    >>> (unite_many_multipolygons(
+    ...      [Multipolygon([Polygon(first_square, []),
+    ...                     Polygon(third_square, [])]),
+    ...       Multipolygon([Polygon(first_square, []),
+    ...                     Polygon(third_square, [])])])
+    ...  == Multipolygon([Polygon(first_square, []),
+    ...                   Polygon(third_square, [])]))
+    True
+    """
+    return _holey.NaryUnion(
+            [_operands.MultipolygonOperand(multipolygon)
+             for multipolygon in multipolygons],
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line)
     ).compute()
+
+
+def intersect_many_multipolygons(multipolygons: _Sequence[_Multipolygon],
+                                 *,
+                                 sweep_line: str = 'tree',
+                                 context: _Optional[_Context] = None
+                                 ) -> _Union[_Empty, _Multipolygon, _Polygon]:
+    """
+    Returns intersection of multipolygons computed in a single sweep.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for multipolygon in multipolygons\
+ for polygon in multipolygon.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param multipolygons: operands.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param context: geometric context.
+    :returns: intersection of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(2, 0), Point(6, 0), Point(6, 4),
+    ...                          Point(2, 4)])
+    >>> third_square = Contour([Point(2, 2), Point(6, 2), Point(6, 6),
+    ...                         Point(2, 6)])
+    >>> fourth_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                          Point(4, 8)])
+    >>> intersect_many_multipolygons([]) is EMPTY
+    True
+    >>> (intersect_many_multipolygons(
+    ...      [Multipolygon([Polygon(first_square, [])]),
+    ...       Multipolygon([Polygon(second_square, [])]),
+    ...       Multipolygon([Polygon(third_square, []),
+    ...                     Polygon(fourth_square, [])])])
+    ...  == Polygon(Contour([Point(2, 2), Point(4, 2), Point(4, 4),
+    ...                      Point(2, 4)]), []))
+    True
+    >>> intersect_many_multipolygons(
+    ...     [Multipolygon([Polygon(first_square, [])]),
+    ...      Multipolygon([Polygon(second_square, [])]),
+    ...      Multipolygon([Polygon(fourth_square, [])])],
+    ...     sweep_line='skip_list') is EMPTY
+    True
+    """
+    return _holey.NaryIntersection(
+            [_operands.MultipolygonOperand(multipolygon)
+             for multipolygon in multipolygons],
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line)
+    ).compute()
+
+
+def subtract_many_multipolygons(minuend: _Multipolygon,
+                                subtrahends: _Sequence[_Multipolygon],
+                                *,
+                                sweep_line: str = 'tree',
+                                context: _Optional[_Context] = None
+                                ) -> _Union[_Empty, _Multipolygon, _Polygon]:
+    """
+    Returns difference of multipolygon and multipolygons
+    computed in a single sweep.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for multipolygon in [minuend, *subtrahends]\
+ for polygon in multipolygon.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param minuend: multipolygon to subtract from.
+    :param subtrahends: multipolygons to subtract.
+    :param sweep_line:
+        name of the sweep line backend,
+        ``'tree'`` for red-black tree or ``'skip_list'`` for skip list.
+    :param context: geometric context.
+    :returns: difference between minuend and union of subtrahends.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> EMPTY = context.empty
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> third_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                         Point(4, 8)])
+    >>> fourth_square = Contour([Point(0, 4), Point(4, 4), Point(4, 8),
+    ...                          Point(0, 8)])
+    >>> big_square = Contour([Point(0, 0), Point(8, 0), Point(8, 8),
+    ...                       Point(0, 8)])
+    >>> (subtract_many_multipolygons(Multipolygon([Polygon(first_square, [])]),
+    ...                              [])
+    ...  == Multipolygon([Polygon(first_square, [])]))
+    True
+    >>> (subtract_many_multipolygons(
+    ...      Multipolygon([Polygon(big_square, [])]),
+    ...      [Multipolygon([Polygon(first_square, [])]),
+    ...       Multipolygon([Polygon(second_square, [])]),
+    ...       Multipolygon([Polygon(first_square, []),
+    ...                     Polygon(third_square, [])])])
+    ...  == Polygon(fourth_square, []))
+    True
+    >>> subtract_many_multipolygons(
+    ...     Multipolygon([Polygon(fourth_square, [])]),
+    ...     [Multipolygon([Polygon(big_square, [])]),
+    ...      Multipolygon([Polygon(fourth_square, [])])],
+    ...     sweep_line='skip_list') is EMPTY
+    True
+    """
+    return _holey.NaryDifference(
+            [_operands.MultipolygonOperand(minuend),
+             *[_operands.MultipolygonOperand(subtrahend)
+               for subtrahend in subtrahends]],
+            _get_context() if context is None else context,
+            _to_sweep_line_backend(sweep_line)
+    ).compute()
+
+
+def _to_sweep_line_backend(name: str) -> _SweepLineBackend:
+    try:
+        return _SWEEP_LINE_BACKENDS[name]
+    except KeyError:
+        raise ValueError('Unsupported sweep line backend: {name!r}, '
+                         'should be one of {names}.'
+                         .format(name=name,
+                                 names=sorted(_SWEEP_LINE_BACKENDS)))
+
+
+def _validate_snap_tolerance(snap_tolerance: _Optional[_Scalar]) -> None:
+    if snap_tolerance is not None and snap_tolerance <= 0:
+        raise ValueError('Snap tolerance should be positive, '
+                         'but found: {tolerance}.'
+                         .format(tolerance=snap_tolerance))
+
+
+def _validate_strips_count(strips_count: int) -> None:
+    if strips_count < 1:
+        raise ValueError('Strips count should be positive, but found: {count}.'
+                         .format(count=strips_count))
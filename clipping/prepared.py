@@ -0,0 +1,5 @@
+"""Operands prepared once for many operations."""
+from .core import prepared as _prepared
+
+PreparedMultipolygon = _prepared.PreparedMultipolygon
+PreparedMultisegment = _prepared.PreparedMultisegment
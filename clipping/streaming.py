@@ -0,0 +1,272 @@
+"""
+Boolean operations on multipolygons
+yielding resulting polygons as soon as they are built.
+"""
+from typing import (Iterator as _Iterator,
+                    Optional as _Optional)
+
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+from ground.hints import (Multipolygon as _Multipolygon,
+                          Polygon as _Polygon)
+
+from .core import (holey as _holey,
+                   operands as _operands)
+
+
+def iter_intersect_multipolygons(first: _Multipolygon,
+                                 second: _Multipolygon,
+                                 *,
+                                 context: _Optional[_Context] = None
+                                 ) -> _Iterator[_Polygon]:
+    """
+    Returns iterator over polygons of intersection of multipolygons.
+
+    Polygons are yielded in the same order
+    as ``clipping.planar.intersect_multipolygons`` lists them,
+    each one as soon as its border & holes are built,
+    so the whole result is never kept at once.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in first.polygons)``,
+    ``second_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in second.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: iterator over polygons of intersection of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> first_inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                               Point(1, 3)])
+    >>> second_inner_square = Contour([Point(5, 1), Point(7, 1), Point(7, 3),
+    ...                                Point(5, 3)])
+    >>> list(iter_intersect_multipolygons(
+    ...          Multipolygon([Polygon(first_square, [])]),
+    ...          Multipolygon([Polygon(second_square, [])])))
+    []
+    >>> (list(iter_intersect_multipolygons(
+    ...           Multipolygon([Polygon(first_square, []),
+    ...                         Polygon(second_inner_square, [])]),
+    ...           Multipolygon([Polygon(first_inner_square, []),
+    ...                         Polygon(second_square, [])])))
+    ...  == [Polygon(first_inner_square, []),
+    ...      Polygon(second_inner_square, [])])
+    True
+    """
+    return _holey.Intersection(
+            _operands.MultipolygonOperand(first),
+            _operands.MultipolygonOperand(second),
+            _get_context() if context is None else context
+    ).iter_polygons()
+
+
+def iter_subtract_multipolygons(minuend: _Multipolygon,
+                                subtrahend: _Multipolygon,
+                                *,
+                                context: _Optional[_Context] = None
+                                ) -> _Iterator[_Polygon]:
+    """
+    Returns iterator over polygons of difference of multipolygons.
+
+    Polygons are yielded in the same order
+    as ``clipping.planar.subtract_multipolygons`` lists them,
+    each one as soon as its border & holes are built,
+    so the whole result is never kept at once.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = minuend_edges_count + subtrahend_edges_count``,
+    ``minuend_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in minuend.polygons)``,
+    ``subtrahend_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in subtrahend.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param minuend: multipolygon to subtract from.
+    :param subtrahend: multipolygon to subtract.
+    :param context: geometric context.
+    :returns: iterator over polygons of difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                         Point(1, 3)])
+    >>> clockwise_inner_square = Contour([Point(1, 1), Point(1, 3),
+    ...                                   Point(3, 3), Point(3, 1)])
+    >>> (list(iter_subtract_multipolygons(
+    ...           Multipolygon([Polygon(first_square, []),
+    ...                         Polygon(second_square, [])]),
+    ...           Multipolygon([Polygon(inner_square, [])])))
+    ...  == [Polygon(first_square, [clockwise_inner_square]),
+    ...      Polygon(second_square, [])])
+    True
+    """
+    return _holey.Difference(
+            _operands.MultipolygonOperand(minuend),
+            _operands.MultipolygonOperand(subtrahend),
+            _get_context() if context is None else context
+    ).iter_polygons()
+
+
+def iter_symmetric_subtract_multipolygons(first: _Multipolygon,
+                                          second: _Multipolygon,
+                                          *,
+                                          context: _Optional[_Context] = None
+                                          ) -> _Iterator[_Polygon]:
+    """
+    Returns iterator over polygons of symmetric difference of multipolygons.
+
+    Polygons are yielded in the same order
+    as ``clipping.planar.symmetric_subtract_multipolygons`` lists them,
+    each one as soon as its border & holes are built,
+    so the whole result is never kept at once.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in first.polygons)``,
+    ``second_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in second.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: iterator over polygons of symmetric difference of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> list(iter_symmetric_subtract_multipolygons(
+    ...          Multipolygon([Polygon(first_square, [])]),
+    ...          Multipolygon([Polygon(first_square, [])])))
+    []
+    >>> (list(iter_symmetric_subtract_multipolygons(
+    ...           Multipolygon([Polygon(first_square, [])]),
+    ...           Multipolygon([Polygon(second_square, [])])))
+    ...  == [Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 4),
+    ...                       Point(0, 4)]), [])])
+    True
+    """
+    return _holey.SymmetricDifference(
+            _operands.MultipolygonOperand(first),
+            _operands.MultipolygonOperand(second),
+            _get_context() if context is None else context
+    ).iter_polygons()
+
+
+def iter_unite_multipolygons(first: _Multipolygon,
+                             second: _Multipolygon,
+                             *,
+                             context: _Optional[_Context] = None
+                             ) -> _Iterator[_Polygon]:
+    """
+    Returns iterator over polygons of union of multipolygons.
+
+    Polygons are yielded in the same order
+    as ``clipping.planar.unite_multipolygons`` lists them,
+    each one as soon as its border & holes are built,
+    so the whole result is never kept at once.
+
+    Time complexity:
+        ``O(segments_count * log segments_count)``
+    Memory complexity:
+        ``O(segments_count)``
+
+    where ``segments_count = edges_count + intersections_count``,
+    ``edges_count = first_edges_count + second_edges_count``,
+    ``first_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in first.polygons)``,
+    ``second_edges_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in second.polygons)``,
+    ``intersections_count`` --- number of intersections between multipolygons
+    edges.
+
+    :param first: first operand.
+    :param second: second operand.
+    :param context: geometric context.
+    :returns: iterator over polygons of union of operands.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> first_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> second_square = Contour([Point(4, 0), Point(8, 0), Point(8, 4),
+    ...                          Point(4, 4)])
+    >>> third_square = Contour([Point(4, 4), Point(8, 4), Point(8, 8),
+    ...                         Point(4, 8)])
+    >>> (list(iter_unite_multipolygons(
+    ...           Multipolygon([Polygon(first_square, [])]),
+    ...           Multipolygon([Polygon(second_square, [])])))
+    ...  == [Polygon(Contour([Point(0, 0), Point(8, 0), Point(8, 4),
+    ...                       Point(0, 4)]), [])])
+    True
+    >>> (list(iter_unite_multipolygons(
+    ...           Multipolygon([Polygon(first_square, [])]),
+    ...           Multipolygon([Polygon(third_square, [])])))
+    ...  == [Polygon(first_square, []), Polygon(third_square, [])])
+    True
+    """
+    return _holey.Union(
+            _operands.MultipolygonOperand(first),
+            _operands.MultipolygonOperand(second),
+            _get_context() if context is None else context
+    ).iter_polygons()
@@ -0,0 +1,36 @@
+"""
+Counters & timings of operations for profiling.
+
+Tracing is disabled by default and costs a single check per hook then.
+
+>>> from ground.base import get_context
+>>> context = get_context()
+>>> Contour = context.contour_cls
+>>> Multipolygon = context.multipolygon_cls
+>>> Point = context.point_cls
+>>> Polygon = context.polygon_cls
+>>> from clipping.planar import subtract_multipolygons
+>>> first = Multipolygon([Polygon(Contour([Point(0, 0), Point(4, 0),
+...                                        Point(4, 4), Point(0, 4)]), [])])
+>>> second = Multipolygon([Polygon(Contour([Point(2, 2), Point(6, 2),
+...                                         Point(6, 6), Point(2, 6)]), [])])
+>>> with tracing() as trace:
+...     result = subtract_multipolygons(first, second)
+>>> trace.divisions
+4
+>>> trace.events_pushed, trace.events_popped
+(24, 21)
+>>> from ground.base import Relation
+>>> trace.relations[Relation.CROSS]
+2
+>>> trace.sweep_line_max_size
+4
+>>> trace.bounding_candidates, trace.bounding_survivors
+(3, 3)
+>>> sorted(trace.phases_times)
+['fill', 'sort', 'sweep']
+"""
+from .core import tracing as _tracing
+
+Trace = _tracing.Trace
+tracing = _tracing.tracing
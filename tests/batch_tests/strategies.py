@@ -0,0 +1,21 @@
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import (Strategy,
+                         WindowWithGeometries)
+
+
+def coordinates_to_windows_with_geometries(
+        coordinates: Strategy[Scalar]
+) -> Strategy[WindowWithGeometries]:
+    shaped_geometries = (planar.polygons(coordinates)
+                         | planar.multipolygons(coordinates))
+    return strategies.tuples(shaped_geometries,
+                             strategies.lists(shaped_geometries,
+                                              max_size=5))
+
+
+windows_with_geometries = coordinates_strategies.flatmap(
+        coordinates_to_windows_with_geometries)
@@ -0,0 +1,50 @@
+from ground.hints import Shaped
+from hypothesis import given
+
+from clipping.batch import intersect_with_window
+from clipping.planar import intersect_multipolygons
+from tests.utils import (Multipolygon,
+                         WindowWithGeometries,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_polygon)
+from . import strategies
+
+
+@given(strategies.windows_with_geometries)
+def test_basic(window_with_geometries: WindowWithGeometries) -> None:
+    window, geometries = window_with_geometries
+
+    result = list(intersect_with_window(window, geometries))
+
+    assert len(result) == len(geometries)
+    assert all(is_maybe_shaped(element) for element in result)
+
+
+@given(strategies.windows_with_geometries)
+def test_equivalents(window_with_geometries: WindowWithGeometries) -> None:
+    window, geometries = window_with_geometries
+
+    result = intersect_with_window(window, geometries)
+
+    assert all(
+            are_compounds_similar(
+                    intersection,
+                    intersect_multipolygons(to_multipolygon(window),
+                                            to_multipolygon(geometry))
+            )
+            for intersection, geometry in zip(result, geometries)
+    )
+
+
+@given(strategies.windows_with_geometries)
+def test_self(window_with_geometries: WindowWithGeometries) -> None:
+    window, _ = window_with_geometries
+
+    result = next(intersect_with_window(window, [window]))
+
+    assert are_compounds_similar(result, window)
+
+
+def to_multipolygon(shaped: Shaped) -> Multipolygon:
+    return Multipolygon([shaped]) if is_polygon(shaped) else shaped
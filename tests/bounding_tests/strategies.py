@@ -0,0 +1,21 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import Box
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_boxes_lists_with_boxes(boxes: Strategy[Box]
+                              ) -> Strategy[Tuple[List[Box], Box]]:
+    return strategies.tuples(strategies.lists(boxes,
+                                              max_size=50),
+                             boxes)
+
+
+boxes_lists_with_boxes = (coordinates_strategies.map(planar.boxes)
+                          .flatmap(to_boxes_lists_with_boxes))
+queries_counts = strategies.integers(0, 50)
@@ -0,0 +1,25 @@
+from typing import (List,
+                    Tuple)
+
+from ground.base import get_context
+from ground.hints import Box
+from hypothesis import given
+
+from clipping.core.bounding import (coupled_with,
+                                    intersects_with,
+                                    to_boxes_checker)
+from . import strategies
+
+context = get_context()
+
+
+@given(strategies.boxes_lists_with_boxes, strategies.queries_counts)
+def test_basic(boxes_list_with_box: Tuple[List[Box], Box],
+               queries_count: int) -> None:
+    boxes, box = boxes_list_with_box
+
+    has_box = to_boxes_checker(boxes, queries_count, context)
+
+    assert all(has_box(box, predicate) is any(predicate(candidate, box)
+                                              for candidate in boxes)
+               for predicate in (coupled_with, intersects_with))
@@ -0,0 +1,16 @@
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.strategies.base import (MAX_SCALAR,
+                                   MIN_SCALAR)
+from tests.utils import to_pairs
+
+multipolygons_pairs = (coordinates_strategies.map(planar.multipolygons)
+                       .flatmap(to_pairs))
+multisegments_pairs = (coordinates_strategies.map(planar.multisegments)
+                       .flatmap(to_pairs))
+integral_multipolygons_pairs = to_pairs(planar.multipolygons(
+        strategies.integers(MIN_SCALAR, MAX_SCALAR)))
+max_sizes = strategies.integers(1, 16)
+invalid_max_sizes = strategies.integers(max_value=0)
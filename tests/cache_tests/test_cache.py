@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+
+import pytest
+from hypothesis import given
+
+from clipping.cache import Cache
+from clipping.core.cache import to_fingerprint
+from clipping.planar import (subtract_multipolygons,
+                             unite_multipolygons,
+                             unite_multisegments)
+from tests.utils import (MultipolygonsPair,
+                         MultisegmentsPair,
+                         shift_multipolygon)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs, strategies.max_sizes)
+def test_repeated(multipolygons_pair: MultipolygonsPair,
+                  max_size: int) -> None:
+    first, second = multipolygons_pair
+    cache = Cache(max_size)
+    unite = cache.wrap(unite_multipolygons)
+
+    result = unite(first, second)
+
+    assert result == unite_multipolygons(first, second)
+    assert unite(first, second) is result
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@given(strategies.multisegments_pairs)
+def test_commutative(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+    cache = Cache()
+    unite = cache.wrap(unite_multisegments)
+
+    result = unite(first, second)
+
+    assert unite(second, first) is result
+    assert len(cache) == 1
+
+
+@given(strategies.multipolygons_pairs)
+def test_non_commutative(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    cache = Cache()
+    subtract = cache.wrap(subtract_multipolygons)
+
+    result = subtract(first, second)
+    reversed_result = subtract(second, first)
+
+    assert result == subtract_multipolygons(first, second)
+    assert reversed_result == subtract_multipolygons(second, first)
+    assert cache.misses == len({to_fingerprint(first),
+                                to_fingerprint(second)})
+
+
+@given(strategies.integral_multipolygons_pairs)
+def test_coordinates_types(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    rational_first = shift_multipolygon(first, Fraction(0), Fraction(0))
+    cache = Cache()
+    unite = cache.wrap(unite_multipolygons)
+
+    result = unite(first, second)
+    rational_result = unite(rational_first, second)
+
+    assert repr(result) == repr(unite_multipolygons(first, second))
+    assert repr(rational_result) == repr(unite_multipolygons(rational_first,
+                                                             second))
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+@given(strategies.multipolygons_pairs, strategies.max_sizes)
+def test_threads(multipolygons_pair: MultipolygonsPair,
+                 max_size: int) -> None:
+    first, second = multipolygons_pair
+    cache = Cache(max_size)
+    subtract = cache.wrap(subtract_multipolygons)
+    unite = cache.wrap(unite_multipolygons)
+    calls_count = 16
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(
+                lambda index: (unite if index % 2 else subtract)(first,
+                                                                 second),
+                range(calls_count)
+        ))
+
+    assert results[::2] == [subtract_multipolygons(first, second)] * (
+            calls_count // 2)
+    assert results[1::2] == [unite_multipolygons(first, second)] * (
+            calls_count // 2)
+    assert cache.hits + cache.misses == calls_count
+    assert len(cache) <= max_size
+
+
+@given(strategies.multipolygons_pairs)
+def test_eviction(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    cache = Cache(1)
+    subtract = cache.wrap(subtract_multipolygons)
+    unite = cache.wrap(unite_multipolygons)
+
+    subtract(first, second)
+    unite(first, second)
+    subtract(first, second)
+
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (0, 3)
+
+
+@given(strategies.invalid_max_sizes)
+def test_invalid_max_size(max_size: int) -> None:
+    with pytest.raises(ValueError):
+        Cache(max_size)
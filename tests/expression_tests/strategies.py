@@ -0,0 +1,11 @@
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import (to_pairs,
+                         to_triplets)
+
+multipolygons = coordinates_strategies.flatmap(planar.multipolygons)
+multipolygons_pairs = (coordinates_strategies.map(planar.multipolygons)
+                       .flatmap(to_pairs))
+multipolygons_triplets = (coordinates_strategies.map(planar.multipolygons)
+                          .flatmap(to_triplets))
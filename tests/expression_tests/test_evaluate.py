@@ -0,0 +1,100 @@
+from ground.hints import Shaped
+from hypothesis import given
+
+from clipping.expression import Operand
+from clipping.planar import (intersect_multipolygons,
+                             subtract_multipolygons,
+                             symmetric_subtract_multipolygons,
+                             unite_multipolygons)
+from tests.utils import (EMPTY,
+                         Multipolygon,
+                         MultipolygonsPair,
+                         MultipolygonsTriplet,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_polygon)
+from . import strategies
+
+
+@given(strategies.multipolygons_triplets)
+def test_basic(multipolygons_triplet: MultipolygonsTriplet) -> None:
+    first, second, third = map(Operand, multipolygons_triplet)
+
+    result = ((first | second) - third).evaluate()
+
+    assert is_maybe_shaped(result)
+
+
+@given(strategies.multipolygons_triplets)
+def test_difference_of_union(multipolygons_triplet: MultipolygonsTriplet
+                             ) -> None:
+    first, second, third = multipolygons_triplet
+
+    result = ((Operand(first) | Operand(second)) - Operand(third)).evaluate()
+
+    assert are_compounds_similar(
+            result,
+            subtract_shaped(unite_multipolygons(first, second), third)
+    )
+
+
+@given(strategies.multipolygons_triplets)
+def test_symmetric_difference_of_intersection(
+        multipolygons_triplet: MultipolygonsTriplet) -> None:
+    first, second, third = multipolygons_triplet
+
+    result = ((Operand(first) & Operand(second)) ^ Operand(third)).evaluate()
+
+    intersection = intersect_multipolygons(first, second)
+    assert are_compounds_similar(
+            result,
+            third
+            if intersection is EMPTY
+            else symmetric_subtract_multipolygons(
+                    to_multipolygon(intersection), third)
+    )
+
+
+@given(strategies.multipolygons_pairs)
+def test_common_subexpressions(multipolygons_pair: MultipolygonsPair
+                               ) -> None:
+    first, second = map(Operand, multipolygons_pair)
+
+    result = ((first | second) & (first | second)).evaluate()
+
+    assert are_compounds_similar(result,
+                                 unite_multipolygons(first.value,
+                                                     second.value))
+
+
+@given(strategies.multipolygons)
+def test_self(multipolygon: Multipolygon) -> None:
+    operand = Operand(multipolygon)
+
+    assert are_compounds_similar((operand | operand).evaluate(),
+                                 unite_multipolygons(multipolygon,
+                                                     multipolygon))
+    assert (operand - operand).evaluate() is EMPTY
+    assert (operand ^ operand).evaluate() is EMPTY
+
+
+@given(strategies.multipolygons_pairs)
+def test_structural_equality(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    left, right = (Operand(first) - Operand(second),
+                   Operand(first) - Operand(second))
+
+    assert left == right
+    assert hash(left) == hash(right)
+    assert left != Operand(second) - Operand(first)
+
+
+def subtract_shaped(minuend: Shaped, subtrahend: Multipolygon) -> Shaped:
+    return (minuend
+            if minuend is EMPTY
+            else subtract_multipolygons(to_multipolygon(minuend), subtrahend))
+
+
+def to_multipolygon(shaped: Shaped) -> Multipolygon:
+    return Multipolygon([shaped]) if is_polygon(shaped) else shaped
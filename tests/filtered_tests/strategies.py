@@ -0,0 +1,27 @@
+from fractions import Fraction
+from typing import Tuple
+
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import (Point,
+                         to_pairs,
+                         to_triplets)
+
+points_triplets = coordinates_strategies.map(planar.points).flatmap(
+        to_triplets)
+
+
+def to_collinear_points_triplet(points_pair: Tuple[Point, Point],
+                                scale: Fraction) -> Tuple[Point, Point, Point]:
+    start, end = points_pair
+    return start, end, Point(start.x + (end.x - start.x) * scale,
+                             start.y + (end.y - start.y) * scale)
+
+
+collinear_points_triplets = strategies.builds(
+        to_collinear_points_triplet,
+        coordinates_strategies.map(planar.points).flatmap(to_pairs),
+        strategies.fractions()
+)
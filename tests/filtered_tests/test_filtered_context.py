@@ -0,0 +1,38 @@
+from typing import Tuple
+
+from ground.base import get_context
+from hypothesis import given
+
+from clipping.core.filtered import to_filtered_context
+from tests.utils import Point
+from . import strategies
+
+context = get_context()
+filtered_context = to_filtered_context(context)
+
+
+@given(strategies.points_triplets)
+def test_angle_orientation(points_triplet: Tuple[Point, Point, Point]
+                           ) -> None:
+    vertex, first_ray_point, second_ray_point = points_triplet
+
+    result = filtered_context.angle_orientation(vertex, first_ray_point,
+                                                second_ray_point)
+
+    assert result is context.angle_orientation(vertex, first_ray_point,
+                                               second_ray_point)
+
+
+@given(strategies.collinear_points_triplets)
+def test_collinear(points_triplet: Tuple[Point, Point, Point]) -> None:
+    vertex, first_ray_point, second_ray_point = points_triplet
+
+    result = filtered_context.angle_orientation(vertex, first_ray_point,
+                                                second_ray_point)
+
+    assert result is context.angle_orientation(vertex, first_ray_point,
+                                               second_ray_point)
+
+
+def test_empty() -> None:
+    assert filtered_context.empty is context.empty
@@ -0,0 +1,31 @@
+from functools import partial
+from typing import (List,
+                    Tuple)
+
+from ground.hints import (Polygon,
+                          Scalar)
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+polygons_lists = (coordinates_strategies.map(planar.polygons)
+                  .flatmap(partial(strategies.lists,
+                                   min_size=1,
+                                   max_size=5)))
+
+
+def coordinates_to_polygons_lists_with_polygons(
+        coordinates: Strategy[Scalar]
+) -> Strategy[Tuple[List[Polygon], Polygon]]:
+    polygons = planar.polygons(coordinates)
+    return strategies.tuples(strategies.lists(polygons,
+                                              min_size=1,
+                                              max_size=5),
+                             polygons)
+
+
+polygons_lists_with_polygons = coordinates_strategies.flatmap(
+        coordinates_to_polygons_lists_with_polygons)
+strips_counts = strategies.integers(1, 8)
@@ -0,0 +1,88 @@
+from typing import (List,
+                    Tuple)
+
+import pytest
+from ground.hints import Polygon
+from hypothesis import given
+
+from clipping.incremental import IncrementalUnion
+from clipping.planar import unite_many_polygons
+from tests.utils import (are_compounds_similar,
+                         is_maybe_shaped)
+from . import strategies
+
+
+@given(strategies.polygons_lists, strategies.strips_counts)
+def test_basic(polygons: List[Polygon], strips_count: int) -> None:
+    union = IncrementalUnion(polygons,
+                             strips_count=strips_count)
+
+    assert is_maybe_shaped(union.value)
+    assert are_compounds_similar(union.value, unite_many_polygons(polygons))
+
+
+@given(strategies.polygons_lists_with_polygons, strategies.strips_counts)
+def test_add(polygons_list_with_polygon: Tuple[List[Polygon], Polygon],
+             strips_count: int) -> None:
+    polygons, polygon = polygons_list_with_polygon
+    union = IncrementalUnion(polygons,
+                             strips_count=strips_count)
+
+    polygon_id = union.add(polygon)
+
+    assert union.polygons[polygon_id] is polygon
+    assert are_compounds_similar(union.value,
+                                 unite_many_polygons([*polygons, polygon]))
+
+
+@given(strategies.polygons_lists, strategies.strips_counts)
+def test_add_one_by_one(polygons: List[Polygon], strips_count: int) -> None:
+    initial_polygons = polygons[:len(polygons) // 2]
+    union = IncrementalUnion(initial_polygons,
+                             strips_count=strips_count)
+
+    for index, polygon in enumerate(polygons[len(initial_polygons):],
+                                    start=len(initial_polygons)):
+        union.add(polygon)
+
+        assert are_compounds_similar(
+                union.value, unite_many_polygons(polygons[:index + 1])
+        )
+
+
+@given(strategies.polygons_lists_with_polygons, strategies.strips_counts)
+def test_remove(polygons_list_with_polygon: Tuple[List[Polygon], Polygon],
+                strips_count: int) -> None:
+    polygons, polygon = polygons_list_with_polygon
+    union = IncrementalUnion(polygons,
+                             strips_count=strips_count)
+    polygon_id = union.add(polygon)
+    union.value
+
+    union.remove(polygon_id)
+
+    assert polygon_id not in union.polygons
+    assert are_compounds_similar(union.value, unite_many_polygons(polygons))
+
+
+@given(strategies.polygons_lists_with_polygons, strategies.strips_counts)
+def test_replace(polygons_list_with_polygon: Tuple[List[Polygon], Polygon],
+                 strips_count: int) -> None:
+    polygons, polygon = polygons_list_with_polygon
+    union = IncrementalUnion(polygons,
+                             strips_count=strips_count)
+    union.value
+
+    union.replace(0, polygon)
+
+    assert union.polygons[0] is polygon
+    assert are_compounds_similar(
+            union.value, unite_many_polygons([polygon, *polygons[1:]])
+    )
+
+
+@given(strategies.polygons_lists)
+def test_invalid_strips_count(polygons: List[Polygon]) -> None:
+    with pytest.raises(ValueError):
+        IncrementalUnion(polygons,
+                         strips_count=0)
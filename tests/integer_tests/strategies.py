@@ -0,0 +1,16 @@
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.strategies.base import (MAX_SCALAR,
+                                   MIN_SCALAR)
+from tests.utils import (to_pairs,
+                         to_triplets)
+
+# rational coordinates come from intersection points of integer segments
+points_triplets = coordinates_strategies.map(planar.points).flatmap(
+        to_triplets)
+segments_pairs = coordinates_strategies.map(planar.segments).flatmap(to_pairs)
+integers = strategies.integers(MIN_SCALAR, MAX_SCALAR)
+integral_multipolygons_pairs = to_pairs(planar.multipolygons(integers))
+integral_multisegments_pairs = to_pairs(planar.multisegments(integers))
@@ -0,0 +1,100 @@
+from typing import Tuple
+
+from ground.base import (Context,
+                         Relation,
+                         get_context)
+from hypothesis import given
+
+from clipping.core.integer import to_integer_context
+from clipping.planar import (intersect_multipolygons,
+                             intersect_multisegments)
+from clipping.prepared import PreparedMultipolygon
+from tests.utils import (MultipolygonsPair,
+                         MultisegmentsPair,
+                         Point,
+                         SegmentsPair)
+from . import strategies
+
+context = get_context()
+integer_context = to_integer_context(context)
+chosen_context = Context()
+
+
+@given(strategies.points_triplets)
+def test_angle_orientation(points_triplet: Tuple[Point, Point, Point]
+                           ) -> None:
+    vertex, first_ray_point, second_ray_point = points_triplet
+
+    result = integer_context.angle_orientation(vertex, first_ray_point,
+                                               second_ray_point)
+
+    assert result is context.angle_orientation(vertex, first_ray_point,
+                                               second_ray_point)
+
+
+@given(strategies.segments_pairs)
+def test_segments_relation(segments_pair: SegmentsPair) -> None:
+    first, second = segments_pair
+
+    result = integer_context.segments_relation(first, second)
+
+    assert result is context.segments_relation(first, second)
+
+
+@given(strategies.segments_pairs)
+def test_segments_intersection(segments_pair: SegmentsPair) -> None:
+    first, second = segments_pair
+
+    relation = context.segments_relation(first, second)
+
+    assert (relation is not Relation.CROSS
+            and relation is not Relation.TOUCH
+            # coordinates of the same values can be of different types
+            or (repr(integer_context.segments_intersection(first, second))
+                == repr(context.segments_intersection(first, second))))
+
+
+@given(strategies.integral_multipolygons_pairs)
+def test_multipolygons_operation(multipolygons_pair: MultipolygonsPair
+                                 ) -> None:
+    first, second = multipolygons_pair
+
+    result = intersect_multipolygons(first, second)
+
+    assert repr(result) == repr(intersect_multipolygons(
+            first, second,
+            context=chosen_context
+    ))
+
+
+@given(strategies.integral_multipolygons_pairs)
+def test_prepared_operand(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    prepared = PreparedMultipolygon(second)
+
+    assert prepared.is_integral
+    assert repr(intersect_multipolygons(first, prepared)) == repr(
+            intersect_multipolygons(first, second)
+    )
+
+
+@given(strategies.integral_multisegments_pairs)
+def test_multisegments_operation(multisegments_pair: MultisegmentsPair
+                                 ) -> None:
+    first, second = multisegments_pair
+
+    result = intersect_multisegments(first, second)
+
+    assert repr(result) == repr(intersect_multisegments(
+            first, second,
+            context=chosen_context
+    ))
+
+
+def test_chosen_context() -> None:
+    assert to_integer_context(chosen_context) is chosen_context
+
+
+def test_empty() -> None:
+    assert integer_context.empty is context.empty
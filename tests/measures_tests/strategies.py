@@ -0,0 +1,26 @@
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import (MultipolygonWithMultisegment,
+                         Strategy,
+                         to_pairs)
+
+multipolygons_pairs = (coordinates_strategies.map(planar.multipolygons)
+                       .flatmap(to_pairs))
+polygons_pairs = (coordinates_strategies.map(planar.polygons)
+                  .flatmap(to_pairs))
+multisegments_pairs = (coordinates_strategies.map(planar.multisegments)
+                       .flatmap(to_pairs))
+
+
+def coordinates_to_multipolygons_with_multisegments(
+        coordinates: Strategy[Scalar]
+) -> Strategy[MultipolygonWithMultisegment]:
+    return strategies.tuples(planar.multipolygons(coordinates),
+                             planar.multisegments(coordinates))
+
+
+multipolygons_with_multisegments = coordinates_strategies.flatmap(
+        coordinates_to_multipolygons_with_multisegments)
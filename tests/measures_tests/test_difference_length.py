@@ -0,0 +1,41 @@
+from hypothesis import given
+
+from clipping.measures import difference_length
+from clipping.planar import (subtract_multipolygon_from_multisegment,
+                             subtract_multisegments)
+from tests.utils import (MultipolygonWithMultisegment,
+                         MultisegmentsPair,
+                         to_linear_length)
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_multisegments(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = difference_length(first, second)
+
+    assert result == to_linear_length(subtract_multisegments(first, second))
+
+
+@given(strategies.multipolygons_with_multisegments)
+def test_multisegment_with_multipolygon(
+        multipolygon_with_multisegment: MultipolygonWithMultisegment
+) -> None:
+    multipolygon, multisegment = multipolygon_with_multisegment
+
+    result = difference_length(multisegment, multipolygon)
+
+    assert result == to_linear_length(
+            subtract_multipolygon_from_multisegment(multisegment,
+                                                    multipolygon)
+    )
+
+
+@given(strategies.multisegments_pairs)
+def test_self(multisegments_pair: MultisegmentsPair) -> None:
+    first, _ = multisegments_pair
+
+    result = difference_length(first, first)
+
+    assert result == 0
@@ -0,0 +1,55 @@
+from hypothesis import given
+
+from clipping.measures import intersection_area
+from clipping.planar import (intersect_multipolygons,
+                             intersect_polygons)
+from tests.utils import (MultipolygonsPair,
+                         PolygonsPair,
+                         to_shaped_area)
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_polygons(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = intersection_area(first, second)
+
+    assert result == to_shaped_area(intersect_polygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_multipolygons(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = intersection_area(first, second)
+
+    assert result == to_shaped_area(intersect_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_commutativity(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = intersection_area(first, second)
+
+    assert result == intersection_area(second, first)
+
+
+@given(strategies.multipolygons_pairs)
+def test_self(multipolygons_pair: MultipolygonsPair) -> None:
+    first, _ = multipolygons_pair
+
+    result = intersection_area(first, first)
+
+    assert result == to_shaped_area(first)
+
+
+@given(strategies.multipolygons_pairs)
+def test_compact(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = intersection_area(first, second,
+                               compact=True)
+
+    assert result == intersection_area(first, second)
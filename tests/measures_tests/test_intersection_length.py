@@ -0,0 +1,41 @@
+from hypothesis import given
+
+from clipping.measures import intersection_length
+from clipping.planar import (intersect_multisegment_with_multipolygon,
+                             intersect_multisegments)
+from tests.utils import (MultipolygonWithMultisegment,
+                         MultisegmentsPair,
+                         to_linear_length)
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_multisegments(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = intersection_length(first, second)
+
+    assert result == to_linear_length(intersect_multisegments(first, second))
+
+
+@given(strategies.multipolygons_with_multisegments)
+def test_multisegment_with_multipolygon(
+        multipolygon_with_multisegment: MultipolygonWithMultisegment
+) -> None:
+    multipolygon, multisegment = multipolygon_with_multisegment
+
+    result = intersection_length(multisegment, multipolygon)
+
+    assert result == to_linear_length(
+            intersect_multisegment_with_multipolygon(multisegment,
+                                                     multipolygon)
+    )
+
+
+@given(strategies.multisegments_pairs)
+def test_commutativity(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = intersection_length(first, second)
+
+    assert result == intersection_length(second, first)
@@ -0,0 +1,39 @@
+from hypothesis import given
+
+from clipping.measures import symmetric_difference_area
+from clipping.planar import (symmetric_subtract_multipolygons,
+                             symmetric_subtract_polygons)
+from tests.utils import (MultipolygonsPair,
+                         PolygonsPair,
+                         to_shaped_area)
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_polygons(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = symmetric_difference_area(first, second)
+
+    assert result == to_shaped_area(symmetric_subtract_polygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_multipolygons(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = symmetric_difference_area(first, second)
+
+    assert result == to_shaped_area(
+            symmetric_subtract_multipolygons(first, second)
+    )
+
+
+@given(strategies.multipolygons_pairs)
+def test_compact(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = symmetric_difference_area(first, second,
+                                       compact=True)
+
+    assert result == symmetric_difference_area(first, second)
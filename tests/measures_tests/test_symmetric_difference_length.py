@@ -0,0 +1,27 @@
+from hypothesis import given
+
+from clipping.measures import symmetric_difference_length
+from clipping.planar import symmetric_subtract_multisegments
+from tests.utils import (MultisegmentsPair,
+                         to_linear_length)
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_multisegments(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = symmetric_difference_length(first, second)
+
+    assert result == to_linear_length(
+            symmetric_subtract_multisegments(first, second)
+    )
+
+
+@given(strategies.multisegments_pairs)
+def test_commutativity(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = symmetric_difference_length(first, second)
+
+    assert result == symmetric_difference_length(second, first)
@@ -0,0 +1,48 @@
+from hypothesis import given
+
+from clipping.measures import (intersection_area,
+                               union_area)
+from clipping.planar import (unite_multipolygons,
+                             unite_polygons)
+from tests.utils import (MultipolygonsPair,
+                         PolygonsPair,
+                         to_shaped_area)
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_polygons(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = union_area(first, second)
+
+    assert result == to_shaped_area(unite_polygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_multipolygons(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = union_area(first, second)
+
+    assert result == to_shaped_area(unite_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_inclusion_exclusion(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = union_area(first, second)
+
+    assert result == (to_shaped_area(first) + to_shaped_area(second)
+                      - intersection_area(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_compact(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = union_area(first, second,
+                        compact=True)
+
+    assert result == union_area(first, second)
@@ -0,0 +1,25 @@
+from hypothesis import given
+
+from clipping.measures import union_length
+from clipping.planar import unite_multisegments
+from tests.utils import (MultisegmentsPair,
+                         to_linear_length)
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_multisegments(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = union_length(first, second)
+
+    assert result == to_linear_length(unite_multisegments(first, second))
+
+
+@given(strategies.multisegments_pairs)
+def test_commutativity(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    result = union_length(first, second)
+
+    assert result == union_length(second, first)
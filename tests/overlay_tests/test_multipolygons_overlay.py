@@ -0,0 +1,99 @@
+from hypothesis import given
+
+from clipping.overlay import MultipolygonsOverlay
+from clipping.planar import (intersect_multipolygons,
+                             subtract_multipolygons,
+                             symmetric_subtract_multipolygons,
+                             unite_multipolygons)
+from tests.utils import MultipolygonsPair
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_difference(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    result = overlay.difference()
+
+    assert result == subtract_multipolygons(first, second)
+
+
+@given(strategies.multipolygons_pairs)
+def test_intersection(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    result = overlay.intersection()
+
+    assert result == intersect_multipolygons(first, second)
+
+
+@given(strategies.multipolygons_pairs)
+def test_reversed_difference(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    result = overlay.reversed_difference()
+
+    assert result == subtract_multipolygons(second, first)
+
+
+@given(strategies.multipolygons_pairs)
+def test_symmetric_difference(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    result = overlay.symmetric_difference()
+
+    assert result == symmetric_subtract_multipolygons(first, second)
+
+
+@given(strategies.multipolygons_pairs)
+def test_union(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    result = overlay.union()
+
+    assert result == unite_multipolygons(first, second)
+
+
+@given(strategies.multipolygons_pairs)
+def test_all(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    union = overlay.union()
+    intersection = overlay.intersection()
+    difference = overlay.difference()
+    reversed_difference = overlay.reversed_difference()
+    symmetric_difference = overlay.symmetric_difference()
+
+    assert union == unite_multipolygons(first, second)
+    assert intersection == intersect_multipolygons(first, second)
+    assert difference == subtract_multipolygons(first, second)
+    assert reversed_difference == subtract_multipolygons(second, first)
+    assert symmetric_difference == symmetric_subtract_multipolygons(first,
+                                                                    second)
+
+
+@given(strategies.multipolygons_pairs)
+def test_repeated(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+    overlay = MultipolygonsOverlay(first, second)
+
+    intersection = overlay.intersection()
+    difference = overlay.difference()
+    symmetric_difference = overlay.symmetric_difference()
+    repeated_intersection = overlay.intersection()
+    union = overlay.union()
+    repeated_difference = overlay.difference()
+
+    assert intersection == repeated_intersection
+    assert difference == repeated_difference
+    assert intersection == intersect_multipolygons(first, second)
+    assert difference == subtract_multipolygons(first, second)
+    assert symmetric_difference == symmetric_subtract_multipolygons(first,
+                                                                    second)
+    assert union == unite_multipolygons(first, second)
@@ -0,0 +1,67 @@
+from typing import Tuple
+
+from ground.hints import Shaped
+from hypothesis import given
+
+from clipping.overlay import overlay_layers
+from clipping.planar import intersect_polygons
+from tests.utils import (EMPTY,
+                         MultipolygonsPair,
+                         are_compounds_similar,
+                         is_maybe_shaped)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_basic(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = list(overlay_layers(first.polygons, second.polygons))
+
+    assert all(is_maybe_shaped(geometry) and geometry is not EMPTY
+               for _, _, geometry in result)
+    assert sorted(result, key=to_polygons_ids) == result
+
+
+@given(strategies.multipolygons_pairs)
+def test_pairwise_intersections(multipolygons_pair: MultipolygonsPair
+                                ) -> None:
+    first, second = multipolygons_pair
+
+    result = list(overlay_layers(first.polygons, second.polygons))
+
+    geometries = {(first_id, second_id): geometry
+                  for first_id, second_id, geometry in result}
+    assert len(geometries) == len(result)
+    assert all(are_compounds_similar(geometries.get((first_id, second_id),
+                                                    EMPTY),
+                                     intersect_polygons(first_polygon,
+                                                        second_polygon))
+               for first_id, first_polygon in enumerate(first.polygons)
+               for second_id, second_polygon in enumerate(second.polygons))
+
+
+@given(strategies.multipolygons_pairs)
+def test_reversed(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = list(overlay_layers(first.polygons, second.polygons))
+
+    reversed_result = sorted(overlay_layers(second.polygons, first.polygons),
+                             key=to_reversed_polygons_ids)
+    assert len(result) == len(reversed_result)
+    assert all(to_polygons_ids(overlap)
+               == to_reversed_polygons_ids(reversed_overlap)
+               and are_compounds_similar(overlap[2], reversed_overlap[2])
+               for overlap, reversed_overlap in zip(result, reversed_result))
+
+
+def to_polygons_ids(overlap: Tuple[int, int, Shaped]) -> Tuple[int, int]:
+    first_id, second_id, _ = overlap
+    return first_id, second_id
+
+
+def to_reversed_polygons_ids(overlap: Tuple[int, int, Shaped]
+                             ) -> Tuple[int, int]:
+    first_id, second_id, _ = overlap
+    return second_id, first_id
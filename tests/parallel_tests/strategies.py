@@ -0,0 +1,74 @@
+from functools import partial
+from inspect import signature
+from typing import (Any,
+                    Callable,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.hints import (Contour,
+                          Multipolygon,
+                          Multisegment,
+                          Polygon,
+                          Scalar,
+                          Segment)
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from clipping import planar as clipping_planar
+from clipping.parallel import OPERATIONS_NAMES
+from tests.strategies import coordinates_strategies
+from tests.utils import (Strategy,
+                         to_pairs)
+
+polygons_pairs_lists = (coordinates_strategies.map(planar.polygons)
+                        .map(to_pairs)
+                        .flatmap(partial(strategies.lists, max_size=8)))
+operations_names = strategies.sampled_from(['intersect_polygons',
+                                            'subtract_polygons',
+                                            'symmetric_subtract_polygons',
+                                            'unite_polygons'])
+chunks_sizes = strategies.integers(1, 4)
+
+
+def to_multiregion(multipolygon: Multipolygon) -> List[Contour]:
+    return [polygon.border for polygon in multipolygon.polygons]
+
+
+def to_multiregions(coordinates: Strategy[Scalar]
+                    ) -> Strategy[List[Contour]]:
+    return planar.multipolygons(coordinates).map(to_multiregion)
+
+
+operands_factories = {Contour: planar.contours,
+                      Multipolygon: planar.multipolygons,
+                      Multisegment: planar.multisegments,
+                      Polygon: planar.polygons,
+                      Segment: planar.segments,
+                      Sequence[Contour]: to_multiregions}
+
+
+def to_operation_operands_pairs_lists(operation_name: str
+                                      ) -> Strategy[List[Tuple[Any, Any]]]:
+    first, second, *_ = signature(getattr(clipping_planar, operation_name)
+                                  ).parameters.values()
+    return coordinates_strategies.flatmap(partial(
+            to_operands_pairs_lists,
+            operands_factories[first.annotation],
+            operands_factories[second.annotation]
+    ))
+
+
+def to_operands_pairs_lists(first_factory: Callable[[Strategy[Scalar]],
+                                                    Strategy[Any]],
+                            second_factory: Callable[[Strategy[Scalar]],
+                                                     Strategy[Any]],
+                            coordinates: Strategy[Scalar]
+                            ) -> Strategy[List[Tuple[Any, Any]]]:
+    return strategies.lists(strategies.tuples(first_factory(coordinates),
+                                              second_factory(coordinates)),
+                            max_size=2)
+
+
+all_operations_names = sorted(OPERATIONS_NAMES)
+data_objects = strategies.data()
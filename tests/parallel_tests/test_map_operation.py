@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from unittest import mock
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import DataObject
+
+from clipping import (parallel,
+                      planar)
+from clipping.parallel import map_operation
+from tests.utils import (Multipolygon,
+                         PolygonsPair)
+from . import strategies
+
+
+@given(strategies.operations_names, strategies.polygons_pairs_lists,
+       strategies.chunks_sizes)
+def test_basic(operation_name: str,
+               polygons_pairs: List[PolygonsPair],
+               chunk_size: int) -> None:
+    result = list(map_operation(operation_name, polygons_pairs,
+                                chunk_size=chunk_size,
+                                max_workers=2))
+
+    operation = getattr(planar, operation_name)
+    assert result == [operation(first, second)
+                      for first, second in polygons_pairs]
+
+
+@pytest.mark.parametrize('operation_name',
+                         strategies.all_operations_names)
+@given(strategies.data_objects)
+def test_all_operations(operation_name: str, data: DataObject) -> None:
+    operands_pairs = data.draw(
+            strategies.to_operation_operands_pairs_lists(operation_name)
+    )
+
+    result = list(map_operation(operation_name, operands_pairs,
+                                max_workers=1))
+
+    operation = getattr(planar, operation_name)
+    assert result == [operation(first, second)
+                      for first, second in operands_pairs]
+
+
+@given(strategies.polygons_pairs_lists)
+def test_many_operations(polygons_pairs: List[PolygonsPair]) -> None:
+    multipolygons_pairs = [([Multipolygon([first])], [Multipolygon([second])])
+                           for first, second in polygons_pairs]
+
+    with pytest.raises(ValueError):
+        map_operation('intersect_many_multipolygons', multipolygons_pairs)
+    with pytest.raises(ValueError):
+        map_operation('subtract_many_multipolygons', multipolygons_pairs)
+    with pytest.raises(ValueError):
+        map_operation('unite_many_polygons', polygons_pairs)
+
+
+@given(strategies.polygons_pairs_lists)
+def test_unsupported_operation(polygons_pairs: List[PolygonsPair]) -> None:
+    with pytest.raises(ValueError):
+        map_operation('segments_to_multisegment', polygons_pairs)
+
+
+@given(strategies.operations_names, strategies.polygons_pairs_lists)
+def test_default_context(operation_name: str,
+                         polygons_pairs: List[PolygonsPair]) -> None:
+    with mock.patch.object(parallel, '_ProcessPoolExecutor',
+                           ThreadPoolExecutor), \
+            mock.patch.object(parallel, '_execute_chunk',
+                              wraps=parallel._execute_chunk) as execute_chunk:
+        result = list(map_operation(operation_name, polygons_pairs,
+                                    max_workers=1))
+
+    operation = getattr(planar, operation_name)
+    assert result == [operation(first, second)
+                      for first, second in polygons_pairs]
+    assert all(call[0][2] is None for call in execute_chunk.call_args_list)
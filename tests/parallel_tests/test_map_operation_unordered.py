@@ -0,0 +1,29 @@
+from typing import List
+
+import pytest
+from hypothesis import given
+
+from clipping import planar
+from clipping.parallel import map_operation_unordered
+from tests.utils import PolygonsPair
+from . import strategies
+
+
+@given(strategies.operations_names, strategies.polygons_pairs_lists,
+       strategies.chunks_sizes)
+def test_basic(operation_name: str,
+               polygons_pairs: List[PolygonsPair],
+               chunk_size: int) -> None:
+    result = dict(map_operation_unordered(operation_name, polygons_pairs,
+                                          chunk_size=chunk_size,
+                                          max_workers=2))
+
+    operation = getattr(planar, operation_name)
+    assert result == {index: operation(first, second)
+                      for index, (first, second) in enumerate(polygons_pairs)}
+
+
+@given(strategies.polygons_pairs_lists)
+def test_unsupported_operation(polygons_pairs: List[PolygonsPair]) -> None:
+    with pytest.raises(ValueError):
+        map_operation_unordered('segments_to_multisegment', polygons_pairs)
@@ -1,3 +1,5 @@
+from fractions import Fraction
+from functools import partial
 from itertools import combinations
 from typing import List
 
@@ -6,12 +8,20 @@ from hypothesis import strategies
 from hypothesis_geometry import planar
 
 from tests.strategies import coordinates_strategies
-from tests.utils import (MultisegmentWithSegment,
+from tests.utils import (Multipolygon,
+                         MultipolygonWithMultipolygons,
+                         MultipolygonsWithSnapTolerance,
+                         Multisegment,
+                         MultisegmentWithSegment,
+                         MultisegmentsWithSnapTolerance,
                          Point,
                          PolygonWithMultisegment,
                          PolygonWithSegment,
                          Segment,
                          Strategy,
+                         shift_multipolygon,
+                         to_features_scale,
+                         to_multipolygon_segments,
                          to_pairs,
                          to_triplets)
 
@@ -76,6 +86,78 @@ polygons_with_multisegments = coordinates_strategies.flatmap(
 polygons_strategies = coordinates_strategies.map(planar.polygons)
 polygons_pairs = polygons_strategies.flatmap(to_pairs)
 polygons_triplets = polygons_strategies.flatmap(to_triplets)
+polygons_lists = polygons_strategies.flatmap(partial(strategies.lists,
+                                                     max_size=5))
 regions_strategies = coordinates_strategies.map(planar.contours)
 regions_pairs = regions_strategies.flatmap(to_pairs)
 regions_triplets = regions_strategies.flatmap(to_triplets)
+multipolygons = coordinates_strategies.flatmap(planar.multipolygons)
+multipolygons_strategies = coordinates_strategies.map(planar.multipolygons)
+multipolygons_pairs = multipolygons_strategies.flatmap(to_pairs)
+multipolygons_triplets = multipolygons_strategies.flatmap(to_triplets)
+multipolygons_lists = multipolygons_strategies.flatmap(
+        partial(strategies.lists,
+                max_size=5))
+
+
+def coordinates_to_multipolygons_with_multipolygons(
+        coordinates: Strategy[Scalar]
+) -> Strategy[MultipolygonWithMultipolygons]:
+    multipolygons_strategy = planar.multipolygons(coordinates)
+    return strategies.tuples(multipolygons_strategy,
+                             strategies.lists(multipolygons_strategy,
+                                              max_size=5))
+
+
+multipolygons_with_multipolygons = coordinates_strategies.flatmap(
+        coordinates_to_multipolygons_with_multipolygons)
+strips_counts = strategies.integers(1, 8)
+
+
+def to_multipolygons_with_snap_tolerances(
+        coordinates: Strategy[Scalar]
+) -> Strategy[MultipolygonsWithSnapTolerance]:
+    return strategies.builds(to_shifted_multipolygon_with_snap_tolerance,
+                             planar.multipolygons(coordinates),
+                             shifts_ratios, shifts_slopes)
+
+
+def to_shifted_multipolygon_with_snap_tolerance(
+        multipolygon: Multipolygon,
+        shift_ratio: Fraction,
+        shift_slope: Fraction) -> MultipolygonsWithSnapTolerance:
+    # tolerance is less than the distance between distinct features
+    # of the multipolygon, while its shifted copy
+    # has vertices & edges within tolerance from the multipolygon's ones
+    snap_tolerance = to_features_scale(to_multipolygon_segments(multipolygon)
+                                       ) / 32
+    shift_x = snap_tolerance * shift_ratio
+    return (multipolygon,
+            shift_multipolygon(multipolygon, shift_x, shift_x * shift_slope),
+            snap_tolerance)
+
+
+def to_multisegments_with_snap_tolerances(
+        coordinates: Strategy[Scalar]
+) -> Strategy[MultisegmentsWithSnapTolerance]:
+    return (to_multipolygons_with_snap_tolerances(coordinates)
+            .map(to_multisegments_with_snap_tolerance))
+
+
+def to_multisegments_with_snap_tolerance(
+        multipolygons_with_snap_tolerance: MultipolygonsWithSnapTolerance
+) -> MultisegmentsWithSnapTolerance:
+    first, second, snap_tolerance = multipolygons_with_snap_tolerance
+    return (Multisegment(to_multipolygon_segments(first)),
+            Multisegment(to_multipolygon_segments(second)),
+            snap_tolerance)
+
+
+shifts_ratios = strategies.fractions(Fraction(1, 100), Fraction(1, 2),
+                                     max_denominator=100)
+shifts_slopes = strategies.fractions(-1, 1,
+                                     max_denominator=10)
+multipolygons_with_snap_tolerances = coordinates_strategies.flatmap(
+        to_multipolygons_with_snap_tolerances)
+multisegments_with_snap_tolerances = coordinates_strategies.flatmap(
+        to_multisegments_with_snap_tolerances)
@@ -0,0 +1,88 @@
+from typing import List
+
+import pytest
+from ground.hints import Shaped
+from hypothesis import given
+
+from clipping.planar import (intersect_many_multipolygons,
+                             intersect_multipolygons)
+from tests.utils import (EMPTY,
+                         Multipolygon,
+                         MultipolygonsPair,
+                         MultipolygonsTriplet,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_polygon,
+                         reverse_sequence)
+from . import strategies
+
+
+@given(strategies.multipolygons_lists)
+def test_basic(multipolygons: List[Multipolygon]) -> None:
+    result = intersect_many_multipolygons(multipolygons)
+
+    assert is_maybe_shaped(result)
+
+
+@given(strategies.multipolygons)
+def test_idempotence(multipolygon: Multipolygon) -> None:
+    result = intersect_many_multipolygons([multipolygon, multipolygon,
+                                           multipolygon])
+
+    assert are_compounds_similar(result, multipolygon)
+
+
+@given(strategies.multipolygons_lists)
+def test_permutations(multipolygons: List[Multipolygon]) -> None:
+    result = intersect_many_multipolygons(multipolygons)
+
+    assert are_compounds_similar(
+            result,
+            intersect_many_multipolygons(reverse_sequence(multipolygons))
+    )
+
+
+@given(strategies.multipolygons_pairs)
+def test_pairs(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = intersect_many_multipolygons([first, second])
+
+    assert are_compounds_similar(result,
+                                 intersect_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_triplets)
+def test_triplets(multipolygons_triplet: MultipolygonsTriplet) -> None:
+    first, second, third = multipolygons_triplet
+
+    result = intersect_many_multipolygons([first, second, third])
+
+    assert are_compounds_similar(
+            result,
+            intersect_shaped(intersect_multipolygons(first, second), third)
+    )
+
+
+@given(strategies.multipolygons_lists)
+def test_skip_list(multipolygons: List[Multipolygon]) -> None:
+    result = intersect_many_multipolygons(multipolygons,
+                                          sweep_line='skip_list')
+
+    assert result == intersect_many_multipolygons(multipolygons)
+
+
+@given(strategies.multipolygons_lists)
+def test_unsupported_sweep_line(multipolygons: List[Multipolygon]) -> None:
+    with pytest.raises(ValueError):
+        intersect_many_multipolygons(multipolygons,
+                                     sweep_line='splay')
+
+
+def intersect_shaped(first: Shaped, second: Multipolygon) -> Shaped:
+    return (first
+            if first is EMPTY
+            else intersect_multipolygons(Multipolygon([first])
+                                         if is_polygon(first)
+                                         else first,
+                                         second))
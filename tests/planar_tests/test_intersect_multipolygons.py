@@ -0,0 +1,92 @@
+import pytest
+from hypothesis import given
+
+from clipping.planar import intersect_multipolygons
+from tests.utils import (MultipolygonsPair,
+                         MultipolygonsWithSnapTolerance,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_shaped_valid,
+                         to_shaped_area,
+                         to_shaped_manhattan_perimeter)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_basic(multipolygons_pair: MultipolygonsPair,
+               strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = intersect_multipolygons(first, second,
+                                     strips_count=strips_count)
+
+    assert is_maybe_shaped(result)
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_strips(multipolygons_pair: MultipolygonsPair,
+                strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = intersect_multipolygons(first, second,
+                                     strips_count=strips_count)
+
+    assert are_compounds_similar(result,
+                                 intersect_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_invalid_strips_count(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        intersect_multipolygons(first, second,
+                                strips_count=0)
+
+
+@given(strategies.multipolygons_with_snap_tolerances)
+def test_snap_tolerance(
+        multipolygons_with_snap_tolerance: MultipolygonsWithSnapTolerance
+) -> None:
+    first, second, snap_tolerance = multipolygons_with_snap_tolerance
+
+    result = intersect_multipolygons(first, second,
+                                     snap_tolerance=snap_tolerance)
+
+    assert is_shaped_valid(result)
+    assert (abs(to_shaped_area(result)
+                - to_shaped_area(intersect_multipolygons(first, second)))
+            <= 2 * snap_tolerance * (to_shaped_manhattan_perimeter(first)
+                                     + to_shaped_manhattan_perimeter(second)))
+
+
+@given(strategies.multipolygons_pairs)
+def test_invalid_snap_tolerance(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        intersect_multipolygons(first, second,
+                                snap_tolerance=0)
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_skip_list(multipolygons_pair: MultipolygonsPair,
+                   strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = intersect_multipolygons(first, second,
+                                     strips_count=strips_count,
+                                     sweep_line='skip_list')
+
+    assert result == intersect_multipolygons(first, second,
+                                             strips_count=strips_count)
+
+
+@given(strategies.multipolygons_pairs)
+def test_unsupported_sweep_line(multipolygons_pair: MultipolygonsPair
+                                ) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        intersect_multipolygons(first, second,
+                                sweep_line='splay')
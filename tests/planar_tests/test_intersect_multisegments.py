@@ -1,3 +1,4 @@
+import pytest
 from ground.hints import Multisegment
 from hypothesis import given
 
@@ -6,13 +7,16 @@ from clipping.planar import (intersect_multisegments,
                              unite_multisegments)
 from tests.utils import (MultisegmentsPair,
                          MultisegmentsTriplet,
+                         MultisegmentsWithSnapTolerance,
                          are_compounds_similar,
                          are_multisegments_equivalent,
                          is_maybe_linear,
                          is_multisegment,
+                         is_non_shaped_valid,
                          reverse_compound_coordinates,
                          reverse_multisegment,
-                         reverse_multisegment_coordinates)
+                         reverse_multisegment_coordinates,
+                         to_linear_length)
 from . import strategies
 
 
@@ -103,3 +107,28 @@ def test_reversals(multisegments_pair: MultisegmentsPair) -> None:
             result, reverse_compound_coordinates(intersect_multisegments(
                     reverse_multisegment_coordinates(first),
                     reverse_multisegment_coordinates(second))))
+
+
+@given(strategies.multisegments_with_snap_tolerances)
+def test_snap_tolerance(
+        multisegments_with_snap_tolerance: MultisegmentsWithSnapTolerance
+) -> None:
+    first, second, snap_tolerance = multisegments_with_snap_tolerance
+
+    result = intersect_multisegments(first, second,
+                                     snap_tolerance=snap_tolerance)
+
+    assert is_non_shaped_valid(result)
+    assert (abs(to_linear_length(result)
+                - to_linear_length(intersect_multisegments(first, second)))
+            <= (3 * snap_tolerance * len(first.segments)
+                * len(second.segments)))
+
+
+@given(strategies.multisegments_pairs)
+def test_invalid_snap_tolerance(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    with pytest.raises(ValueError):
+        intersect_multisegments(first, second,
+                                snap_tolerance=0)
@@ -0,0 +1,36 @@
+from hypothesis import given
+
+from clipping.planar import (intersect_multipolygons,
+                             multipolygons_overlap)
+from tests.utils import (MultipolygonsPair,
+                         equivalence,
+                         is_empty)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_basic(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = multipolygons_overlap(first, second)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.multipolygons_pairs)
+def test_intersection(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = multipolygons_overlap(first, second)
+
+    assert equivalence(result,
+                       not is_empty(intersect_multipolygons(first, second)))
+
+
+@given(strategies.multipolygons_pairs)
+def test_commutativity(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = multipolygons_overlap(first, second)
+
+    assert result is multipolygons_overlap(second, first)
@@ -0,0 +1,47 @@
+from hypothesis import given
+
+from clipping.planar import (intersect_polygons,
+                             polygons_overlap)
+from tests.utils import (PolygonsPair,
+                         equivalence,
+                         is_empty,
+                         reverse_polygon_coordinates)
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_basic(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = polygons_overlap(first, second)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.polygons_pairs)
+def test_intersection(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = polygons_overlap(first, second)
+
+    assert equivalence(result, not is_empty(intersect_polygons(first,
+                                                               second)))
+
+
+@given(strategies.polygons_pairs)
+def test_commutativity(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = polygons_overlap(first, second)
+
+    assert result is polygons_overlap(second, first)
+
+
+@given(strategies.polygons_pairs)
+def test_reversals(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = polygons_overlap(first, second)
+
+    assert result is polygons_overlap(reverse_polygon_coordinates(first),
+                                      reverse_polygon_coordinates(second))
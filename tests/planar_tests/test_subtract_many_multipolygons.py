@@ -0,0 +1,110 @@
+from functools import reduce
+
+import pytest
+from ground.hints import Shaped
+from hypothesis import given
+
+from clipping.planar import (subtract_many_multipolygons,
+                             subtract_multipolygons)
+from tests.utils import (EMPTY,
+                         Multipolygon,
+                         MultipolygonWithMultipolygons,
+                         MultipolygonsPair,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_polygon,
+                         reverse_sequence)
+from . import strategies
+
+
+@given(strategies.multipolygons_with_multipolygons)
+def test_basic(multipolygon_with_multipolygons: MultipolygonWithMultipolygons
+               ) -> None:
+    minuend, subtrahends = multipolygon_with_multipolygons
+
+    result = subtract_many_multipolygons(minuend, subtrahends)
+
+    assert is_maybe_shaped(result)
+
+
+@given(strategies.multipolygons)
+def test_no_subtrahends(multipolygon: Multipolygon) -> None:
+    result = subtract_many_multipolygons(multipolygon, [])
+
+    assert are_compounds_similar(result, multipolygon)
+
+
+@given(strategies.multipolygons)
+def test_self_inverse(multipolygon: Multipolygon) -> None:
+    result = subtract_many_multipolygons(multipolygon,
+                                         [multipolygon, multipolygon])
+
+    assert result is EMPTY
+
+
+@given(strategies.multipolygons_pairs)
+def test_pairs(multipolygons_pair: MultipolygonsPair) -> None:
+    minuend, subtrahend = multipolygons_pair
+
+    result = subtract_many_multipolygons(minuend, [subtrahend])
+
+    assert are_compounds_similar(result,
+                                 subtract_multipolygons(minuend, subtrahend))
+
+
+@given(strategies.multipolygons_with_multipolygons)
+def test_sequential_subtraction(
+        multipolygon_with_multipolygons: MultipolygonWithMultipolygons
+) -> None:
+    minuend, subtrahends = multipolygon_with_multipolygons
+
+    result = subtract_many_multipolygons(minuend, subtrahends)
+
+    assert are_compounds_similar(result,
+                                 reduce(subtract_shaped, subtrahends, minuend))
+
+
+@given(strategies.multipolygons_with_multipolygons)
+def test_permutations(
+        multipolygon_with_multipolygons: MultipolygonWithMultipolygons
+) -> None:
+    minuend, subtrahends = multipolygon_with_multipolygons
+
+    result = subtract_many_multipolygons(minuend, subtrahends)
+
+    assert are_compounds_similar(
+            result,
+            subtract_many_multipolygons(minuend, reverse_sequence(subtrahends))
+    )
+
+
+@given(strategies.multipolygons_with_multipolygons)
+def test_skip_list(
+        multipolygon_with_multipolygons: MultipolygonWithMultipolygons
+) -> None:
+    minuend, subtrahends = multipolygon_with_multipolygons
+
+    result = subtract_many_multipolygons(minuend, subtrahends,
+                                         sweep_line='skip_list')
+
+    assert result == subtract_many_multipolygons(minuend, subtrahends)
+
+
+@given(strategies.multipolygons_with_multipolygons)
+def test_unsupported_sweep_line(
+        multipolygon_with_multipolygons: MultipolygonWithMultipolygons
+) -> None:
+    minuend, subtrahends = multipolygon_with_multipolygons
+
+    with pytest.raises(ValueError):
+        subtract_many_multipolygons(minuend, subtrahends,
+                                    sweep_line='splay')
+
+
+def subtract_shaped(minuend: Shaped, subtrahend: Multipolygon) -> Shaped:
+    return (minuend
+            if minuend is EMPTY
+            else subtract_multipolygons(Multipolygon([minuend])
+                                        if is_polygon(minuend)
+                                        else minuend,
+                                        subtrahend))
@@ -0,0 +1,92 @@
+from typing import List
+
+import pytest
+from ground.hints import Polygon
+from hypothesis import given
+
+from clipping.planar import (unite_many_polygons,
+                             unite_polygon_with_multipolygon,
+                             unite_polygons)
+from tests.utils import (PolygonsPair,
+                         PolygonsTriplet,
+                         are_compounds_similar,
+                         is_maybe_shaped,
+                         is_polygon,
+                         reverse_compound_coordinates,
+                         reverse_polygon_coordinates,
+                         reverse_sequence)
+from . import strategies
+
+
+@given(strategies.polygons_lists)
+def test_basic(polygons: List[Polygon]) -> None:
+    result = unite_many_polygons(polygons)
+
+    assert is_maybe_shaped(result)
+
+
+@given(strategies.polygons)
+def test_idempotence(polygon: Polygon) -> None:
+    result = unite_many_polygons([polygon, polygon])
+
+    assert are_compounds_similar(result, polygon)
+
+
+@given(strategies.polygons_lists)
+def test_permutations(polygons: List[Polygon]) -> None:
+    result = unite_many_polygons(polygons)
+
+    assert are_compounds_similar(
+            result, unite_many_polygons(reverse_sequence(polygons))
+    )
+
+
+@given(strategies.polygons_pairs)
+def test_pairs(polygons_pair: PolygonsPair) -> None:
+    first, second = polygons_pair
+
+    result = unite_many_polygons([first, second])
+
+    assert are_compounds_similar(result, unite_polygons(first, second))
+
+
+@given(strategies.polygons_triplets)
+def test_triplets(polygons_triplet: PolygonsTriplet) -> None:
+    first, second, third = polygons_triplet
+
+    result = unite_many_polygons([first, second, third])
+
+    first_second_union = unite_polygons(first, second)
+    assert are_compounds_similar(
+            result, (unite_polygons(first_second_union, third)
+                     if is_polygon(first_second_union)
+                     else unite_polygon_with_multipolygon(third,
+                                                          first_second_union))
+    )
+
+
+@given(strategies.polygons_lists)
+def test_reversals(polygons: List[Polygon]) -> None:
+    result = unite_many_polygons(polygons)
+
+    assert are_compounds_similar(
+            result, reverse_compound_coordinates(
+                    unite_many_polygons([reverse_polygon_coordinates(polygon)
+                                         for polygon in polygons])
+            )
+    )
+
+
+@given(strategies.polygons_lists)
+def test_skip_list(polygons: List[Polygon]) -> None:
+    result = unite_many_polygons(polygons,
+                                 sweep_line='skip_list')
+
+    assert result == unite_many_polygons(polygons)
+
+
+@given(strategies.polygons_lists)
+def test_unsupported_sweep_line(polygons: List[Polygon]) -> None:
+    with pytest.raises(ValueError):
+        unite_many_polygons(polygons,
+                            sweep_line='splay')
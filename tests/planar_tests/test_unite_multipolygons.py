@@ -0,0 +1,115 @@
+from fractions import Fraction
+
+import pytest
+from hypothesis import given
+
+from clipping.planar import unite_multipolygons
+from tests.utils import (Contour,
+                         Multipolygon,
+                         MultipolygonsPair,
+                         MultipolygonsWithSnapTolerance,
+                         Point,
+                         Polygon,
+                         are_compounds_similar,
+                         is_shaped,
+                         is_shaped_valid,
+                         to_shaped_area,
+                         to_shaped_manhattan_perimeter)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_basic(multipolygons_pair: MultipolygonsPair,
+               strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = unite_multipolygons(first, second,
+                                 strips_count=strips_count)
+
+    assert is_shaped(result)
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_strips(multipolygons_pair: MultipolygonsPair,
+                strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = unite_multipolygons(first, second,
+                                 strips_count=strips_count)
+
+    assert are_compounds_similar(result, unite_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_pairs)
+def test_invalid_strips_count(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        unite_multipolygons(first, second,
+                            strips_count=0)
+
+
+@given(strategies.multipolygons_with_snap_tolerances)
+def test_snap_tolerance(
+        multipolygons_with_snap_tolerance: MultipolygonsWithSnapTolerance
+) -> None:
+    first, second, snap_tolerance = multipolygons_with_snap_tolerance
+
+    result = unite_multipolygons(first, second,
+                                 snap_tolerance=snap_tolerance)
+
+    assert is_shaped_valid(result)
+    assert (abs(to_shaped_area(result)
+                - to_shaped_area(unite_multipolygons(first, second)))
+            <= 2 * snap_tolerance * (to_shaped_manhattan_perimeter(first)
+                                     + to_shaped_manhattan_perimeter(second)))
+
+
+@given(strategies.multipolygons_pairs)
+def test_invalid_snap_tolerance(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        unite_multipolygons(first, second,
+                            snap_tolerance=0)
+
+
+def test_snap_tolerance_near_touching() -> None:
+    # intersection lies near the left endpoint of the other segment,
+    # but snapping to it would make divided segment go backwards
+    step, snap_tolerance = Fraction(1, 10 ** 9), Fraction(1, 10 ** 6)
+    first = Multipolygon([Polygon(Contour([Point(0, 0), Point(10, 0),
+                                           Point(10, 10), Point(0, 10)]),
+                                  [])])
+    second = Multipolygon([Polygon(Contour([Point(step, -1), Point(5, -1),
+                                            Point(2 * step, 1)]),
+                                   [])])
+
+    result = unite_multipolygons(first, second,
+                                 snap_tolerance=snap_tolerance)
+
+    assert is_shaped_valid(result)
+    assert are_compounds_similar(result, unite_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_pairs, strategies.strips_counts)
+def test_skip_list(multipolygons_pair: MultipolygonsPair,
+                   strips_count: int) -> None:
+    first, second = multipolygons_pair
+
+    result = unite_multipolygons(first, second,
+                                 strips_count=strips_count,
+                                 sweep_line='skip_list')
+
+    assert result == unite_multipolygons(first, second,
+                                         strips_count=strips_count)
+
+
+@given(strategies.multipolygons_pairs)
+def test_unsupported_sweep_line(multipolygons_pair: MultipolygonsPair
+                                ) -> None:
+    first, second = multipolygons_pair
+
+    with pytest.raises(ValueError):
+        unite_multipolygons(first, second,
+                            sweep_line='splay')
@@ -1,18 +1,26 @@
-from ground.hints import Multisegment
+from fractions import Fraction
+
+import pytest
 from hypothesis import given
 
 from clipping.planar import (intersect_multisegments,
                              subtract_multisegments,
                              symmetric_subtract_multisegments,
                              unite_multisegments)
-from tests.utils import (MultisegmentsPair,
+from tests.utils import (Multisegment,
+                         MultisegmentsPair,
                          MultisegmentsTriplet,
+                         MultisegmentsWithSnapTolerance,
+                         Point,
+                         Segment,
                          are_compounds_similar,
                          are_multisegments_equivalent,
                          is_multisegment,
                          is_multisegment_valid,
+                         is_non_shaped_valid,
                          reverse_multisegment,
-                         reverse_multisegment_coordinates)
+                         reverse_multisegment_coordinates,
+                         to_linear_length)
 from . import strategies
 
 
@@ -129,3 +137,42 @@ def test_reversals(multisegments_pair: MultisegmentsPair) -> None:
             result, reverse_multisegment_coordinates(unite_multisegments(
                     reverse_multisegment_coordinates(first),
                     reverse_multisegment_coordinates(second))))
+
+
+@given(strategies.multisegments_with_snap_tolerances)
+def test_snap_tolerance(
+        multisegments_with_snap_tolerance: MultisegmentsWithSnapTolerance
+) -> None:
+    first, second, snap_tolerance = multisegments_with_snap_tolerance
+
+    result = unite_multisegments(first, second,
+                                 snap_tolerance=snap_tolerance)
+
+    assert is_non_shaped_valid(result)
+    assert (abs(to_linear_length(result)
+                - to_linear_length(unite_multisegments(first, second)))
+            <= (3 * snap_tolerance * len(first.segments)
+                * len(second.segments)))
+
+
+@given(strategies.multisegments_pairs)
+def test_invalid_snap_tolerance(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    with pytest.raises(ValueError):
+        unite_multisegments(first, second,
+                            snap_tolerance=0)
+
+
+def test_snap_tolerance_near_touching() -> None:
+    # intersection lies near the left endpoint of the other segment,
+    # but snapping to it would make divided segment go backwards
+    step, snap_tolerance = Fraction(1, 10 ** 9), Fraction(1, 10 ** 6)
+    first = Multisegment([Segment(Point(0, 0), Point(10, 0))])
+    second = Multisegment([Segment(Point(step, -1), Point(2 * step, 1))])
+
+    result = unite_multisegments(first, second,
+                                 snap_tolerance=snap_tolerance)
+
+    assert is_multisegment_valid(result)
+    assert are_compounds_similar(result, unite_multisegments(first, second))
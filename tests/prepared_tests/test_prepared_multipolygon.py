@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from hypothesis import given
+
+from clipping.planar import (intersect_multipolygons,
+                             intersect_multisegment_with_multipolygon,
+                             subtract_multipolygon_from_multisegment,
+                             subtract_multipolygons,
+                             symmetric_subtract_multipolygons,
+                             unite_multipolygons)
+from clipping.prepared import PreparedMultipolygon
+from tests.utils import (MultipolygonWithMultisegment,
+                         MultipolygonsPair)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_shaped_operations(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    prepared = PreparedMultipolygon(second)
+
+    assert all(operation(first, prepared) == operation(first, second)
+               for operation in [intersect_multipolygons,
+                                 subtract_multipolygons,
+                                 symmetric_subtract_multipolygons,
+                                 unite_multipolygons])
+
+
+@given(strategies.multipolygons_pairs)
+def test_minuend(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    prepared = PreparedMultipolygon(first)
+
+    assert (subtract_multipolygons(prepared, second)
+            == subtract_multipolygons(first, second))
+
+
+@given(strategies.multipolygons_with_multisegments)
+def test_mixed_operations(
+        multipolygon_with_multisegment: MultipolygonWithMultisegment
+) -> None:
+    multipolygon, multisegment = multipolygon_with_multisegment
+
+    prepared = PreparedMultipolygon(multipolygon)
+
+    assert all(operation(multisegment, prepared)
+               == operation(multisegment, multipolygon)
+               for operation in [intersect_multisegment_with_multipolygon,
+                                 subtract_multipolygon_from_multisegment])
+
+
+@given(strategies.multipolygons_pairs)
+def test_concurrent_readers(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    prepared = PreparedMultipolygon(second)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(subtract_multipolygons, [first] * 8,
+                                    [prepared] * 8))
+
+    assert all(result == subtract_multipolygons(first, second)
+               for result in results)
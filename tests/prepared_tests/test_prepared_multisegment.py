@@ -0,0 +1,32 @@
+from hypothesis import given
+
+from clipping.planar import (intersect_multisegments,
+                             subtract_multisegments,
+                             symmetric_subtract_multisegments,
+                             unite_multisegments)
+from clipping.prepared import PreparedMultisegment
+from tests.utils import MultisegmentsPair
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_linear_operations(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    prepared = PreparedMultisegment(second)
+
+    assert all(operation(first, prepared) == operation(first, second)
+               for operation in [intersect_multisegments,
+                                 subtract_multisegments,
+                                 symmetric_subtract_multisegments,
+                                 unite_multisegments])
+
+
+@given(strategies.multisegments_pairs)
+def test_minuend(multisegments_pair: MultisegmentsPair) -> None:
+    first, second = multisegments_pair
+
+    prepared = PreparedMultisegment(first)
+
+    assert (subtract_multisegments(prepared, second)
+            == subtract_multisegments(first, second))
@@ -0,0 +1,7 @@
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import to_pairs
+
+multipolygons_pairs = (coordinates_strategies.map(planar.multipolygons)
+                       .flatmap(to_pairs))
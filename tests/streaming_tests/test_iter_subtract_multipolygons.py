@@ -0,0 +1,28 @@
+from hypothesis import given
+
+from clipping.planar import subtract_multipolygons
+from clipping.streaming import iter_subtract_multipolygons
+from tests.utils import (MultipolygonsPair,
+                         is_polygon,
+                         to_shaped_polygons)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_basic(multipolygons_pair: MultipolygonsPair) -> None:
+    minuend, subtrahend = multipolygons_pair
+
+    result = iter_subtract_multipolygons(minuend, subtrahend)
+
+    assert all(is_polygon(element) for element in result)
+
+
+@given(strategies.multipolygons_pairs)
+def test_properties(multipolygons_pair: MultipolygonsPair) -> None:
+    minuend, subtrahend = multipolygons_pair
+
+    result = iter_subtract_multipolygons(minuend, subtrahend)
+
+    assert list(result) == to_shaped_polygons(
+            subtract_multipolygons(minuend, subtrahend)
+    )
@@ -0,0 +1,28 @@
+from hypothesis import given
+
+from clipping.planar import symmetric_subtract_multipolygons
+from clipping.streaming import iter_symmetric_subtract_multipolygons
+from tests.utils import (MultipolygonsPair,
+                         is_polygon,
+                         to_shaped_polygons)
+from . import strategies
+
+
+@given(strategies.multipolygons_pairs)
+def test_basic(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = iter_symmetric_subtract_multipolygons(first, second)
+
+    assert all(is_polygon(element) for element in result)
+
+
+@given(strategies.multipolygons_pairs)
+def test_properties(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    result = iter_symmetric_subtract_multipolygons(first, second)
+
+    assert list(result) == to_shaped_polygons(
+            symmetric_subtract_multipolygons(first, second)
+    )
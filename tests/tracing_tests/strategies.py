@@ -0,0 +1,9 @@
+from hypothesis_geometry import planar
+
+from tests.strategies import coordinates_strategies
+from tests.utils import to_pairs
+
+multipolygons_pairs = (coordinates_strategies.map(planar.multipolygons)
+                       .flatmap(to_pairs))
+multisegments_pairs = (coordinates_strategies.map(planar.multisegments)
+                       .flatmap(to_pairs))
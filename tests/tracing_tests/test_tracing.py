@@ -0,0 +1,54 @@
+from hypothesis import given
+
+from clipping.core.tracing import current_trace
+from clipping.planar import (intersect_multisegments,
+                             unite_multipolygons)
+from clipping.tracing import (Trace,
+                              tracing)
+from tests.utils import (MultipolygonsPair,
+                         MultisegmentsPair)
+from . import strategies
+
+
+def test_disabled() -> None:
+    assert current_trace() is None
+
+
+def test_nested() -> None:
+    with tracing() as outer:
+        with tracing() as inner:
+            assert current_trace() is inner
+
+        assert current_trace() is outer
+
+    assert isinstance(outer, Trace)
+    assert current_trace() is None
+
+
+@given(strategies.multipolygons_pairs)
+def test_unite_multipolygons(multipolygons_pair: MultipolygonsPair) -> None:
+    first, second = multipolygons_pair
+
+    with tracing() as trace:
+        result = unite_multipolygons(first, second)
+
+    assert result == unite_multipolygons(first, second)
+    assert trace.events_popped == trace.events_pushed
+    assert trace.events_pushed >= 2 * trace.divisions
+    assert trace.bounding_survivors <= trace.bounding_candidates
+    assert trace.sweep_line_max_size <= trace.events_popped
+    assert sum(trace.phases_times.values()) <= trace.total_time
+
+
+@given(strategies.multisegments_pairs)
+def test_intersect_multisegments(multisegments_pair: MultisegmentsPair
+                                 ) -> None:
+    first, second = multisegments_pair
+
+    with tracing() as trace:
+        intersect_multisegments(first, second)
+
+    assert trace.events_popped <= trace.events_pushed
+    assert trace.events_pushed >= 2 * trace.divisions
+    assert trace.bounding_survivors <= trace.bounding_candidates
+    assert all(count > 0 for count in trace.relations.values())
@@ -1,7 +1,10 @@
+from fractions import Fraction
 from functools import singledispatch
+from math import sqrt
 from typing import (Any,
                     Callable,
                     Iterable,
+                    List,
                     Sequence,
                     Tuple,
                     TypeVar,
@@ -11,7 +14,8 @@ from bentley_ottmann.planar import segments_cross_or_overlap
 from ground.base import (Orientation,
                          Relation,
                          get_context)
-from ground.hints import Shaped
+from ground.hints import (Scalar,
+                          Shaped)
 from hypothesis import strategies
 from hypothesis.strategies import SearchStrategy
 from orient.planar import multisegment_in_multisegment
@@ -40,8 +44,13 @@ BoxesTriplet = Tuple[Box, Box, Box]
 MultisegmentsPair = Tuple[Multisegment, Multisegment]
 MultisegmentsTriplet = Tuple[Multisegment, Multisegment, Multisegment]
 MultipolygonWithMultisegment = Tuple[Multipolygon, Multisegment]
+MultipolygonWithMultipolygons = Tuple[Multipolygon, List[Multipolygon]]
+MultipolygonsPair = Tuple[Multipolygon, Multipolygon]
+MultipolygonsTriplet = Tuple[Multipolygon, Multipolygon, Multipolygon]
+MultipolygonsWithSnapTolerance = Tuple[Multipolygon, Multipolygon, Scalar]
 MultiregionsPair = Tuple[Multiregion, Multiregion]
 MultisegmentWithSegment = Tuple[Multisegment, Segment]
+MultisegmentsWithSnapTolerance = Tuple[Multisegment, Multisegment, Scalar]
 PolygonWithMultisegment = Tuple[Polygon, Multisegment]
 PolygonWithSegment = Tuple[Polygon, Segment]
 RegionsPair = Tuple[Region, Region]
@@ -49,6 +58,7 @@ PolygonsPair = Tuple[Polygon, Polygon]
 PolygonsTriplet = Tuple[Polygon, Polygon, Polygon]
 SegmentsPair = Tuple[Segment, Segment]
 SegmentsTriplet = Tuple[Segment, Segment, Segment]
+WindowWithGeometries = Tuple[Shaped, List[Shaped]]
 segments_intersection = _context.segments_intersection
 segments_relation = _context.segments_relation
 
@@ -135,6 +145,53 @@ def is_multisegment_valid(multisegment: Multisegment) -> bool:
                                          context=_context)
 
 
+def is_shaped_valid(shaped: Shaped) -> bool:
+    segments = [segment
+                for polygon in to_shaped_polygons(shaped)
+                for contour in to_polygon_contours(polygon)
+                for segment in to_contour_segments(contour)]
+    return (all(segment.start != segment.end for segment in segments)
+            and not segments_cross_or_overlap(segments,
+                                              context=_context))
+
+
+def shift_multipolygon(multipolygon: Multipolygon,
+                       step_x: Scalar,
+                       step_y: Scalar) -> Multipolygon:
+    return Multipolygon([Polygon(shift_contour(polygon.border, step_x, step_y),
+                                 [shift_contour(hole, step_x, step_y)
+                                  for hole in polygon.holes])
+                         for polygon in multipolygon.polygons])
+
+
+def shift_contour(contour: Contour, step_x: Scalar, step_y: Scalar
+                  ) -> Contour:
+    return Contour([Point(vertex.x + step_x, vertex.y + step_y)
+                    for vertex in contour.vertices])
+
+
+def to_features_scale(segments: Sequence[Segment]) -> Fraction:
+    """
+    Returns lower bound of distances between endpoints of segments
+    and segments which they do not belong to.
+    """
+    return Fraction(sqrt(min(
+            _context.segment_point_squared_distance(segment, point)
+            for point in {endpoint
+                          for segment in segments
+                          for endpoint in (segment.start, segment.end)}
+            for segment in segments
+            if point != segment.start and point != segment.end
+    ))) / 2
+
+
+def to_multipolygon_segments(multipolygon: Multipolygon) -> List[Segment]:
+    return [segment
+            for polygon in multipolygon.polygons
+            for contour in to_polygon_contours(polygon)
+            for segment in to_contour_segments(contour)]
+
+
 def normalize_multipolygon(multipolygon: Multipolygon) -> Multipolygon:
     polygons = [normalize_polygon(polygon)
                 for polygon in multipolygon.polygons]
@@ -437,3 +494,44 @@ def _to_counterclockwise_vertices(vertices: Sequence[Point]
 
 def _to_first_angle_orientation(vertices: Sequence[Point]) -> Orientation:
     return _context.angle_orientation(vertices[0], vertices[-1], vertices[1])
+
+
+def to_linear_length(linear: Union[Empty, Multisegment, Segment]) -> Scalar:
+    return (0
+            if is_empty(linear)
+            else (_context.segment_length(linear)
+                  if isinstance(linear, Segment)
+                  else _context.multisegment_length(linear)))
+
+
+def to_shaped_polygons(shaped: Union[Empty, Multipolygon, Polygon]
+                       ) -> List[Polygon]:
+    return ([]
+            if is_empty(shaped)
+            else (list(shaped.polygons)
+                  if isinstance(shaped, Multipolygon)
+                  else [shaped]))
+
+
+def to_shaped_area(shaped: Union[Empty, Multipolygon, Polygon]) -> Scalar:
+    return (0
+            if is_empty(shaped)
+            else sum(_to_polygon_area(polygon)
+                     for polygon in (shaped.polygons
+                                     if isinstance(shaped, Multipolygon)
+                                     else [shaped])))
+
+
+def to_shaped_manhattan_perimeter(shaped: Union[Empty, Multipolygon,
+                                                Polygon]) -> Scalar:
+    return sum(abs(segment.end.x - segment.start.x)
+               + abs(segment.end.y - segment.start.y)
+               for polygon in to_shaped_polygons(shaped)
+               for contour in to_polygon_contours(polygon)
+               for segment in to_contour_segments(contour))
+
+
+def _to_polygon_area(polygon: Polygon) -> Scalar:
+    return (abs(_context.region_signed_area(polygon.border))
+            - sum(abs(_context.region_signed_area(hole))
+                  for hole in polygon.holes))